@@ -3,6 +3,7 @@
 
 # Entry point for Buildozer build for Android/iOS
 
+import multiprocessing
 import sys
 import os
 
@@ -53,6 +54,7 @@ except Exception as e:
     print(f"Warning: Failed to import labels: {e}")
 
 if __name__ == '__main__':
+    multiprocessing.freeze_support()
     print("=== TLUM APP STARTING ===")
     print(f"Python version: {sys.version}")
     print(f"Current directory: {os.getcwd()}")
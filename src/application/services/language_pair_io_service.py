@@ -3,13 +3,17 @@
 
 import json
 import os
-from typing import Dict, Optional
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 
 from infrastructure.persistence.sqlite_vocabulary_repository import SQLiteVocabularyRepository
 from infrastructure.persistence.sqlite_config_repository import SQLiteConfigRepository
 from domain.entities.vocabulary_item import VocabularyItem
+from lib.json_stream import JsonStreamReader
 
 EXPORT_FORMAT_VERSION = '1.0'
+IMPORT_BATCH_SIZE = 1000
+
+_VALUE_ENCODER = json.JSONEncoder(ensure_ascii=False)
 
 
 class LanguagePairIOService:
@@ -87,60 +91,76 @@ class LanguagePairIOService:
             for cat in categories_raw
         ]
 
-        vocabulary_items = self._vocab_repo.load_by_language_pair(locale_from, locale_to)
-        vocabulary = [
-            {
-                'origin': item.origin,
-                'translation': item.translation,
-                'sound_path': item.sound,
-                'image_path': item.image,
-                'category': item.category,
-                'difficulty_level': 1,
-            }
-            for item in vocabulary_items
-        ]
-
-        payload: Dict = {
+        header: Dict = {
             'version': EXPORT_FORMAT_VERSION,
             'locale_from': locale_from,
             'locale_to': locale_to,
             'name': pair.get('text', f'{locale_from}-{locale_to}'),
             'logo_path': pair.get('logo', ''),
             'categories': categories,
-            'vocabulary': vocabulary,
         }
 
         os.makedirs(os.path.dirname(file_path) if os.path.dirname(file_path) else '.', exist_ok=True)
+        count = 0
         with open(file_path, 'w', encoding='utf-8') as fh:
-            json.dump(payload, fh, ensure_ascii=False, indent=2)
-
-        return len(vocabulary)
+            # Same layout as json.dump(payload, indent=2), with the vocabulary
+            # array written one entry at a time
+            fh.write(json.dumps(header, ensure_ascii=False, indent=2)[:-2])
+            fh.write(',\n  "vocabulary": [')
+            for item in self._vocab_repo.iter_by_language_pair(locale_from, locale_to):
+                entry = {
+                    'origin': item.origin,
+                    'translation': item.translation,
+                    'sound_path': item.sound,
+                    'image_path': item.image,
+                    'category': item.category,
+                    'difficulty_level': 1,
+                }
+                fh.write(',\n' if count else '\n')
+                fh.write(self._format_entry(entry))
+                count += 1
+            fh.write('\n  ]\n}' if count else ']\n}')
+
+        return count
 
     # ------------------------------------------------------------------
     # Import
     # ------------------------------------------------------------------
 
-    def import_language_pair(self, file_path: str, merge: bool = False) -> Dict:
+    def import_language_pair(
+        self,
+        file_path: str,
+        merge: bool = False,
+        batch_size: int = IMPORT_BATCH_SIZE,
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> Dict:
         """
         Import a language pair from a JSON file exported by this service.
 
+        The file is read twice without loading it whole: a first pass collects
+        the header, validates and counts the vocabulary, and a second pass
+        saves it in batches. All batches share one transaction, so a failed
+        import leaves the previous vocabulary in place.
+
         Args:
-            file_path: Path to the JSON file
-            merge:     If True, append vocabulary instead of replacing existing items.
-                       Categories are always upserted.
+            file_path:  Path to the JSON file
+            merge:      If True, append vocabulary instead of replacing existing items.
+                        Categories are always upserted.
+            batch_size: Number of vocabulary items saved per statement batch
+            progress:   Optional callback receiving (items imported, total items)
+                        after every batch
 
         Returns:
             Dict with keys: locale_from, locale_to, categories_imported, vocabulary_imported
 
         Raises:
-            ValueError: If the file format is invalid
+            ValueError: If the file format is invalid or a word repeats in a category
             FileNotFoundError: If the file does not exist
         """
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"Import file not found: {file_path}")
 
-        with open(file_path, 'r', encoding='utf-8') as fh:
-            payload = json.load(fh)
+        payload, total = self._scan_import_file(file_path)
 
         self._validate_payload(payload)
 
@@ -160,36 +180,105 @@ class LanguagePairIOService:
             self._upsert_category(locale_from, locale_to, cat)
 
         # Import vocabulary
-        vocab_items = [
-            VocabularyItem(
-                origin=v['origin'],
-                translation=v['translation'],
-                sound=v.get('sound_path'),
-                image=v.get('image_path'),
-                category=v.get('category'),
-            )
-            for v in payload.get('vocabulary', [])
-        ]
-
-        if vocab_items:
-            self._vocab_repo.save_vocabulary_items(
-                locale_from,
-                locale_to,
-                vocab_items,
-                replace=not merge,
-            )
+        imported = 0
+        if total:
+            with self._vocab_repo.transaction():
+                replace = not merge
+                for batch in self._read_vocabulary_batches(file_path, batch_size):
+                    self._vocab_repo.save_vocabulary_items(
+                        locale_from,
+                        locale_to,
+                        batch,
+                        replace=replace,
+                        # Batches after the first of a replacing import only add to it
+                        check_existing=merge,
+                    )
+                    replace = False
+                    imported += len(batch)
+                    if progress:
+                        progress(imported, total)
 
         return {
             'locale_from': locale_from,
             'locale_to': locale_to,
             'categories_imported': len(categories),
-            'vocabulary_imported': len(vocab_items),
+            'vocabulary_imported': imported,
         }
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _format_entry(entry: Dict) -> str:
+        """
+        Format a flat vocabulary entry as json.dump(..., indent=2) would inside the array.
+        Only scalar values are encoded, which keeps to the C encoder.
+        """
+        fields = ',\n'.join(
+            f'      {_VALUE_ENCODER.encode(key)}: {_VALUE_ENCODER.encode(value)}'
+            for key, value in entry.items()
+        )
+        return f'    {{\n{fields}\n    }}'
+
+    def _scan_import_file(self, file_path: str) -> Tuple[Dict, int]:
+        """
+        Read every member except the vocabulary, validating and counting its entries.
+
+        Words repeating in a category are rejected here for the whole file, as
+        batches are only checked against each other in merge mode.
+
+        Returns:
+            Tuple of (payload without vocabulary, number of vocabulary entries)
+
+        Raises:
+            ValueError: If a word repeats in a category
+        """
+        payload: Dict = {}
+        total = 0
+        seen_keys = set()
+        with open(file_path, 'r', encoding='utf-8') as fh:
+            for key, value in JsonStreamReader(fh).members(stream_keys={'vocabulary'}):
+                if key == 'vocabulary':
+                    for entry in value:
+                        item = self._vocabulary_item(entry)
+                        item_key = ((item.category or '').strip().lower(), item.origin.strip().lower())
+                        if item_key in seen_keys:
+                            raise ValueError(
+                                f"Duplicate word in category '{item.category or ''}': {item.origin}"
+                            )
+                        seen_keys.add(item_key)
+                        total += 1
+                else:
+                    payload[key] = value
+        return payload, total
+
+    def _read_vocabulary_batches(self, file_path: str, batch_size: int) -> Iterator[List[VocabularyItem]]:
+        """Stream vocabulary entries of an import file as lists of at most batch_size items."""
+        with open(file_path, 'r', encoding='utf-8') as fh:
+            for key, value in JsonStreamReader(fh).members(stream_keys={'vocabulary'}):
+                if key != 'vocabulary':
+                    continue
+                batch: List[VocabularyItem] = []
+                for entry in value:
+                    batch.append(self._vocabulary_item(entry))
+                    if len(batch) >= batch_size:
+                        yield batch
+                        batch = []
+                if batch:
+                    yield batch
+
+    @staticmethod
+    def _vocabulary_item(entry: Dict) -> VocabularyItem:
+        """Build a vocabulary item from an import file entry."""
+        return VocabularyItem(
+            origin=entry['origin'],
+            translation=entry['translation'],
+            sound=entry.get('sound_path'),
+            image=entry.get('image_path'),
+            category=entry.get('category'),
+        )
+
     def _validate_payload(self, payload: Dict) -> None:
         required = {'locale_from', 'locale_to'}
         missing = required - set(payload.keys())
@@ -7,8 +7,10 @@ import requests
 import json
 import base64
 import platform
+import threading
 from abc import ABC, abstractmethod
-from typing import Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
 
 if platform.system() == 'Windows':
     from kivy.core.audio.audio_sdl2 import MusicSDL2
@@ -64,21 +66,86 @@ class KivyAudioPlaybackBackend(IAudioPlaybackBackend):
             self._current_sound = None
 
 
+class ITtsAudioCache(ABC):
+    """Store of generated speech clips keyed by (text, lang)."""
+
+    @abstractmethod
+    def get(self, text: str, lang: str) -> Optional[str]:
+        """Get the path of a cached clip, or None when it is not cached."""
+        pass
+
+    @abstractmethod
+    def put(self, text: str, lang: str, audio: bytes) -> Optional[str]:
+        """Store a clip and return its path, or None when it cannot be stored."""
+        pass
+
+    @abstractmethod
+    def stats(self) -> Dict:
+        """Get size and usage counters of the cache."""
+        pass
+
+
+class IAudioPack(ABC):
+    """Read-only archive of audio files, looked up by their name in the audio directory."""
+
+    @abstractmethod
+    def get_path(self, name: str) -> Optional[str]:
+        """Get a playable file of a packed clip, or None when it is not packed."""
+        pass
+
+
+class ITtsFailureTracker(ABC):
+    """Negative cache of failed TTS requests, keyed by (text, lang)."""
+
+    @abstractmethod
+    def allow(self, text: str, lang: str) -> bool:
+        """Check whether a request may be sent now rather than failing fast."""
+        pass
+
+    @abstractmethod
+    def record_success(self, text: str, lang: str) -> None:
+        """Record that speech was generated."""
+        pass
+
+    @abstractmethod
+    def record_failure(self, text: str, lang: str, network: bool = True) -> None:
+        """Record a failed request; `network` is False when the service answered without audio."""
+        pass
+
+
+# Called per prefetched item with (word, path or None, completed, total)
+PrefetchCallback = Callable[[str, Optional[str], int, int], None]
+
+
 class MediaService:
     """
     Application service for media playback and text-to-speech.
     Single Responsibility: Handle audio playback and TTS generation.
     """
 
+    TTS_URL = 'https://translate.google.com/_/TranslateWebserverUi/data/batchexecute'
+    TTS_TIMEOUT = 10
+    PREFETCH_WORKERS = 4
+
     def __init__(
         self,
         default_lang: str = 'en',
         audio_dir: str = 'assets/data/EN/audio/',
-        audio_playback_backend: Optional[IAudioPlaybackBackend] = None
+        audio_playback_backend: Optional[IAudioPlaybackBackend] = None,
+        http_session: Optional[requests.Session] = None,
+        tts_url: Optional[str] = None,
+        audio_cache: Optional[ITtsAudioCache] = None,
+        failure_tracker: Optional[ITtsFailureTracker] = None,
+        audio_pack: Optional[IAudioPack] = None
     ):
         self._lang = default_lang.lower()
         self._audio_dir = audio_dir
         self._audio_playback_backend = audio_playback_backend or KivyAudioPlaybackBackend()
+        self._http_session = http_session
+        self._tts_url = tts_url or self.TTS_URL
+        self._audio_cache = audio_cache
+        self._failure_tracker = failure_tracker
+        self._audio_pack = audio_pack
 
     def set_language(self, lang: str) -> None:
         """Set the language for TTS."""
@@ -92,6 +159,11 @@ class MediaService:
         """
         Get or generate audio file for a word.
 
+        Audio is looked up in the audio pack first, then in the audio
+        directory, then in the TTS cache, when these are configured. Newly
+        generated speech is stored in the TTS cache, or in the audio directory
+        without one.
+
         Args:
             word: The word to get audio for
             filename: Optional custom filename
@@ -99,19 +171,142 @@ class MediaService:
         Returns:
             Path to the audio file or None if failed
         """
-        if not filename or not filename.strip():
-            filename = f"{word}.mp3"
+        return self._local_audio_file(word, filename) or self._create_audio_file(word, self._audio_path(word, filename))
 
-        filepath = os.path.join(self._audio_dir, filename)
+    def prefetch_audio_files(
+        self,
+        items: Iterable[Tuple[str, Optional[str]]],
+        on_item: Optional[PrefetchCallback] = None,
+        max_workers: Optional[int] = None
+    ) -> Future:
+        """
+        Get or generate audio files of many words concurrently, e.g. a study set.
 
-        # Regenerate when file is missing or empty/corrupted.
-        if (not os.path.exists(filepath)) or os.path.getsize(filepath) == 0:
-            self._generate_tts_audio(word, filepath)
+        Files already on disk are reported right away on the calling thread.
+        Missing ones are generated in the background by a bounded pool of
+        threads sharing one keep-alive HTTP session; words that map to the same
+        file are generated once.
 
+        Args:
+            items: (word, filename) pairs; filename may be None as in get_audio_file
+            on_item: Optional callback receiving (word, path or None, completed, total)
+                per item, called on worker threads for generated files
+            max_workers: Concurrent TTS requests (PREFETCH_WORKERS by default)
+
+        Returns:
+            Future of the paths in item order, None for items that failed
+        """
+        items = list(items)
+        result: Future = Future()
+        paths: List[Optional[str]] = [None] * len(items)
+        groups: Dict[str, List[int]] = {}
+        for index, (word, filename) in enumerate(items):
+            groups.setdefault(self._audio_path(word, filename), []).append(index)
+
+        lock = threading.Lock()
+        completed = [0]
+
+        def finish(filepath: str, path: Optional[str]) -> None:
+            for index in groups[filepath]:
+                paths[index] = path
+                with lock:
+                    completed[0] += 1
+                    done = completed[0]
+                if on_item:
+                    try:
+                        on_item(items[index][0], path, done, len(items))
+                    except Exception as e:
+                        print(f"[MediaService] Prefetch callback failed: {e}")
+                if done == len(items):
+                    result.set_result(paths)
+
+        missing = []
+        for filepath, indices in groups.items():
+            path = self._local_audio_file(*items[indices[0]])
+            if path:
+                finish(filepath, path)
+            else:
+                missing.append((items[indices[0]][0], filepath))
+        if not items:
+            result.set_result(paths)
+        if not missing:
+            return result
+
+        session = self._http_session
+        if session is None:
+            session = requests.Session()
+            result.add_done_callback(lambda _: session.close())
+
+        def generate(word: str, filepath: str) -> None:
+            path = None
+            try:
+                path = self._create_audio_file(word, filepath, session)
+            finally:
+                finish(filepath, path)
+
+        pool = ThreadPoolExecutor(
+            max_workers=min(max_workers or self.PREFETCH_WORKERS, len(missing)),
+            thread_name_prefix='tts-prefetch'
+        )
+        for word, filepath in missing:
+            pool.submit(generate, word, filepath)
+        # Queued downloads still run; the threads exit once the queue is empty
+        pool.shutdown(wait=False)
+        return result
+
+    def find_audio_file(self, word: str, filename: Optional[str] = None) -> Optional[str]:
+        """
+        Get an existing audio file for a word without generating it.
+
+        Args:
+            word: The word to get audio for
+            filename: Optional custom filename
+
+        Returns:
+            Path to the audio file or None if it is not available locally
+        """
+        return self._local_audio_file(word, filename)
+
+    def get_cache_stats(self) -> Optional[Dict]:
+        """Get size and usage counters of the TTS cache, or None without a cache."""
+        if self._audio_cache is None:
+            return None
+        return self._audio_cache.stats()
+
+    def _audio_name(self, word: str, filename: Optional[str]) -> str:
+        if not filename or not filename.strip():
+            filename = f"{word}.mp3"
+        return filename
+
+    def _audio_path(self, word: str, filename: Optional[str]) -> str:
+        return os.path.join(self._audio_dir, self._audio_name(word, filename))
+
+    def _local_audio_file(self, word: str, filename: Optional[str]) -> Optional[str]:
+        """Get packed audio, falling back to a file of the audio directory and then to the TTS cache."""
+        if self._audio_pack is not None:
+            path = self._audio_pack.get_path(self._audio_name(word, filename))
+            if path:
+                return path
+        filepath = self._audio_path(word, filename)
         if os.path.exists(filepath) and os.path.getsize(filepath) > 0:
             return filepath
+        if self._audio_cache is not None:
+            return self._audio_cache.get(word, self._lang)
         return None
 
+    def _create_audio_file(self, word: str, filepath: str, session: Optional[requests.Session] = None) -> Optional[str]:
+        """Generate speech into the TTS cache, or into `filepath` without a cache."""
+        if self._audio_cache is None:
+            self._generate_tts_audio(word, filepath, session)
+            if os.path.exists(filepath) and os.path.getsize(filepath) > 0:
+                return filepath
+            return None
+
+        audio = self._fetch_tts_audio(word, session)
+        if audio is None:
+            return None
+        return self._audio_cache.put(word, self._lang, audio)
+
     def play_audio(self, path: str) -> None:
         """
         Play an audio file.
@@ -136,18 +331,50 @@ class MediaService:
 
         Clock.schedule_once(_play, 0)
 
-    def _generate_tts_audio(self, word: str, filepath: str) -> None:
+    def _generate_tts_audio(self, word: str, filepath: str, session: Optional[requests.Session] = None) -> None:
         """
-        Generate TTS audio using Google Translate API.
+        Generate TTS audio into a file.
 
         Args:
             word: The word to generate audio for
             filepath: Path to save the audio file
+            session: HTTP session to reuse connections of (the injected one by default)
         """
+        audio = self._fetch_tts_audio(word, session)
+        if audio is None:
+            return
         try:
             # Ensure directory exists
             os.makedirs(os.path.dirname(filepath), exist_ok=True)
+            # Written under a temporary name so readers never see a partial file
+            partial_path = f"{filepath}.{threading.get_ident()}.part"
+            with open(partial_path, 'wb') as f:
+                f.write(audio)
+            os.replace(partial_path, filepath)
+        except OSError as e:
+            print(f"[MediaService] Error saving TTS audio: {e}")
+
+    def _fetch_tts_audio(self, word: str, session: Optional[requests.Session] = None) -> Optional[bytes]:
+        """
+        Generate TTS audio using Google Translate API.
 
+        With a failure tracker, words that failed recently and all words while
+        the service is considered unreachable fail fast without a request.
+
+        Args:
+            word: The word to generate audio for
+            session: HTTP session to reuse connections of (the injected one by default)
+
+        Returns:
+            Encoded audio or None if failed
+        """
+        lang = self._lang
+        tracker = self._failure_tracker
+        if tracker is not None and not tracker.allow(word, lang):
+            return None
+
+        network = True
+        try:
             data = {
                 'f.req': json.dumps([
                     [
@@ -155,7 +382,7 @@ class MediaService:
                             'jQ1olc',
                             json.dumps([
                                 word,
-                                self._lang,
+                                lang,
                                 None,
                                 json.dumps(None),
                             ]),
@@ -166,20 +393,24 @@ class MediaService:
                 ]),
             }
 
-            response = requests.post(
-                'https://translate.google.com/_/TranslateWebserverUi/data/batchexecute',
-                data=data,
-                timeout=10
-            )
+            http = session or self._http_session or requests
+            response = http.post(self._tts_url, data=data, timeout=self.TTS_TIMEOUT)
 
             if response.status_code == 200:
+                # The service is reachable; a failure from here on concerns this word only
+                network = False
                 match = re.search(r'//OE[^\\]+', response.text)
                 if match:
-                    with open(filepath, 'wb') as f:
-                        f.write(base64.b64decode(match.group(0)))
-                else:
-                    print(f"[MediaService] No audio data found for '{word}'")
+                    audio = base64.b64decode(match.group(0))
+                    if tracker is not None:
+                        tracker.record_success(word, lang)
+                    return audio
+                print(f"[MediaService] No audio data found for '{word}'")
             else:
                 print(f"[MediaService] HTTP error {response.status_code} for '{word}'")
         except Exception as e:
             print(f"[MediaService] Error generating TTS: {e}")
+
+        if tracker is not None:
+            tracker.record_failure(word, lang, network)
+        return None
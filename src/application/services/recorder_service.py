@@ -2,11 +2,17 @@
 # Use of this source code is governed by a CC BY-NC-ND 4.0 license that can be found in the LICENSE file.
 
 from abc import ABC, abstractmethod
+from typing import Any, Callable, Optional, Tuple
+
+BlockListener = Callable[[Any, int], None]
 
 
 class IRecorderController(ABC):
     """Interface for audio recording controllers."""
 
+    block_listener: Optional[BlockListener] = None
+    auto_stop_listener: Optional[Callable[[], None]] = None
+
     @abstractmethod
     def get_initial_status(self, status_label: str) -> str:
         """Get the initial recording status message."""
@@ -22,6 +28,42 @@ class IRecorderController(ABC):
         """Stop recording and return status message with file path."""
         pass
 
+    def warm_up(self) -> None:
+        """Load the audio backend ahead of the first status check or recording."""
+        pass
+
+    def set_block_listener(self, listener: Optional[BlockListener]) -> None:
+        """
+        Receive captured audio blocks while recording.
+
+        Controllers that cannot stream blocks never call the listener.
+
+        Args:
+            listener: Callback receiving (samples, sample_rate) per block, or None
+        """
+        self.block_listener = listener
+
+    def set_auto_stop_listener(self, listener: Optional[Callable[[], None]]) -> None:
+        """
+        Get notified when a recording stops by itself, e.g. after trailing
+        silence or at the duration limit.
+
+        Controllers that only stop on request never call the listener.
+
+        Args:
+            listener: Callback called on the recording thread, or None
+        """
+        self.auto_stop_listener = listener
+
+    def get_last_audio(self) -> Optional[Tuple[Any, int]]:
+        """
+        Get the PCM samples of the last recording.
+
+        Returns:
+            (samples, sample_rate), or None when the controller keeps no samples
+        """
+        return None
+
 
 class RecorderService:
     """
@@ -47,6 +89,22 @@ class RecorderService:
         self._is_recording = True
         return self._recorder.start_recording(status_label)
 
+    def warm_up(self) -> None:
+        """Load the recorder's audio backend, e.g. on a background thread at startup."""
+        self._recorder.warm_up()
+
+    def set_block_listener(self, listener: Optional[BlockListener]) -> None:
+        """Forward captured audio blocks of the next recordings to a listener."""
+        self._recorder.set_block_listener(listener)
+
+    def set_auto_stop_listener(self, listener: Optional[Callable[[], None]]) -> None:
+        """Get notified when the next recordings stop by themselves."""
+        self._recorder.set_auto_stop_listener(listener)
+
+    def get_last_audio(self) -> Optional[Tuple[Any, int]]:
+        """Get (samples, sample_rate) of the last recording, when the controller keeps them."""
+        return self._recorder.get_last_audio()
+
     def stop_recording(self, status_label: str = "Processing...") -> str:
         """
         Stop recording audio.
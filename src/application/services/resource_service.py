@@ -1,6 +1,8 @@
 # Copyright 2025 The terCAD team. All rights reserved.
 # Use of this source code is governed by a CC BY-NC-ND 4.0 license that can be found in the LICENSE file.
 
+from typing import Optional
+
 from domain.repositories.resource_repository import IResourceRepository
 from l18n.labels import labels
 
@@ -44,6 +46,10 @@ class ResourceService:
         """Get audio directory for a locale."""
         return self._repository.get_audio_dir(locale)
 
+    def get_audio_pack(self, locale: str) -> Optional[str]:
+        """Get the audio pack of a locale, if there is one."""
+        return self._repository.get_audio_pack(locale)
+
     def get_image_directory(self, locale: str) -> str:
         """Get image directory for a locale."""
         return self._repository.get_image_dir(locale)
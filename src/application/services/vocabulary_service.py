@@ -51,6 +51,10 @@ class VocabularyService:
         """Get the current study set."""
         return self._shuffled_items
 
+    def get_loaded_items(self) -> List[VocabularyItem]:
+        """Get every item of the loaded vocabulary (the whole category)."""
+        return self._current_items
+
     def mark_item_correct(self, item: VocabularyItem) -> None:
         """Mark an item as correctly answered (for profiling)."""
         if self._profiler:
@@ -60,3 +64,8 @@ class VocabularyService:
         """Mark an item as incorrectly answered (for profiling)."""
         if self._profiler:
             self._profiler.mark_negative(item)
+
+    def flush_progress(self) -> None:
+        """Persist buffered answers (e.g. when leaving a study screen)."""
+        if self._profiler:
+            self._profiler.flush()
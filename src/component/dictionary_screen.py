@@ -1,7 +1,12 @@
 # Copyright 2025 The terCAD team. All rights reserved.
 # Use of this source code is governed by a CC BY-NC-ND 4.0 license that can be found in the LICENSE file.
 
+from kivy.app import App
 from kivy.uix.screenmanager import Screen
 
 class DictionaryScreen(Screen):
-    pass
+    def on_leave(self, *args):
+        # Persist answers buffered by the profiler when the game is left
+        app = App.get_running_app()
+        if app and app._vocabulary_service:
+            app._vocabulary_service.flush_progress()
@@ -2,6 +2,7 @@
 # Use of this source code is governed by a CC BY-NC-ND 4.0 license that can be found in the LICENSE file.
 
 import os
+import threading
 from kivy.app import App
 from kivy.clock import Clock
 from kivy.properties import StringProperty, BooleanProperty
@@ -128,20 +129,31 @@ class LanguagePairImportScreen(Screen):
             return
         self.is_busy = True
         self.status_text = ""
-        Clock.schedule_once(lambda dt: self._run_import(), 0)
+        # Large packs take a while; import off the UI thread and report progress
+        threading.Thread(target=self._run_import, daemon=True).start()
 
     def _run_import(self):
         try:
-            result = _get_service().import_language_pair(self.file_path, merge=self.merge_import)
-            self.status_text = (
+            result = _get_service().import_language_pair(
+                self.file_path,
+                merge=self.merge_import,
+                progress=self._on_import_progress,
+            )
+            status_text = (
                 f"Imported {result['vocabulary_imported']} words, "
                 f"{result['categories_imported']} categories "
                 f"({result['locale_from']}-{result['locale_to']})"
             )
         except Exception as exc:
-            self.status_text = f"Import failed: {exc}"
-        finally:
-            self.is_busy = False
+            status_text = f"Import failed: {exc}"
+        Clock.schedule_once(lambda dt: self._finish_import(status_text), 0)
+
+    def _on_import_progress(self, imported: int, total: int):
+        Clock.schedule_once(lambda dt: setattr(self, 'status_text', f"Imported {imported} / {total} words..."), 0)
+
+    def _finish_import(self, status_text: str):
+        self.status_text = status_text
+        self.is_busy = False
 
     def go_back(self):
         App.get_running_app().next_screen("main_screen")
@@ -1,6 +1,8 @@
 # Copyright 2025 The terCAD team. All rights reserved.
 # Use of this source code is governed by a CC BY-NC-ND 4.0 license that can be found in the LICENSE file.
 
+import threading
+
 from component.harmonica_widget import HarmonicaWidget
 from kivy.app import App
 from kivy.uix.boxlayout import BoxLayout
@@ -15,6 +17,12 @@ class PhoneticsWidget(HarmonicaWidget):
         # Get services from DI container
         app = App.get_running_app()
         self._localization_service = app._container.localization_service()
+        # Audio file name of each word, as RecorderWidget resolves it
+        self._audio_names = {}
+        # Words of the load-time prefetch still being generated, and a word clicked meanwhile
+        self._audio_lock = threading.Lock()
+        self._loading_audio = set()
+        self._play_when_ready = None
 
     def add_row(self, layout, origin, trans):
         app = App.get_running_app()
@@ -44,10 +52,50 @@ class PhoneticsWidget(HarmonicaWidget):
         row.add_widget(Widget(size_hint_x=None, width=10))
         layout.add_widget(row)
 
+    def load_data(self):
+        super(PhoneticsWidget, self).load_data()
+        # Generate missing pronunciations while the list is being read
+        self._audio_names = {}
+        for item in self._vocabulary_items:
+            self._audio_names.setdefault(item.origin, item.sound if item.sound else item.origin + '.mp3')
+        with self._audio_lock:
+            self._loading_audio = set(self._audio_names)
+            self._play_when_ready = None
+        if self._audio_names:
+            app = App.get_running_app()
+            media_service = app._container.media_service(app.locale_to, app.get_audio_dir())
+            media_service.prefetch_audio_files(list(self._audio_names.items()), on_item=self._on_audio_loaded)
+
+    def _on_audio_loaded(self, word, file_path, completed, total):
+        with self._audio_lock:
+            self._loading_audio.discard(word)
+            play = file_path and word == self._play_when_ready
+            if play:
+                self._play_when_ready = None
+        if play:
+            app = App.get_running_app()
+            app._container.media_service(app.locale_to, app.get_audio_dir()).play_audio(file_path)
+
     def play_audio(self, instance):
         app = App.get_running_app()
         media_service = app._container.media_service(app.locale_to, app.get_audio_dir())
         word = getattr(instance, 'origin_value', '')
-        file_path = media_service.get_audio_file(word)
+        filename = self._audio_names.get(word)
+
+        file_path = media_service.find_audio_file(word, filename)
         if file_path:
             media_service.play_audio(file_path)
+            return
+        with self._audio_lock:
+            if word in self._loading_audio:
+                # Played once the load-time prefetch delivers it
+                self._play_when_ready = word
+                return
+
+        def on_item(_word, file_path, completed, total):
+            # play_audio schedules playback on the UI thread
+            if file_path:
+                media_service.play_audio(file_path)
+
+        # Generating a missing file must not block the UI thread
+        media_service.prefetch_audio_files([(word, filename)], on_item=on_item)
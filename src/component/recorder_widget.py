@@ -13,11 +13,15 @@ from kivy.uix.progressbar import ProgressBar
 from kivy.uix.scrollview import ScrollView
 from kivy.clock import Clock
 
+from domain.services.audio_comparator import ComparisonCancelled
+
 class MultilineLabel(Label):
     pass
 
 class RecorderWidget(BoxLayout):
     loading_widget = None
+    # Reference clips per warm-up job; comparisons queue behind at most one chunk
+    REFERENCE_CHUNK = 16
 
     def __init__(self, **kwargs):
         super(RecorderWidget, self).__init__(**kwargs)
@@ -25,7 +29,11 @@ class RecorderWidget(BoxLayout):
         app = App.get_running_app()
         self._recorder_service = app._container.recorder_service()
         self._localization_service = app._container.localization_service()
-        self._audio_comparator = app._container.audio_comparator()
+        # Resolved by the container's audio loading thread, see _on_audio_services_ready
+        self._audio_comparator = None
+        self._comparison_executor = None
+        # Reference clips already sent for feature warm-up
+        self._warmed_references = set()
         self._media_service = app._container.media_service(app.locale_to, app.get_audio_dir())
 
     def init_data(self, item):
@@ -42,21 +50,29 @@ class RecorderWidget(BoxLayout):
         self._stop_in_progress = False
         self._record_thread = None
         self._stop_thread = None
+        self._comparison_stream = None
+        self._comparison_job = None
         self._comparison_animation_event = None
         self._comparison_animation_direction = 1
-        self.audio_files = self.load_audio_files()
+        entries = self.load_audio_files()
+        self.audio_files = {path: sentence for path, sentence, _ in entries if path}
+        # Rows whose audio is still being generated, by sentence
+        self._pending_audio_buttons = {}
 
         main_layout = BoxLayout(orientation='vertical')
         scroll_view = ScrollView(do_scroll_x=False, do_scroll_y=True)
         list_layout = GridLayout(cols=1, size_hint_y=None, spacing=5, padding=[0, 0, 0, 5])
         list_layout.bind(minimum_height=list_layout.setter('height'))
 
-        for file_name, sentence in self.audio_files.items():
+        for file_name, sentence, _ in entries:
             row = BoxLayout(orientation='horizontal', size_hint_y=None, height=app.theme.md3_button_height + 8, spacing=8)
             row.add_widget(MultilineLabel(text=sentence))
             choose_button = Button(text=self._localization_service.translate('button_choose', app.locale), size_hint_x=0.2)
             choose_button.file_path = file_name
             choose_button.bind(on_release=self.choose_sentence)
+            if file_name is None:
+                choose_button.disabled = True
+                self._pending_audio_buttons.setdefault(sentence, []).append(choose_button)
             row.add_widget(choose_button)
             list_layout.add_widget(row)
 
@@ -70,8 +86,8 @@ class RecorderWidget(BoxLayout):
         self.record_button = Button(text=self._localization_service.translate('button_record', app.locale), on_press=self.toggle_recording)
         self.play_button = Button(text=self._localization_service.translate('button_play', app.locale), on_press=self.play_audio, disabled=True)
 
-        status = self._recorder_service.get_initial_status()
-        self.record_button.disabled = not status
+        # Enabled once the audio backend is loaded
+        self.record_button.disabled = True
 
         control_layout.add_widget(self.listen_button)
         main_layout.add_widget(self.status_label)
@@ -96,23 +112,100 @@ class RecorderWidget(BoxLayout):
         self.clear_widgets()
         self.add_widget(main_layout)
         self._render_comparison_rows([])
+        self._prefetch_missing_audio([(sentence, filename) for path, sentence, filename in entries if path is None])
+        app._container.load_audio_services(self._on_audio_services_ready)
+
+    def _on_audio_services_ready(self):
+        """Pick up the loaded audio services (called on the container's loading thread)."""
+        Clock.schedule_once(lambda dt: self._apply_audio_services(), 0)
+
+    def _apply_audio_services(self):
+        app = App.get_running_app()
+        self._audio_comparator = app._container.audio_comparator()
+        self._comparison_executor = app._container.comparison_executor()
+        if not self.recording:
+            self.record_button.disabled = not self._recorder_service.get_initial_status()
+        self._warm_up_references()
 
     def load_audio_files(self):
-        """Load audio files using vocabulary service."""
+        """
+        List the study set's sentences with their local audio files.
+
+        Returns:
+            (path, sentence, filename) per distinct audio file; path is None
+            when the audio still has to be generated
+        """
         app = App.get_running_app()
         media_service = app._container.media_service(app.locale_to, app.get_audio_dir())
 
-        audio_files = {}
+        entries = {}
         # Use app's vocabulary service or fall back to app.store
         vocabulary_items = app._vocabulary_service.get_current_study_set() if app._vocabulary_service else app.store
 
         for item in vocabulary_items:
             key = item.sound if item.sound else item.origin + '.mp3'
-            audio_files[media_service.get_audio_file(item.origin, key)] = item.origin
-            # TODO: Update loading status (not reflecting, just a freeze)
-            if (self.loading_widget and hasattr(self.loading_widget, 'status')):
+            path = media_service.find_audio_file(item.origin, key)
+            entries.setdefault(path or (item.origin, key), (path, item.origin, key))
+            if path and self.loading_widget and hasattr(self.loading_widget, 'status'):
                 self.loading_widget.status += 1
-        return audio_files
+        return list(entries.values())
+
+    def _prefetch_missing_audio(self, missing):
+        """Generate missing audio files in the background and enable their rows as they arrive."""
+        if not missing:
+            return
+
+        def on_item(sentence, path, completed, total):
+            Clock.schedule_once(lambda dt: self._on_audio_file_ready(sentence, path), 0)
+
+        app = App.get_running_app()
+        media_service = app._container.media_service(app.locale_to, app.get_audio_dir())
+        media_service.prefetch_audio_files(missing, on_item=on_item)
+
+    def _on_audio_file_ready(self, sentence, path):
+        buttons = self._pending_audio_buttons.pop(sentence, None)
+        if buttons is None:
+            # Row of an earlier study set
+            return
+        if self.loading_widget and hasattr(self.loading_widget, 'status'):
+            self.loading_widget.status += 1
+        if not path:
+            return
+        self.audio_files[path] = sentence
+        for button in buttons:
+            button.file_path = path
+            button.disabled = False
+
+    def _warm_up_references(self):
+        """Precompute reference audio features of the whole category once, in the comparison workers if any."""
+        if not self._audio_comparator:
+            return
+        app = App.get_running_app()
+        items = app._vocabulary_service.get_loaded_items() if app._vocabulary_service else app.store
+        paths = [
+            path for path in dict.fromkeys(self._media_service.find_audio_file(item.origin, item.sound) for item in items)
+            if path and path not in self._warmed_references
+        ]
+        if not paths:
+            return
+        self._warmed_references.update(paths)
+        if self._comparison_executor is not None:
+            self._prepare_references(self._comparison_executor, paths)
+        else:
+            # Mobile comparators have no worker processes
+            threading.Thread(target=self._audio_comparator.warm_up, args=(paths,), daemon=True).start()
+
+    def _prepare_references(self, executor, paths):
+        """Send reference clips to the workers one chunk after another."""
+        chunk, rest = paths[:self.REFERENCE_CHUNK], paths[self.REFERENCE_CHUNK:]
+        try:
+            future = executor.prepare_references(chunk)
+        except RuntimeError as e:
+            # Executor shut down with the app
+            print(f"Warning: Reference warm-up stopped: {e}")
+            return
+        if rest:
+            future.add_done_callback(lambda done: None if done.cancelled() else self._prepare_references(executor, rest))
 
     def choose_sentence(self, instance):
         self.listen_button.disabled = False
@@ -125,6 +218,7 @@ class RecorderWidget(BoxLayout):
         if not self.recording:
             self.recording = True
             self._last_recorded_path = None
+            self._cancel_comparison()
             self.status_label.text = self._localization_service.translate('status_recording', app.locale)
             self.record_button.text = self._localization_service.translate('button_stop_recording', app.locale)
             self.play_button.disabled = True
@@ -144,6 +238,8 @@ class RecorderWidget(BoxLayout):
             self._stop_thread.start()
 
     def record_audio(self):
+        self._open_comparison_stream()
+        self._recorder_service.set_auto_stop_listener(self._on_recording_auto_stopped)
         path = self._recorder_service.start_recording()
         if path:
             self._last_recorded_path = path
@@ -155,8 +251,21 @@ class RecorderWidget(BoxLayout):
             self.recording = False
             self._set_recording_failed_ui(app.locale)
 
+    def _open_comparison_stream(self):
+        """Compare against the selected sentence while recording, where the platform streams audio."""
+        stream = None
+        original_path = getattr(self.listen_button, 'file_path', None)
+        if original_path and self._audio_comparator and self._audio_comparator.is_available():
+            stream = self._audio_comparator.start_stream(original_path, getattr(self, 'selected_sentence', ''))
+        self._comparison_stream = (original_path, stream) if stream else None
+        self._recorder_service.set_block_listener(stream.feed if stream else None)
+
+    def _on_recording_auto_stopped(self):
+        """Finish a recording the recorder ended by itself (called on the recording thread)."""
+        Clock.schedule_once(lambda dt: self._trigger_auto_stop(), 0)
+
     def _trigger_auto_stop(self):
-        """Auto-stop recording when max duration is reached."""
+        """Auto-stop recording when max duration is reached or the recorder stopped on silence."""
         if not self.recording or self._stop_in_progress:
             return
 
@@ -210,12 +319,15 @@ class RecorderWidget(BoxLayout):
             return
 
         try:
-            self._start_comparison_animation('status_comparison_processing')
-            self.comparison_result = self._audio_comparator.compare_audio(
-                original_path,
-                recorded_path,
-                getattr(self, 'selected_sentence', '')
-            )
+            stream, self._comparison_stream = self._comparison_stream, None
+            self._recorder_service.set_block_listener(None)
+            # The sentence may have been changed while recording
+            self.comparison_result = stream[1].finish() if stream and stream[0] == original_path else None
+            if self.comparison_result is None:
+                self.comparison_result = self._run_comparison(original_path, recorded_path)
+            if self.comparison_result is None:
+                # Superseded by a newer recording, which owns the UI now
+                return
             score_values = [
                 item.get('score', self._deviation_to_score(item.get('deviation', 100.0)))
                 for item in self.comparison_result
@@ -241,6 +353,46 @@ class RecorderWidget(BoxLayout):
             self._stop_comparison_animation(completed=False)
             self._render_comparison_rows([])
 
+    def _run_comparison(self, original_path, recorded_path):
+        """Compare the saved files, in a worker process when available; None if cancelled."""
+        sentence = getattr(self, 'selected_sentence', '')
+        # Samples still in memory spare decoding the file that was just encoded
+        recorded_audio = self._recorder_service.get_last_audio() if recorded_path == self._last_recorded_path else None
+        if self._comparison_executor is None:
+            self._start_comparison_animation('status_comparison_processing')
+            return self._audio_comparator.compare_audio(
+                original_path, recorded_path, sentence, recorded_audio=recorded_audio
+            )
+
+        job = self._comparison_executor.submit(
+            original_path,
+            recorded_path,
+            sentence,
+            progress=self._on_comparison_progress,
+            recorded_audio=recorded_audio
+        )
+        self._comparison_job = job
+        try:
+            return job.result()
+        except ComparisonCancelled:
+            return None
+        finally:
+            if self._comparison_job is job:
+                self._comparison_job = None
+
+    def _on_comparison_progress(self, stage, fraction):
+        """Show the stage progress of the running comparison (called on the executor's listener thread)."""
+        if self._comparison_job is None:
+            return
+        status_key = 'status_comparison_preparing' if stage == 'reference' else 'status_comparison_processing'
+        self._set_comparison_progress(fraction * 100, status_key)
+
+    def _cancel_comparison(self):
+        """Cancel a comparison that is still running for a previous recording."""
+        job, self._comparison_job = self._comparison_job, None
+        if job is not None:
+            job.cancel()
+
     def _set_status(self, text):
         """Set status text on the main UI thread."""
         Clock.schedule_once(lambda dt: setattr(self.status_label, 'text', text), 0)
@@ -2,43 +2,76 @@
 # Use of this source code is governed by a CC BY-NC-ND 4.0 license that can be found in the LICENSE file.
 
 import os
+import threading
 import time
-try:
-    from pydub import AudioSegment
-    import sounddevice as sd
-    import soundfile as sf
-    import numpy as np
-    HAS_DESKTOP_AUDIO = True
-
-    # Check if PortAudio is actually available (not just imported)
-    try:
-        sd.query_devices()
-    except (OSError, RuntimeError) as e:
-        print(f"Warning: PortAudio library not found: {e}")
-        HAS_DESKTOP_AUDIO = False
-except (ImportError, OSError) as e:
-    # ImportError: library not installed
-    # OSError: library installed but PortAudio not found
-    print(f"Warning: Desktop audio libraries not available: {e}")
-    HAS_DESKTOP_AUDIO = False
-    AudioSegment = None
-    sd = None
-    sf = None
-    np = None
+from typing import Optional
 
 from kivy.app import App
 from application.services.recorder_service import IRecorderController
 
+# Loaded on first use by _load_desktop_audio(); importing them and probing
+# PortAudio is kept off the app startup path
+sd = None
+sf = None
+np = None
+HAS_DESKTOP_AUDIO = None
+_load_lock = threading.Lock()
+
+
+def _load_desktop_audio() -> bool:
+    """Import the desktop audio libraries and check that PortAudio works (once)."""
+    global sd, sf, np, HAS_DESKTOP_AUDIO
+    with _load_lock:
+        if HAS_DESKTOP_AUDIO is not None:
+            return HAS_DESKTOP_AUDIO
+        try:
+            import sounddevice
+            import soundfile
+            import numpy
+        except (ImportError, OSError) as e:
+            # ImportError: library not installed
+            # OSError: library installed but PortAudio not found
+            print(f"Warning: Desktop audio libraries not available: {e}")
+            HAS_DESKTOP_AUDIO = False
+            return False
+
+        # Check if PortAudio is actually available (not just imported)
+        try:
+            sounddevice.query_devices()
+        except (OSError, RuntimeError) as e:
+            print(f"Warning: PortAudio library not found: {e}")
+            HAS_DESKTOP_AUDIO = False
+            return False
+
+        sd, sf, np = sounddevice, soundfile, numpy
+        HAS_DESKTOP_AUDIO = True
+        return True
+
 
 class RecorderControllerDesktop(IRecorderController):
     """
     Desktop implementation of IRecorderController.
     Uses sounddevice and soundfile for audio recording.
+
+    Captured blocks go through voice activity detection: recording stops by
+    itself after `auto_stop_silence` seconds without speech, and with
+    `trim_silence` the saved file keeps only the speech plus TRIM_PADDING.
+    The block listener then receives exactly the trimmed audio, with blocks
+    after a pause held back until speech resumes.
     """
 
-    def __init__(self):
+    SAMPLE_RATE = 44100
+    MAX_DURATION = 15  # seconds
+    BLOCK_SIZE = 1024
+    TRIM_PADDING = 0.15  # seconds
+
+    def __init__(self, auto_stop_silence: Optional[float] = 1.5, trim_silence: bool = True):
         self.recording = False
         self.audio_data = None
+        self.block_listener = None
+        self.auto_stop_listener = None
+        self.auto_stop_silence = auto_stop_silence
+        self.trim_silence = trim_silence
 
     def _set_status(self, status_label, message: str):
         if hasattr(status_label, 'text'):
@@ -46,59 +79,106 @@ class RecorderControllerDesktop(IRecorderController):
         else:
             print(message)
 
+    def warm_up(self):
+        _load_desktop_audio()
+
     def get_initial_status(self, status_label):
-        if not HAS_DESKTOP_AUDIO:
+        if not _load_desktop_audio():
             self._set_status(status_label, "[!] Desktop audio recording libraries are not available")
             return False
         return True
 
     def start_recording(self, status_label):
-        if not HAS_DESKTOP_AUDIO:
+        if not _load_desktop_audio():
             self._set_status(status_label, "[!] Audio recording not available - PortAudio library required")
             return None
 
         self.recording = True
+        self.audio_data = None
         app = App.get_running_app()
-        fs = 44100
-        recorded_file_wav = os.path.join(app.get_home_dir(), f'tmp_{int(time.time())}.wav')
+        fs = self.SAMPLE_RATE
         recorded_file_mp3 = os.path.join(app.get_home_dir(), f'tmp_{int(time.time())}.mp3')
-        max_duration = 15  # seconds
-        buffer = []
+        # Allocated once per recording; blocks are copied in place and listeners get views of it
+        buffer = np.empty((fs * self.MAX_DURATION, 1), dtype='int16')
+        position = 0
+        # Imported with numpy, after _load_desktop_audio
+        from infrastructure.audio.voice_activity import VoiceActivityDetector
+        vad = VoiceActivityDetector(fs) if self.auto_stop_silence or self.trim_silence else None
+        # End of the audio already passed to the block listener when trimming
+        forwarded = 0
 
         try:
             with sd.InputStream(samplerate=fs, channels=1, dtype='int16') as stream:
-                for _ in range(int(fs * max_duration / 1024)):
-                    if not self.recording:
+                while self.recording and position < len(buffer):
+                    frames = min(self.BLOCK_SIZE, len(buffer) - position)
+                    data, __ = stream.read(frames)
+                    block = buffer[position:position + len(data)]
+                    block[:] = data
+                    position += len(data)
+                    if vad is None:
+                        self._notify_block(block, fs)
+                        continue
+
+                    vad.process(block)
+                    if not self.trim_silence:
+                        self._notify_block(block, fs)
+                    elif vad.speech_detected and vad.speech_end > forwarded:
+                        forwarded = max(forwarded, vad.speech_bounds(self.TRIM_PADDING)[0])
+                        self._notify_block(buffer[forwarded:vad.speech_end], fs)
+                        forwarded = vad.speech_end
+                    if self.auto_stop_silence and vad.trailing_silence >= self.auto_stop_silence:
                         break
-                    data, __ = stream.read(1024)
-                    buffer.append(data)
         except (OSError, RuntimeError) as e:
             self._set_status(status_label, f"[!] Recording error: {e}")
             return None
 
-        if buffer:
-            self.audio_data = np.concatenate(buffer, axis=0)
-            # Save as WAV first
-            for _ in range(5):
-                try:
-                    if os.path.exists(recorded_file_wav):
-                        os.remove(recorded_file_wav)
-                    break
-                except PermissionError:
-                    time.sleep(0.2)
-
-            sf.write(recorded_file_wav, self.audio_data, fs)
-            # Convert mono WAV to stereo MP3 using pydub
-            audio = AudioSegment.from_wav(recorded_file_wav)
-            if audio.channels == 1:
-                audio = audio.set_channels(2)
-            audio.export(recorded_file_mp3, format="mp3")
-            # Optionally remove the temp wav file
-            try:
-                os.remove(recorded_file_wav)
-            except Exception:
-                pass
+        if self.recording:
+            # Stopped by silence or the duration limit rather than by stop_recording
+            self.recording = False
+            self._notify_auto_stop()
+
+        if position:
+            start, end = 0, position
+            if vad is not None and self.trim_silence:
+                start, end = vad.speech_bounds(self.TRIM_PADDING)
+                if end > max(forwarded, start):
+                    self._notify_block(buffer[max(forwarded, start):end], fs)
+            self.audio_data = buffer[start:end]
+            self._write_mp3(recorded_file_mp3, self.audio_data, fs)
         return recorded_file_mp3
 
+    def get_last_audio(self):
+        if self.audio_data is None:
+            return None
+        return self.audio_data, self.SAMPLE_RATE
+
+    def _write_mp3(self, path, samples, fs):
+        """Encode captured mono PCM straight to a stereo MP3 file."""
+        if 'MP3' in sf.available_formats():
+            sf.write(path, np.repeat(samples, 2, axis=1), fs, format='MP3')
+            return
+        # libsndfile before 1.1 cannot encode MP3; pydub hands the PCM to ffmpeg
+        from pydub import AudioSegment
+        audio = AudioSegment(data=samples.tobytes(), sample_width=2, frame_rate=fs, channels=1)
+        audio.set_channels(2).export(path, format="mp3")
+
+    def _notify_block(self, data, fs):
+        """Pass a captured block to the listener; a failing listener is dropped."""
+        if self.block_listener is None:
+            return
+        try:
+            self.block_listener(data, fs)
+        except Exception as e:
+            print(f"Warning: Audio block listener failed: {e}")
+            self.block_listener = None
+
+    def _notify_auto_stop(self):
+        if self.auto_stop_listener is None:
+            return
+        try:
+            self.auto_stop_listener()
+        except Exception as e:
+            print(f"Warning: Auto-stop listener failed: {e}")
+
     def stop_recording(self, status_label):
         self.recording = False
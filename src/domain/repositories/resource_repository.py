@@ -30,6 +30,11 @@ class IResourceRepository(ABC):
         """Get the audio directory for a specific locale."""
         pass
 
+    @abstractmethod
+    def get_audio_pack(self, locale: str) -> Optional[str]:
+        """Get the audio pack data file for a specific locale, if there is one."""
+        pass
+
     @abstractmethod
     def get_image_dir(self, locale: str) -> str:
         """Get the image directory for a specific locale."""
@@ -2,7 +2,41 @@
 # Use of this source code is governed by a CC BY-NC-ND 4.0 license that can be found in the LICENSE file.
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import Callable, List, Dict, Any, Iterable, Optional, Tuple
+
+
+class ComparisonCancelled(Exception):
+    """Raised when a running comparison was cancelled, e.g. superseded by a newer recording."""
+    pass
+
+
+class IComparisonStream(ABC):
+    """
+    Comparison against one reference that is fed while the user records.
+    Work done per block leaves little to do once the recording stops.
+    """
+
+    @abstractmethod
+    def feed(self, samples: Any, sample_rate: int) -> None:
+        """
+        Analyze a block of captured audio.
+
+        Args:
+            samples: Mono PCM block (int16 or float)
+            sample_rate: Capture sample rate in Hz
+        """
+        pass
+
+    @abstractmethod
+    def finish(self) -> Optional[List[Dict[str, Any]]]:
+        """
+        Complete the analysis of the fed audio.
+
+        Returns:
+            Comparison results as from compare_audio, or None when nothing
+            usable was fed and the recorded file has to be compared instead
+        """
+        pass
 
 
 class IAudioComparator(ABC):
@@ -16,7 +50,8 @@ class IAudioComparator(ABC):
         self,
         original_path: str,
         recorded_path: str,
-        reference_text: str = ""
+        reference_text: str = "",
+        recorded_audio: Optional[Tuple[Any, int]] = None
     ) -> List[Dict[str, Any]]:
         """
         Compare two audio files and return similarity analysis.
@@ -25,6 +60,8 @@ class IAudioComparator(ABC):
             original_path: Path to the reference audio file
             recorded_path: Path to the user's recorded audio file
             reference_text: Expected spoken text used for word-level alignment
+            recorded_audio: Optional (samples, sample_rate) of the recording,
+                used instead of decoding recorded_path where supported
 
         Returns:
             List of comparison results with scores and feedback
@@ -35,3 +72,37 @@ class IAudioComparator(ABC):
     def is_available(self) -> bool:
         """Check if audio comparison functionality is available."""
         pass
+
+    def preload(self) -> None:
+        """Load the analysis libraries ahead of the first comparison, e.g. on a background thread."""
+        pass
+
+    def warm_up(
+        self,
+        reference_paths: Iterable[str],
+        progress: Optional[Callable[[int, int], None]] = None
+    ) -> int:
+        """
+        Prepare reference audio ahead of comparisons.
+
+        Args:
+            reference_paths: Reference audio files, e.g. of a whole category
+            progress: Optional callback receiving (processed, total)
+
+        Returns:
+            Number of references prepared (0 when not supported)
+        """
+        return 0
+
+    def start_stream(self, original_path: str, reference_text: str = "") -> Optional[IComparisonStream]:
+        """
+        Start comparing a recording against a reference while it is captured.
+
+        Args:
+            original_path: Path to the reference audio file
+            reference_text: Expected spoken text used for word-level alignment
+
+        Returns:
+            Stream to feed captured blocks to, or None when not supported
+        """
+        return None
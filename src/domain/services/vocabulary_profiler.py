@@ -39,3 +39,7 @@ class IVocabularyProfiler(ABC):
             List of prioritized vocabulary items
         """
         pass
+
+    def flush(self) -> None:
+        """Persist buffered progress; implementations writing through need not override."""
+        pass
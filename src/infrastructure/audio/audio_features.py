@@ -0,0 +1,31 @@
+# Copyright 2026 The terCAD team. All rights reserved.
+# Use of this source code is governed by a CC BY-NC-ND 4.0 license that can be found in the LICENSE file.
+
+from dataclasses import dataclass
+from typing import Any, List, Optional
+
+
+@dataclass
+class DecodedAudio:
+    """Mono PCM buffer of one audio file, shared by every analysis step."""
+    samples: Any
+    sr: int
+
+    @property
+    def duration_ms(self) -> int:
+        return int(round(len(self.samples) * 1000 / self.sr))
+
+
+@dataclass
+class AudioFeatures:
+    """Framewise MFCCs of one recording and the timing needed to segment it."""
+    mfcc: Any
+    sr: int
+    hop_length: int
+    n_samples: int
+    # Non-silent (start_ms, end_ms) ranges; only computed for references
+    speech_segments: Optional[List[tuple]] = None
+
+    @property
+    def duration_ms(self) -> int:
+        return int(round(self.n_samples * 1000 / self.sr))
@@ -0,0 +1,231 @@
+# Copyright 2026 The terCAD team. All rights reserved.
+# Use of this source code is governed by a CC BY-NC-ND 4.0 license that can be found in the LICENSE file.
+
+import hashlib
+import json
+import mmap
+import os
+import shutil
+import tempfile
+import threading
+from typing import Dict, Optional, Tuple
+
+from application.services.media_service import IAudioPack
+
+# Audio pack: clips concatenated into one data file, plus `<data file>.idx`
+# with a JSON header line and one JSON line per clip:
+# {"name": "<file name as in the audio dir>", "text": "...", "offset": 0, "size": 1234}
+PACK_FORMAT = 'tlum-audio-pack'
+PACK_VERSION = 1
+
+
+def pack_index_path(pack_path: str) -> str:
+    """Get the index file of a pack data file."""
+    return f"{pack_path}.idx"
+
+
+def pack_entry_name(name: str) -> str:
+    """Normalize a file name relative to the audio directory into an index key."""
+    return os.path.normpath(name).replace('\\', '/')
+
+
+def read_pack_index(pack_path: str) -> Tuple[Dict[str, Tuple[int, int]], int]:
+    """
+    Read the index of a pack.
+
+    Entries after a line cut off by an interruption, or pointing past the
+    end of the data file, are ignored.
+
+    Args:
+        pack_path: Pack data file
+
+    Returns:
+        ({name: (offset, size)}, valid index size in bytes)
+
+    Raises:
+        ValueError: If the index belongs to another format or version
+    """
+    entries: Dict[str, Tuple[int, int]] = {}
+    valid_size = 0
+    data_size = os.path.getsize(pack_path) if os.path.exists(pack_path) else 0
+    with open(pack_index_path(pack_path), 'rb') as f:
+        header = f.readline()
+        try:
+            meta = json.loads(header)
+        except ValueError:
+            meta = None
+        if not isinstance(meta, dict) or meta.get('format') != PACK_FORMAT:
+            raise ValueError(f"Not an audio pack index: {pack_index_path(pack_path)}")
+        if meta.get('version') != PACK_VERSION:
+            raise ValueError(f"Unsupported audio pack version: {meta.get('version')}")
+        valid_size = len(header)
+        for line in f:
+            try:
+                record = json.loads(line)
+                offset, size = int(record['offset']), int(record['size'])
+                name = record['name']
+            except (ValueError, KeyError, TypeError):
+                break
+            if not line.endswith(b'\n') or offset + size > data_size:
+                break
+            entries[name] = (offset, size)
+            valid_size += len(line)
+    return entries, valid_size
+
+
+class AudioPackWriter:
+    """
+    Appends clips to an audio pack.
+
+    Each clip is written to the data file before its index line, so an index
+    entry never points at missing data. Opening an existing pack drops what
+    an interrupted run left past the last complete entry and continues
+    appending after it.
+    """
+
+    def __init__(self, pack_path: str):
+        self.pack_path = pack_path
+        self.index_path = pack_index_path(pack_path)
+        os.makedirs(os.path.dirname(os.path.abspath(pack_path)), exist_ok=True)
+
+        self.entries: Dict[str, Tuple[int, int]] = {}
+        if os.path.exists(self.index_path):
+            self.entries, valid_size = read_pack_index(pack_path)
+            with open(self.index_path, 'r+b') as f:
+                f.truncate(valid_size)
+        else:
+            with open(self.index_path, 'w', encoding='utf-8', newline='\n') as f:
+                f.write(json.dumps({'format': PACK_FORMAT, 'version': PACK_VERSION}) + '\n')
+
+        data_end = max((offset + size for offset, size in self.entries.values()), default=0)
+        self._data = open(pack_path, 'ab')
+        self._data.truncate(data_end)
+        self._data.seek(data_end)
+        self._index = open(self.index_path, 'a', encoding='utf-8', newline='\n')
+
+    def __contains__(self, name: str) -> bool:
+        return pack_entry_name(name) in self.entries
+
+    def add(self, name: str, text: str, audio: bytes) -> None:
+        """Append a clip stored under a file name of the audio directory."""
+        name = pack_entry_name(name)
+        offset = self._data.tell()
+        self._data.write(audio)
+        self._data.flush()
+        self._index.write(json.dumps(
+            {'name': name, 'text': text, 'offset': offset, 'size': len(audio)},
+            ensure_ascii=False
+        ) + '\n')
+        self._index.flush()
+        self.entries[name] = (offset, len(audio))
+
+    def close(self) -> None:
+        """Sync and close both files."""
+        for f in (self._data, self._index):
+            if f.closed:
+                continue
+            f.flush()
+            os.fsync(f.fileno())
+            f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class AudioPack(IAudioPack):
+    """
+    Read-only audio pack.
+
+    The index is loaded into memory once, so a lookup needs no file system
+    access. The data file is memory-mapped and clips are read as slices of
+    it. Playback backends need file paths, so `get_path` extracts a clip on
+    first use into a directory specific to this build of the pack; later
+    lookups return the extracted path without touching the disk. Directories
+    of earlier builds of the same pack are removed on open.
+    """
+
+    def __init__(self, pack_path: str, extract_root: Optional[str] = None):
+        self.pack_path = pack_path
+        self._entries, _ = read_pack_index(pack_path)
+        stat = os.stat(pack_path)
+        # <extract root>/<pack>/<build>, so rebuilds of one pack share a parent
+        pack_dir = os.path.join(
+            extract_root or os.path.join(tempfile.gettempdir(), 'tlum_audio_pack'),
+            hashlib.sha256(os.path.abspath(pack_path).encode('utf-8')).hexdigest()[:16]
+        )
+        build = hashlib.sha256(f"{stat.st_size}:{stat.st_mtime_ns}".encode('utf-8')).hexdigest()[:16]
+        self.extract_dir = os.path.join(pack_dir, build)
+        self._remove_stale_builds(pack_dir, build)
+        self._extracted: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._file = open(pack_path, 'rb')
+        # An empty pack cannot be mapped
+        self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if stat.st_size else b''
+
+    def __contains__(self, name: str) -> bool:
+        return pack_entry_name(name) in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def read(self, name: str) -> Optional[bytes]:
+        """Read a clip by its file name in the audio directory, or None if not packed."""
+        entry = self._entries.get(pack_entry_name(name))
+        if entry is None:
+            return None
+        offset, size = entry
+        return self._data[offset:offset + size]
+
+    def get_path(self, name: str) -> Optional[str]:
+        """Get a file holding a clip, extracting it on first use; None if not packed."""
+        name = pack_entry_name(name)
+        path = self._extracted.get(name)
+        if path is not None:
+            return path
+        if name not in self._entries or name.startswith('../') or os.path.isabs(name):
+            return None
+
+        path = os.path.join(self.extract_dir, name)
+        offset, size = self._entries[name]
+        try:
+            if not os.path.exists(path) or os.path.getsize(path) != size:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                partial_path = f"{path}.{threading.get_ident()}.part"
+                with open(partial_path, 'wb') as f:
+                    f.write(self._data[offset:offset + size])
+                os.replace(partial_path, path)
+        except OSError as e:
+            print(f"Warning: Could not extract packed audio {name}: {e}")
+            return None
+        with self._lock:
+            self._extracted[name] = path
+        return path
+
+    @staticmethod
+    def _remove_stale_builds(pack_dir: str, build: str) -> None:
+        """Remove files extracted from earlier builds of the pack."""
+        try:
+            stale = [name for name in os.listdir(pack_dir) if name != build]
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            print(f"Warning: Could not list extracted audio in {pack_dir}: {e}")
+            return
+        for name in stale:
+            path = os.path.join(pack_dir, name)
+            try:
+                if os.path.isdir(path):
+                    shutil.rmtree(path)
+                else:
+                    os.remove(path)
+            except OSError as e:
+                print(f"Warning: Could not remove extracted audio {path}: {e}")
+
+    def close(self) -> None:
+        """Unmap the data file; extracted files stay usable."""
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._file.close()
@@ -0,0 +1,157 @@
+# Copyright 2026 The terCAD team. All rights reserved.
+# Use of this source code is governed by a CC BY-NC-ND 4.0 license that can be found in the LICENSE file.
+
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from application.services.media_service import MediaService
+from domain.entities.vocabulary_item import VocabularyItem
+from infrastructure.audio.audio_pack import AudioPackWriter, pack_entry_name
+
+
+@dataclass
+class PackStats:
+    """Counters of a pack build."""
+    total: int = 0
+    skipped: int = 0
+    collected: int = 0
+    generated: int = 0
+    failed: int = 0
+    bytes: int = 0
+    started_at: float = field(default_factory=time.perf_counter)
+
+    @property
+    def processed(self) -> int:
+        return self.collected + self.generated + self.failed
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started_at
+
+    @property
+    def items_per_second(self) -> float:
+        return self.processed / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes / self.elapsed if self.elapsed > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'total': self.total,
+            'skipped': self.skipped,
+            'collected': self.collected,
+            'generated': self.generated,
+            'failed': self.failed,
+            'bytes': self.bytes,
+            'elapsed_s': round(self.elapsed, 3),
+            'items_per_s': round(self.items_per_second, 2),
+            'bytes_per_s': round(self.bytes_per_second)
+        }
+
+
+def pack_entries(items: Iterable[VocabularyItem]) -> List[Tuple[str, str]]:
+    """
+    List the distinct audio files of vocabulary items.
+
+    Args:
+        items: Vocabulary items of a language pair
+
+    Returns:
+        (file name in the audio dir, spoken text) pairs in item order
+    """
+    entries = {}
+    for item in items:
+        name = pack_entry_name(item.sound if item.sound and item.sound.strip() else f"{item.origin}.mp3")
+        entries.setdefault(name, item.origin)
+    return list(entries.items())
+
+
+class AudioPackBuilder:
+    """
+    Packs the audio of many words into an audio pack.
+
+    Files already in the media service's audio directory are collected as
+    they are; missing ones are generated through the media service's TTS
+    path, `workers` requests at a time. Words are handled in chunks and each
+    chunk is appended to the pack before the next one starts, so an
+    interruption loses at most one chunk and a new run skips packed words.
+    """
+
+    def __init__(
+        self,
+        media_service: MediaService,
+        writer: AudioPackWriter,
+        workers: int = MediaService.PREFETCH_WORKERS,
+        remove_generated: bool = False
+    ):
+        self._media_service = media_service
+        self._writer = writer
+        self._workers = max(workers, 1)
+        self._remove_generated = remove_generated
+
+    def build(
+        self,
+        entries: Iterable[Tuple[str, str]],
+        stats: Optional[PackStats] = None,
+        on_chunk: Optional[Callable[[PackStats], None]] = None
+    ) -> PackStats:
+        """
+        Add every entry that is not packed yet.
+
+        Args:
+            entries: (file name, spoken text) pairs, e.g. from pack_entries
+            stats: Counters to update (a new PackStats when omitted)
+            on_chunk: Optional callback receiving the counters after each chunk
+
+        Returns:
+            The counters
+        """
+        stats = stats or PackStats()
+        entries = list(entries)
+        pending = [(name, text) for name, text in entries if name not in self._writer]
+        stats.total = len(entries)
+        stats.skipped = len(entries) - len(pending)
+
+        chunk_size = self._workers * 4
+        for start in range(0, len(pending), chunk_size):
+            chunk = pending[start:start + chunk_size]
+            missing = []
+            for name, text in chunk:
+                path = self._media_service.find_audio_file(text, name)
+                if path is None:
+                    missing.append((name, text))
+                elif self._add(name, text, path, stats):
+                    stats.collected += 1
+                else:
+                    stats.failed += 1
+
+            if missing:
+                paths = self._media_service.prefetch_audio_files(
+                    [(text, name) for name, text in missing],
+                    max_workers=self._workers
+                ).result()
+                for (name, text), path in zip(missing, paths):
+                    if path and self._add(name, text, path, stats):
+                        stats.generated += 1
+                        if self._remove_generated:
+                            os.remove(path)
+                    else:
+                        stats.failed += 1
+
+            if on_chunk:
+                on_chunk(stats)
+        return stats
+
+    def _add(self, name: str, text: str, path: str, stats: PackStats) -> bool:
+        try:
+            with open(path, 'rb') as f:
+                audio = f.read()
+        except OSError as e:
+            print(f"Warning: Could not read audio file {path}: {e}")
+            return False
+        self._writer.add(name, text, audio)
+        stats.bytes += len(audio)
+        return True
@@ -0,0 +1,242 @@
+# Copyright 2026 The terCAD team. All rights reserved.
+# Use of this source code is governed by a CC BY-NC-ND 4.0 license that can be found in the LICENSE file.
+
+import csv
+import json
+import os
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from statistics import mean
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from domain.services.audio_comparator import ComparisonCancelled
+from infrastructure.audio.comparison_executor import ComparisonExecutor
+
+
+@dataclass
+class ScoringTask:
+    """One recording to score against its reference."""
+    id: str
+    reference: str
+    recording: str
+    text: str = ''
+
+
+@dataclass
+class BatchStats:
+    """Counters of a batch run."""
+    total: int = 0
+    skipped: int = 0
+    scored: int = 0
+    failed: int = 0
+    references_prepared: int = 0
+    started_at: float = field(default_factory=time.perf_counter)
+
+    @property
+    def processed(self) -> int:
+        return self.scored + self.failed
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started_at
+
+    @property
+    def items_per_second(self) -> float:
+        return self.processed / self.elapsed if self.elapsed > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'total': self.total,
+            'skipped': self.skipped,
+            'scored': self.scored,
+            'failed': self.failed,
+            'references_prepared': self.references_prepared,
+            'elapsed_s': round(self.elapsed, 3),
+            'items_per_s': round(self.items_per_second, 2)
+        }
+
+
+def read_manifest(path: str) -> List[ScoringTask]:
+    """
+    Read scoring tasks from a JSONL or CSV manifest.
+
+    Each entry has `reference`, `recording` and optional `text` and `id`
+    (defaults to the line number). Relative paths are resolved against the
+    manifest's directory.
+
+    Args:
+        path: Manifest file (.jsonl / .json lines, or .csv with a header row)
+
+    Returns:
+        Tasks in manifest order
+
+    Raises:
+        ValueError: If an entry lacks a path or ids repeat
+    """
+    base_dir = os.path.dirname(os.path.abspath(path))
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        if path.lower().endswith('.csv'):
+            rows = list(csv.DictReader(f))
+        else:
+            rows = [json.loads(line) for line in f if line.strip()]
+
+    tasks = []
+    seen = set()
+    for number, row in enumerate(rows, start=1):
+        if not row.get('reference') or not row.get('recording'):
+            raise ValueError(f"Manifest entry {number} needs 'reference' and 'recording'")
+        task_id = str(row.get('id') or number)
+        if task_id in seen:
+            raise ValueError(f"Duplicate manifest id: {task_id}")
+        seen.add(task_id)
+        tasks.append(ScoringTask(
+            id=task_id,
+            reference=os.path.join(base_dir, row['reference']),
+            recording=os.path.join(base_dir, row['recording']),
+            text=row.get('text') or ''
+        ))
+    return tasks
+
+
+def read_completed_ids(output_path: str, include_failed: bool = True) -> Set[str]:
+    """
+    Collect ids already written to a JSONL results file.
+
+    The last record of an id wins. A trailing line cut off by an interruption
+    is removed, so appending continues on a clean line. When failed records
+    are to be retried, the file is rewritten without them (and without
+    superseded records), so every id keeps a single result.
+
+    Args:
+        output_path: Results file of an earlier run
+        include_failed: Count records with an error as completed
+    """
+    if not os.path.exists(output_path):
+        return set()
+
+    # id -> (line, failed) of its last record, in the order of those records
+    records: Dict[str, Tuple[bytes, bool]] = {}
+    line_count = 0
+    valid_size = 0
+    with open(output_path, 'rb') as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+                record_id = str(record['id'])
+            except (ValueError, KeyError, TypeError):
+                break
+            records.pop(record_id, None)
+            records[record_id] = (line, bool(record.get('error')))
+            line_count += 1
+            valid_size += len(line)
+
+    completed = {record_id for record_id, (_, failed) in records.items() if include_failed or not failed}
+    if not include_failed and len(completed) < line_count:
+        tmp_path = f"{output_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.writelines(line for record_id, (line, _) in records.items() if record_id in completed)
+        os.replace(tmp_path, output_path)
+    elif valid_size < os.path.getsize(output_path):
+        with open(output_path, 'r+b') as f:
+            f.truncate(valid_size)
+    return completed
+
+
+class BatchScorer:
+    """
+    Scores many recordings against their references across worker processes.
+
+    Unique references are analyzed into the shared feature cache first (one
+    job per group of clips), so concurrent comparisons never analyze the same
+    reference twice. Comparisons are then submitted with a bounded number in
+    flight and results are yielded in manifest order.
+    """
+
+    REFERENCE_CHUNK = 16
+
+    def __init__(self, executor: ComparisonExecutor, max_pending: int = 8):
+        self._executor = executor
+        self._max_pending = max(max_pending, 1)
+
+    def score(
+        self,
+        tasks: Iterable[ScoringTask],
+        completed_ids: Iterable[str] = (),
+        stats: Optional[BatchStats] = None,
+        on_result: Optional[Callable[[Dict[str, Any], BatchStats], None]] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Score tasks, skipping ones already completed.
+
+        Args:
+            tasks: Tasks to score
+            completed_ids: Ids of tasks scored in an earlier run
+            stats: Counters to update (a new BatchStats when omitted)
+            on_result: Optional callback receiving each record and the counters
+
+        Returns:
+            Iterator of result records, one per pending task
+        """
+        stats = stats or BatchStats()
+        completed = set(completed_ids)
+        tasks = list(tasks)
+        pending_tasks = [task for task in tasks if task.id not in completed]
+        stats.total = len(tasks)
+        stats.skipped = len(tasks) - len(pending_tasks)
+
+        stats.references_prepared = self._prepare_references(pending_tasks)
+
+        in_flight = deque()
+        task_iter = iter(pending_tasks)
+        while True:
+            while len(in_flight) < self._max_pending:
+                task = next(task_iter, None)
+                if task is None:
+                    break
+                in_flight.append((task, time.perf_counter(), self._executor.submit(
+                    task.reference, task.recording, task.text, supersede=False, raise_errors=True
+                )))
+            if not in_flight:
+                return
+
+            task, submitted_at, job = in_flight.popleft()
+            record = self._record(task, job, submitted_at)
+            if record['error'] is None:
+                stats.scored += 1
+            else:
+                stats.failed += 1
+            if on_result:
+                on_result(record, stats)
+            yield record
+
+    def _prepare_references(self, tasks: List[ScoringTask]) -> int:
+        """Analyze every distinct reference once, spread over the workers."""
+        references = list(dict.fromkeys(task.reference for task in tasks))
+        futures = [
+            self._executor.prepare_references(references[start:start + self.REFERENCE_CHUNK])
+            for start in range(0, len(references), self.REFERENCE_CHUNK)
+        ]
+        return sum(future.result() for future in futures)
+
+    def _record(self, task: ScoringTask, job: Any, submitted_at: float) -> Dict[str, Any]:
+        """Wait for a job and build its output record."""
+        record = {
+            'id': task.id,
+            'reference': task.reference,
+            'recording': task.recording,
+            'text': task.text,
+            'score': None,
+            'segments': [],
+            'error': None
+        }
+        try:
+            segments = job.result()
+            record['segments'] = segments
+            record['score'] = round(mean(segment['score'] for segment in segments), 3) if segments else None
+        except ComparisonCancelled:
+            raise
+        except Exception as e:
+            record['error'] = f"{type(e).__name__}: {e}"
+        record['latency_ms'] = round((time.perf_counter() - submitted_at) * 1000, 1)
+        return record
@@ -0,0 +1,242 @@
+# Copyright 2026 The terCAD team. All rights reserved.
+# Use of this source code is governed by a CC BY-NC-ND 4.0 license that can be found in the LICENSE file.
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import CancelledError, Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from domain.services.audio_comparator import ComparisonCancelled
+
+ProgressCallback = Callable[[str, float], None]
+
+# Worker process state, set by _init_worker
+_worker: Dict[str, Any] = {}
+
+
+def _init_worker(feature_cache_dir: Optional[str], alignment: str, events: Any, cancel_below: Any) -> None:
+    """Import librosa and run one tiny comparison so the first real job starts warm."""
+    from infrastructure.audio.librosa_audio_comparator import LibrosaAudioComparator
+    from infrastructure.audio.reference_feature_cache import ReferenceFeatureCache
+
+    feature_cache = ReferenceFeatureCache(feature_cache_dir) if feature_cache_dir else None
+    comparator = LibrosaAudioComparator(feature_cache, alignment=alignment)
+    _worker.update(comparator=comparator, events=events, cancel_below=cancel_below)
+    comparator.preload()
+
+
+def _ping() -> int:
+    """No-op job that makes the pool start a worker."""
+    return os.getpid()
+
+
+def _compare(
+    job_id: int,
+    original_path: str,
+    recorded_path: str,
+    reference_text: str,
+    raise_errors: bool = False,
+    recorded_audio: Optional[Tuple[Any, int]] = None
+) -> List[Dict[str, Any]]:
+    """Run one comparison in a worker, reporting stages and checking for cancellation."""
+    events = _worker['events']
+    cancel_below = _worker['cancel_below']
+
+    def progress(stage: str, fraction: float) -> None:
+        if job_id < cancel_below.value:
+            raise ComparisonCancelled(f"Comparison {job_id} was cancelled")
+        events.put((job_id, stage, fraction))
+
+    comparator = _worker['comparator']
+    if raise_errors:
+        return comparator._compare_files(original_path, recorded_path, reference_text, recorded_audio, progress)
+    return comparator.compare_audio(original_path, recorded_path, reference_text, recorded_audio, progress)
+
+
+def _prepare_references(reference_paths: List[str]) -> int:
+    """Fill the shared feature cache for reference clips."""
+    return _worker['comparator'].warm_up(reference_paths)
+
+
+class ComparisonJob:
+    """Handle of a submitted comparison."""
+
+    def __init__(self, job_id: int, future: Future, executor: 'ComparisonExecutor'):
+        self.job_id = job_id
+        self._future = future
+        self._executor = executor
+
+    def result(self, timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Wait for the comparison results.
+
+        Raises:
+            ComparisonCancelled: If the job was cancelled or superseded
+        """
+        try:
+            return self._future.result(timeout)
+        except CancelledError as e:
+            raise ComparisonCancelled(f"Comparison {self.job_id} was cancelled") from e
+
+    def cancel(self) -> None:
+        """Cancel the job; a running job (and every older one) stops at its next stage."""
+        self._executor.cancel_through(self.job_id)
+
+    def cancelled(self) -> bool:
+        """Check whether the job ended by cancellation."""
+        if self._future.cancelled():
+            return True
+        return self._future.done() and isinstance(self._future.exception(), ComparisonCancelled)
+
+    def done(self) -> bool:
+        return self._future.done()
+
+    def add_done_callback(self, callback: Callable[['ComparisonJob'], None]) -> None:
+        self._future.add_done_callback(lambda _: callback(self))
+
+
+class ComparisonExecutor:
+    """
+    Runs audio comparisons in worker processes, away from the UI process's GIL.
+
+    Workers are spawned with librosa imported and JIT-compiled code warmed up,
+    and share the on-disk reference feature cache. Stage progress is sent back
+    through a queue and dispatched to per-job callbacks on a listener thread.
+    Jobs are numbered in submission order; cancelling a job cancels it and all
+    older jobs, so a new recording can supersede whatever is still running.
+    """
+
+    def __init__(self, feature_cache_dir: Optional[str] = None, alignment: str = 'full', max_workers: int = 1):
+        self._feature_cache_dir = feature_cache_dir
+        self._alignment = alignment
+        self._max_workers = max_workers
+        self._context = multiprocessing.get_context('spawn')
+        self._events = self._context.Queue()
+        self._cancel_below = self._context.Value('q', 0)
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._listener: Optional[threading.Thread] = None
+        self._progress: Dict[int, ProgressCallback] = {}
+        self._next_id = 1
+        self._closed = False
+        self._lock = threading.Lock()
+
+    def warm_up(self) -> None:
+        """Start the worker processes ahead of the first comparison."""
+        with self._lock:
+            for _ in range(self._max_workers):
+                self._submit(_ping)
+
+    def submit(
+        self,
+        original_path: str,
+        recorded_path: str,
+        reference_text: str = "",
+        progress: Optional[ProgressCallback] = None,
+        supersede: bool = True,
+        raise_errors: bool = False,
+        recorded_audio: Optional[Tuple[Any, int]] = None
+    ) -> ComparisonJob:
+        """
+        Queue a comparison.
+
+        Args:
+            original_path: Path to the reference audio file
+            recorded_path: Path to the user's recorded audio file
+            reference_text: Expected spoken text used for word-level alignment
+            progress: Optional callback receiving (stage, fraction), called on a listener thread
+            supersede: Cancel every job submitted before this one
+            raise_errors: Fail the job on unreadable files instead of returning an error row
+            recorded_audio: Optional captured (samples, sample_rate), sent to the
+                worker instead of having it decode recorded_path
+
+        Returns:
+            Job handle
+        """
+        with self._lock:
+            job_id = self._next_id
+            self._next_id += 1
+            if supersede:
+                self._cancel_up_to(job_id - 1)
+            if progress is not None:
+                self._progress[job_id] = progress
+            future = self._submit(
+                _compare, job_id, original_path, recorded_path, reference_text, raise_errors, recorded_audio
+            )
+
+        job = ComparisonJob(job_id, future, self)
+        future.add_done_callback(lambda _: self._progress.pop(job_id, None))
+        return job
+
+    def prepare_references(self, reference_paths: List[str]) -> Future:
+        """
+        Analyze reference clips into the shared feature cache in a worker.
+
+        Returns:
+            Future of the number of clips analyzed (cached clips are not counted)
+        """
+        with self._lock:
+            return self._submit(_prepare_references, list(reference_paths))
+
+    def cancel_through(self, job_id: int) -> None:
+        """Cancel the given job and every job submitted before it."""
+        with self._lock:
+            self._cancel_up_to(job_id)
+
+    def shutdown(self) -> None:
+        """Stop the workers and the progress listener."""
+        with self._lock:
+            self._closed = True
+            pool, self._pool = self._pool, None
+            listener, self._listener = self._listener, None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+        if listener is not None:
+            self._events.put(None)
+            listener.join()
+
+    def _cancel_up_to(self, job_id: int) -> None:
+        """Raise the shared cancellation mark above `job_id` (lock held)."""
+        with self._cancel_below.get_lock():
+            self._cancel_below.value = max(self._cancel_below.value, job_id + 1)
+
+    def _submit(self, fn: Callable, *args: Any) -> Future:
+        """Submit to the pool, starting it or replacing a broken one (lock held)."""
+        if self._closed:
+            raise RuntimeError("Comparison executor is shut down")
+        if self._listener is None:
+            self._listener = threading.Thread(target=self._dispatch_progress, daemon=True)
+            self._listener.start()
+
+        for attempt in range(2):
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self._max_workers,
+                    mp_context=self._context,
+                    initializer=_init_worker,
+                    initargs=(self._feature_cache_dir, self._alignment, self._events, self._cancel_below)
+                )
+            try:
+                # Workers are spawned on demand from submit
+                return self._pool.submit(fn, *args)
+            except BrokenProcessPool:
+                if attempt:
+                    raise
+                print("Warning: Comparison worker stopped unexpectedly, restarting")
+                self._pool = None
+
+    def _dispatch_progress(self) -> None:
+        """Deliver stage events from the workers to job callbacks."""
+        while True:
+            event = self._events.get()
+            if event is None:
+                return
+            job_id, stage, fraction = event
+            callback = self._progress.get(job_id)
+            if callback is None:
+                continue
+            try:
+                callback(stage, fraction)
+            except Exception as e:
+                print(f"Warning: Comparison progress callback failed: {e}")
@@ -0,0 +1,218 @@
+# Copyright 2026 The terCAD team. All rights reserved.
+# Use of this source code is governed by a CC BY-NC-ND 4.0 license that can be found in the LICENSE file.
+
+"""
+Constrained dynamic time warping over feature sequences.
+
+Full DTW fills an N x M cost matrix. The functions here only evaluate a
+window of cells given as a column range [lo[i], hi[i]) per reference frame,
+so time and memory grow with the window size instead:
+
+- `band_dtw`: Sakoe-Chiba band around the diagonal, scaled to the length ratio
+- `multiscale_dtw`: FastDTW-style refinement, aligning halved sequences first
+  and searching only a radius around the projected coarse path
+- `IncrementalDTW`: full alignment extended one recorded frame at a time
+
+Step pattern and tie-breaking follow librosa.sequence.dtw defaults, so with a
+window covering the whole matrix the result equals the full alignment.
+"""
+
+from typing import List, Tuple
+
+import numpy as np
+
+
+def windowed_dtw(X: np.ndarray, Y: np.ndarray, lo: np.ndarray, hi: np.ndarray) -> Tuple[float, np.ndarray]:
+    """
+    Align two feature sequences within a window of cells.
+
+    Args:
+        X: Reference features of shape (n_features, N)
+        Y: Recorded features of shape (n_features, M)
+        lo: First allowed column per row, non-decreasing, lo[0] == 0
+        hi: End (exclusive) of allowed columns per row, non-decreasing, hi[-1] == M
+
+    Returns:
+        Tuple of (total cost, path) where path is an array of (row, column)
+        pairs from (0, 0) to (N - 1, M - 1)
+    """
+    X = np.asarray(X, dtype=np.float64)
+    Y = np.asarray(Y, dtype=np.float64)
+    rows = []
+    prev = np.zeros(1)
+    prev_lo = -1
+
+    for i in range(X.shape[1]):
+        start, end = int(lo[i]), int(hi[i])
+        cost = np.sqrt(np.sum(np.square(Y[:, start:end] - X[:, i:i + 1]), axis=0))
+        row = _accumulate_row(cost, start, prev, prev_lo)
+        rows.append(row)
+        prev, prev_lo = row, start
+
+    path = _backtrack(rows, lo)
+    return float(rows[-1][-1]), path
+
+
+class IncrementalDTW:
+    """
+    Full DTW against a fixed reference, extended as recorded frames arrive.
+
+    Each appended frame adds one row of accumulated cost over all reference
+    frames (O(N) work), so the alignment of a finished recording only needs
+    the backtrack. Rows can be truncated and replayed when earlier frames
+    change.
+    """
+
+    def __init__(self, reference: np.ndarray):
+        self._reference = np.asarray(reference, dtype=np.float64)
+        self._rows: List[np.ndarray] = []
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def append(self, frames: np.ndarray) -> None:
+        """
+        Extend the alignment by recorded frames.
+
+        Args:
+            frames: Recorded features of shape (n_features, k)
+        """
+        frames = np.asarray(frames, dtype=np.float64)
+        for j in range(frames.shape[1]):
+            cost = np.sqrt(np.sum(np.square(self._reference - frames[:, j:j + 1]), axis=0))
+            if self._rows:
+                row = _accumulate_row(cost, 0, self._rows[-1], 0)
+            else:
+                row = _accumulate_row(cost, 0, np.zeros(1), -1)
+            self._rows.append(row)
+
+    def truncate(self, count: int) -> None:
+        """Drop every row after the first `count` recorded frames."""
+        del self._rows[count:]
+
+    def result(self) -> Tuple[float, np.ndarray]:
+        """
+        Get the alignment of the frames appended so far.
+
+        Returns:
+            Tuple of (total cost, path) with (reference, recorded) frame pairs in time order
+        """
+        path = _backtrack(self._rows, np.zeros(len(self._rows), dtype=np.intp))
+        return float(self._rows[-1][-1]), path[:, ::-1].copy()
+
+
+def band_dtw(X: np.ndarray, Y: np.ndarray, ratio: float = 0.1, min_radius: int = 4) -> Tuple[float, np.ndarray]:
+    """
+    Align two sequences within a Sakoe-Chiba band.
+
+    Args:
+        X: Reference features of shape (n_features, N)
+        Y: Recorded features of shape (n_features, M)
+        ratio: Band half-width as a share of the longer sequence
+        min_radius: Smallest band half-width in frames
+
+    Returns:
+        Tuple of (total cost, path), see `windowed_dtw`
+    """
+    n, m = X.shape[1], Y.shape[1]
+    radius = max(int(np.ceil(ratio * max(n, m))), min_radius)
+    center = np.arange(n) * ((m - 1) / max(n - 1, 1))
+    lo = np.floor(center - radius).astype(np.intp)
+    hi = np.ceil(center + radius).astype(np.intp) + 1
+    return windowed_dtw(X, Y, *_normalize_window(lo, hi, m))
+
+
+def multiscale_dtw(X: np.ndarray, Y: np.ndarray, radius: int = 8) -> Tuple[float, np.ndarray]:
+    """
+    Align two sequences by refining the alignment of their halved versions.
+
+    Args:
+        X: Reference features of shape (n_features, N)
+        Y: Recorded features of shape (n_features, M)
+        radius: Frames searched around the projected coarse path at each level
+
+    Returns:
+        Tuple of (total cost, path), see `windowed_dtw`
+    """
+    n, m = X.shape[1], Y.shape[1]
+    if min(n, m) <= radius + 2:
+        return windowed_dtw(X, Y, np.zeros(n, dtype=np.intp), np.full(n, m, dtype=np.intp))
+
+    _, coarse_path = multiscale_dtw(_halve(X), _halve(Y), radius)
+
+    # Every coarse cell covers a 2x2 block of fine cells
+    lo = np.full(n, m, dtype=np.intp)
+    hi = np.zeros(n, dtype=np.intp)
+    for offset in (0, 1):
+        fine_rows = np.minimum(2 * coarse_path[:, 0] + offset, n - 1)
+        np.minimum.at(lo, fine_rows, 2 * coarse_path[:, 1])
+        np.maximum.at(hi, fine_rows, np.minimum(2 * coarse_path[:, 1] + 2, m))
+
+    # Widen by the radius along both axes; bounds are monotone in the row
+    rows = np.arange(n)
+    lo = lo[np.maximum(rows - radius, 0)] - radius
+    hi = hi[np.minimum(rows + radius, n - 1)] + radius
+    return windowed_dtw(X, Y, *_normalize_window(lo, hi, m))
+
+
+def _accumulate_row(cost: np.ndarray, start: int, prev: np.ndarray, prev_lo: int) -> np.ndarray:
+    """
+    Accumulated cost of one row from the row above it.
+
+    Args:
+        cost: Local costs of the row's window, which starts at column `start`
+        start: First column of the window
+        prev: Accumulated costs of the previous row
+        prev_lo: First column of the previous row (-1 with prev=[0] for the first row)
+
+    Returns:
+        Accumulated costs over the row's window
+    """
+    end = start + len(cost)
+    # Previous row at columns start-1 .. end-1 (inf outside its window)
+    above = np.full(len(cost) + 1, np.inf)
+    first = max(start - 1, prev_lo)
+    last = min(end, prev_lo + len(prev))
+    if last > first:
+        above[first - start + 1:last - start + 1] = prev[first - prev_lo:last - prev_lo]
+
+    # D[j] = min(c[j] + min(diag, up), c[j] + D[j-1]); the horizontal chain
+    # is resolved with prefix sums: D = S + cummin(best_vertical - S_prev)
+    vertical = cost + np.minimum(above[:-1], above[1:])
+    prefix = np.cumsum(cost)
+    return prefix + np.minimum.accumulate(vertical - prefix)
+
+
+def _halve(features: np.ndarray) -> np.ndarray:
+    """Average pairs of consecutive frames (a trailing odd frame is kept)."""
+    n = features.shape[1]
+    pairs = features[:, :n - n % 2].reshape(features.shape[0], -1, 2).mean(axis=2)
+    if n % 2:
+        pairs = np.concatenate((pairs, features[:, -1:]), axis=1)
+    return pairs
+
+
+def _normalize_window(lo: np.ndarray, hi: np.ndarray, m: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Clip a window to the matrix and keep consecutive rows connected."""
+    lo = np.maximum.accumulate(np.clip(lo, 0, m - 1))
+    hi = np.maximum(np.minimum.accumulate(np.clip(hi, 1, m)[::-1])[::-1], lo + 1)
+    lo[0], hi[-1] = 0, m
+    # A row must start no later than the previous one ends
+    lo[1:] = np.minimum(lo[1:], hi[:-1])
+    return lo, hi
+
+
+def _backtrack(rows: list, lo: np.ndarray) -> np.ndarray:
+    """Walk back from the last cell, preferring diagonal, then horizontal, then vertical steps."""
+    def value(i, j):
+        if i < 0 or j < lo[i] or j - lo[i] >= len(rows[i]):
+            return np.inf
+        return rows[i][j - lo[i]]
+
+    i, j = len(rows) - 1, int(lo[-1]) + len(rows[-1]) - 1
+    path = [(i, j)]
+    while i > 0 or j > 0:
+        steps = ((i - 1, j - 1), (i, j - 1), (i - 1, j))
+        i, j = min(steps, key=lambda step: value(*step))
+        path.append((i, j))
+    return np.array(path[::-1], dtype=np.intp)
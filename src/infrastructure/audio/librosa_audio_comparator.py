@@ -2,78 +2,255 @@
 # Use of this source code is governed by a CC BY-NC-ND 4.0 license that can be found in the LICENSE file.
 
 import os
+import queue
 import re
-from typing import List, Dict, Any
-from domain.services.audio_comparator import IAudioComparator
+import threading
+from typing import Callable, List, Dict, Any, Iterable, Optional, Tuple
+from domain.services.audio_comparator import ComparisonCancelled, IAudioComparator, IComparisonStream
+from infrastructure.audio.audio_features import AudioFeatures, DecodedAudio
+from infrastructure.audio.reference_feature_cache import ReferenceFeatureCache
 
 try:
     import numpy as np
+    from infrastructure.audio import dtw_alignment
     HAS_NUMPY = True
 except ImportError:
     HAS_NUMPY = False
     np = None
+    dtw_alignment = None
 
 try:
     import librosa
+    from infrastructure.audio.streaming_features import StreamingFeatureExtractor
     HAS_LIBROSA = True
 except ImportError:
     HAS_LIBROSA = False
     librosa = None
-
-try:
-    from pydub import AudioSegment
-    from pydub.silence import detect_nonsilent
-    HAS_PYDUB = True
-except ImportError:
-    HAS_PYDUB = False
-    AudioSegment = None
-    detect_nonsilent = None
+    StreamingFeatureExtractor = None
 
 
 class LibrosaAudioComparator(IAudioComparator):
     """
     Audio comparator implementation using librosa for feature extraction.
     Infrastructure implementation of the domain interface.
+
+    Each file is decoded once per comparison; MFCCs, silence-based word
+    boundaries and per-second chunks are all derived from that buffer.
+    With a feature cache, reference features are computed once per clip
+    and only the new recording is analyzed.
+
+    Word timing is mapped through a DTW alignment selected by `alignment`:
+    'full' (exact, O(N*M)), 'band' (Sakoe-Chiba band of BAND_RATIO) or
+    'multiscale' (coarse-to-fine with MULTISCALE_RADIUS frames).
+
+    `start_stream` analyzes a recording while it is captured and aligns it
+    incrementally against the reference (full DTW, one row per frame).
     """
 
+    SAMPLE_RATE = 16000
+    HOP_LENGTH = 512
+    N_MFCC = 13
+    MIN_SILENCE_MS = 140
+    SILENCE_SEEK_MS = 5
+    ALIGNMENTS = ('full', 'band', 'multiscale')
+    BAND_RATIO = 0.1
+    MULTISCALE_RADIUS = 8
+
+    def __init__(self, feature_cache: Optional[ReferenceFeatureCache] = None, alignment: str = 'full'):
+        if alignment not in self.ALIGNMENTS:
+            raise ValueError(f"Unknown alignment '{alignment}', expected one of {self.ALIGNMENTS}")
+        self._feature_cache = feature_cache
+        self.alignment = alignment
+
     def is_available(self) -> bool:
         """Check if all required dependencies are available."""
-        return HAS_NUMPY and HAS_LIBROSA and HAS_PYDUB
+        return HAS_NUMPY and HAS_LIBROSA
 
     def compare_audio(
         self,
         original_path: str,
         recorded_path: str,
-        reference_text: str = ""
+        reference_text: str = "",
+        recorded_audio: Optional[Tuple[Any, int]] = None,
+        progress: Optional[Callable[[str, float], None]] = None
     ) -> List[Dict[str, Any]]:
-        """Compare two audio files and return similarity analysis."""
+        """
+        Compare two audio files and return similarity analysis.
+
+        Args:
+            original_path: Path to the reference audio file
+            recorded_path: Path to the user's recorded audio file
+            reference_text: Expected spoken text used for word-level alignment
+            recorded_audio: Optional captured (samples, sample_rate) analyzed
+                instead of decoding recorded_path
+            progress: Optional callback receiving (stage, fraction) before each
+                stage ('reference', 'recording', 'alignment') and ('done', 1.0);
+                it may raise ComparisonCancelled to abort
+
+        Returns:
+            List of comparison results with scores and feedback
+        """
         if not self.is_available():
-            print("Warning: Audio comparison requires numpy, librosa, and pydub")
+            print("Warning: Audio comparison requires numpy and librosa")
             return [{"score": 75.0, "feedback": "Audio comparison not available"}]
 
         print(f"Comparing audio files: {original_path} vs {recorded_path}")
 
         try:
-            words = self._tokenize_words(reference_text)
-            if words:
-                return self._compare_by_words(original_path, recorded_path, words)
-            return self._compare_by_seconds(original_path, recorded_path)
+            return self._compare_files(original_path, recorded_path, reference_text, recorded_audio, progress)
+        except ComparisonCancelled:
+            raise
         except Exception as e:
             print(f"Error comparing audio: {e}")
             return [{"score": 0.0, "feedback": f"Error: {str(e)}"}]
 
-    def _compare_by_words(self, original_path: str, recorded_path: str, words: List[str]) -> List[Dict[str, Any]]:
-        """Compare two files using word-level timing from reference audio and DTW mapping."""
-        features_original, sr_original, hop_length = self._extract_feature_sequence(original_path)
-        features_recorded, _, _ = self._extract_feature_sequence(recorded_path)
+    def _compare_files(
+        self,
+        original_path: str,
+        recorded_path: str,
+        reference_text: str = "",
+        recorded_audio: Optional[Tuple[Any, int]] = None,
+        progress: Optional[Callable[[str, float], None]] = None
+    ) -> List[Dict[str, Any]]:
+        """Compare two audio files, raising on unreadable files (see compare_audio)."""
+        report = progress or (lambda stage, fraction: None)
+        report('reference', 0.0)
+        original = self._reference_features(original_path)
+        report('recording', 0.3)
+        if recorded_audio is not None:
+            recorded = self._analyze(self._decode_samples(*recorded_audio))
+        else:
+            recorded = self._analyze(self._decode_audio(recorded_path))
+        report('alignment', 0.7)
+        words = self._tokenize_words(reference_text)
+        if words:
+            result = self._compare_by_words(original, recorded, words)
+        else:
+            result = self._compare_by_seconds(original, recorded)
+        report('done', 1.0)
+        return result
+
+    def start_stream(self, original_path: str, reference_text: str = "") -> Optional[IComparisonStream]:
+        """Start comparing a recording against a reference while it is captured."""
+        if not self.is_available():
+            return None
+        try:
+            reference = self._reference_features(original_path)
+        except Exception as e:
+            print(f"Warning: Could not prepare streaming comparison: {e}")
+            return None
+        return LibrosaComparisonStream(self, reference, self._tokenize_words(reference_text))
+
+    def _decode_audio(self, file_path: str) -> DecodedAudio:
+        """Decode a file to mono PCM at the analysis sample rate."""
+        y, sr = librosa.load(file_path, sr=self.SAMPLE_RATE, mono=True)
+        return DecodedAudio(y, sr)
+
+    def _decode_samples(self, samples: Any, sample_rate: int) -> DecodedAudio:
+        """Convert captured PCM to mono float at the analysis sample rate, as _decode_audio does for files."""
+        y = np.asarray(samples)
+        if y.ndim > 1:
+            y = y.mean(axis=1) if y.shape[1] > 1 else y[:, 0]
+        if np.issubdtype(y.dtype, np.integer):
+            y = y.astype(np.float32) / float(np.iinfo(y.dtype).max + 1)
+        y = y.astype(np.float32, copy=False)
+        if sample_rate != self.SAMPLE_RATE:
+            y = librosa.resample(y, orig_sr=sample_rate, target_sr=self.SAMPLE_RATE, res_type='soxr_hq')
+        return DecodedAudio(y, self.SAMPLE_RATE)
+
+    def preload(self) -> None:
+        """
+        Run a short synthetic comparison so the first real one starts warm.
+
+        librosa loads its submodules on first access and compiles its numba
+        code on first call, which takes seconds on the first comparison.
+        """
+        if not self.is_available():
+            return
+        noise = np.random.default_rng(0).standard_normal(self.SAMPLE_RATE // 2).astype(np.float32) * 0.01
+        features = self._analyze(DecodedAudio(noise, self.SAMPLE_RATE), with_segments=True)
+        self._compare_by_words(features, features, ['warm', 'up'])
+
+    def warm_up(
+        self,
+        reference_paths: Iterable[str],
+        progress: Optional[Callable[[int, int], None]] = None
+    ) -> int:
+        """
+        Precompute cached features for reference clips, e.g. a whole category.
+
+        Args:
+            reference_paths: Reference audio files; missing files are skipped
+            progress: Optional callback receiving (processed, total)
+
+        Returns:
+            Number of clips analyzed (already cached clips are not counted)
+        """
+        if not self.is_available() or self._feature_cache is None:
+            return 0
+
+        paths = [path for path in reference_paths if path and os.path.exists(path)]
+        computed = 0
+        for index, path in enumerate(paths):
+            try:
+                key = self._feature_cache.key(path, self._feature_params())
+                if self._feature_cache.get(key) is None:
+                    self._feature_cache.put(key, self._analyze(self._decode_audio(path), with_segments=True))
+                    computed += 1
+            except Exception as e:
+                print(f"Warning: Could not analyze reference audio {path}: {e}")
+            if progress:
+                progress(index + 1, len(paths))
+        return computed
+
+    def _feature_params(self) -> str:
+        """Fingerprint of every setting the cached features depend on."""
+        return (
+            f"sr={self.SAMPLE_RATE};hop={self.HOP_LENGTH};mfcc={self.N_MFCC};"
+            f"silence={self.MIN_SILENCE_MS}/{self.SILENCE_SEEK_MS}"
+        )
+
+    def _reference_features(self, file_path: str) -> AudioFeatures:
+        """Get reference features from the cache, analyzing the file on a miss."""
+        if self._feature_cache is None:
+            return self._analyze(self._decode_audio(file_path), with_segments=True)
+
+        key = self._feature_cache.key(file_path, self._feature_params())
+        features = self._feature_cache.get(key)
+        if features is None:
+            features = self._analyze(self._decode_audio(file_path), with_segments=True)
+            self._feature_cache.put(key, features)
+        return features
+
+    def _analyze(self, audio: DecodedAudio, with_segments: bool = False) -> AudioFeatures:
+        """Extract MFCCs and, for references, speech segments from a decoded buffer."""
+        mfcc, sr, hop_length = self._extract_feature_sequence(audio)
+        return AudioFeatures(
+            mfcc=mfcc,
+            sr=sr,
+            hop_length=hop_length,
+            n_samples=len(audio.samples),
+            speech_segments=self._speech_segments(audio) if with_segments else None
+        )
+
+    def _compare_by_words(
+        self,
+        original: AudioFeatures,
+        recorded: AudioFeatures,
+        words: List[str],
+        path: Optional[Any] = None
+    ) -> List[Dict[str, Any]]:
+        """Compare two recordings using word-level timing from reference audio and DTW mapping."""
+        features_original, sr_original, hop_length = original.mfcc, original.sr, original.hop_length
+        features_recorded = recorded.mfcc
 
         # DTW path maps reference frames to recorded frames (forced-alignment style).
-        _, path = librosa.sequence.dtw(X=features_original, Y=features_recorded, metric='euclidean')
-        path = np.asarray(path)[::-1]
+        if path is None:
+            path = self._align(features_original, features_recorded)
 
-        reference_segments = self._word_boundaries_from_audio(original_path, len(words))
+        reference_segments = self._word_boundaries(original, len(words))
         if not reference_segments:
-            return self._compare_by_seconds(original_path, recorded_path)
+            return self._compare_by_seconds(original, recorded)
 
         summary = []
         for idx, (start_ms, end_ms) in enumerate(reference_segments):
@@ -99,32 +276,42 @@ class LibrosaAudioComparator(IAudioComparator):
 
         return summary
 
-    def _compare_by_seconds(self, original_path: str, recorded_path: str) -> List[Dict[str, Any]]:
-        """Fallback comparison split into 1-second chunks."""
-        parts_original = self._chunk_audio(original_path)
-        parts_recorded = self._chunk_audio(recorded_path)
+    def _align(self, features_original: Any, features_recorded: Any) -> Any:
+        """Get the DTW path as (reference frame, recorded frame) pairs in time order."""
+        if self.alignment == 'band':
+            _, path = dtw_alignment.band_dtw(features_original, features_recorded, ratio=self.BAND_RATIO)
+            return path
+        if self.alignment == 'multiscale':
+            _, path = dtw_alignment.multiscale_dtw(features_original, features_recorded, radius=self.MULTISCALE_RADIUS)
+            return path
+        _, path = librosa.sequence.dtw(X=features_original, Y=features_recorded, metric='euclidean')
+        return np.asarray(path)[::-1]
+
+    def _compare_by_seconds(self, original: AudioFeatures, recorded: AudioFeatures) -> List[Dict[str, Any]]:
+        """
+        Fallback comparison split into 1-second windows.
+
+        The framewise MFCC matrix of each recording is mean-pooled per
+        second; nothing is written to disk.
+        """
+        seconds_original = self._seconds_count(original)
+        pooled_original = self._pool_per_second(original.mfcc, original.sr, seconds_original)
+        pooled_recorded = self._pool_per_second(recorded.mfcc, recorded.sr, self._seconds_count(recorded))
+
+        compared = min(len(pooled_original), len(pooled_recorded))
+        deviations = np.full(seconds_original, 100.0)
+        deviations[:compared] = np.linalg.norm(pooled_original[:compared] - pooled_recorded[:compared], axis=1)
 
         summary = []
-        try:
-            for i, part in enumerate(parts_original):
-                deviation = 100.0
-                if i < len(parts_recorded):
-                    deviation = self._compare_features(part, parts_recorded[i])
-                score = self._deviation_to_score(deviation)
-                summary.append({
-                    "second": i + 1,
-                    "deviation": float(deviation),
-                    "score": score,
-                    "feedback": self._feedback_for_score(score)
-                })
-            return summary
-        finally:
-            for part in parts_original + parts_recorded:
-                try:
-                    if os.path.exists(part):
-                        os.remove(part)
-                except Exception:
-                    pass
+        for i, deviation in enumerate(deviations):
+            score = self._deviation_to_score(deviation)
+            summary.append({
+                "second": i + 1,
+                "deviation": float(deviation),
+                "score": score,
+                "feedback": self._feedback_for_score(score)
+            })
+        return summary
 
     def _tokenize_words(self, reference_text: str) -> List[str]:
         """Extract words from expected sentence for word-level scoring."""
@@ -132,25 +319,98 @@ class LibrosaAudioComparator(IAudioComparator):
             return []
         return re.findall(r"[\w']+", reference_text, flags=re.UNICODE)
 
-    def _word_boundaries_from_audio(self, audio_path: str, word_count: int) -> List[tuple]:
+    def _word_boundaries(self, features: AudioFeatures, word_count: int) -> List[tuple]:
         """Estimate word boundaries from silence gaps and normalize to expected word count."""
         if word_count <= 0:
             return []
 
-        audio = AudioSegment.from_file(audio_path)
-        total_ms = max(int(len(audio)), 1)
-        if not detect_nonsilent:
-            return self._uniform_segments(total_ms, word_count)
-
-        silence_threshold = audio.dBFS - 20 if audio.dBFS != float('-inf') else -45
-        detected = detect_nonsilent(audio, min_silence_len=140, silence_thresh=silence_threshold, seek_step=5)
-        segments = [(int(start), int(end)) for start, end in detected if end > start]
+        total_ms = max(features.duration_ms, 1)
+        segments = [(int(start), int(end)) for start, end in features.speech_segments or [] if end > start]
 
         if not segments:
             return self._uniform_segments(total_ms, word_count)
 
         return self._fit_segments_to_count(segments, word_count, total_ms)
 
+    def _speech_segments(self, audio: DecodedAudio) -> List[tuple]:
+        """Detect non-silent ranges relative to the loudness of the whole clip."""
+        dbfs = self._dbfs(audio.samples)
+        silence_threshold = dbfs - 20 if dbfs != float('-inf') else -45
+        return self._detect_nonsilent(
+            audio,
+            min_silence_len=self.MIN_SILENCE_MS,
+            silence_thresh=silence_threshold,
+            seek_step=self.SILENCE_SEEK_MS
+        )
+
+    def _dbfs(self, samples: Any) -> float:
+        """Loudness of a float PCM buffer relative to full scale."""
+        if not len(samples):
+            return float('-inf')
+        rms = float(np.sqrt(np.mean(np.square(samples, dtype=np.float64))))
+        return 20 * np.log10(rms) if rms > 0 else float('-inf')
+
+    def _detect_nonsilent(
+        self,
+        audio: DecodedAudio,
+        min_silence_len: int,
+        silence_thresh: float,
+        seek_step: int
+    ) -> List[tuple]:
+        """
+        Find non-silent ranges, following pydub.silence.detect_nonsilent.
+
+        Window loudness is read from a cumulative sum of squares instead of
+        slicing an AudioSegment per step.
+
+        Args:
+            audio: Decoded recording
+            min_silence_len: Shortest silence in ms
+            silence_thresh: Silence threshold in dBFS
+            seek_step: Window step in ms
+
+        Returns:
+            List of (start_ms, end_ms) ranges
+        """
+        total_ms = audio.duration_ms
+        if total_ms < min_silence_len:
+            return [(0, total_ms)]
+
+        samples_per_ms = audio.sr / 1000.0
+        squares = np.concatenate(([0.0], np.cumsum(np.square(audio.samples, dtype=np.float64))))
+
+        last_start = total_ms - min_silence_len
+        starts = np.arange(0, last_start + 1, seek_step)
+        if starts[-1] != last_start:
+            starts = np.append(starts, last_start)
+        lo = np.minimum(np.round(starts * samples_per_ms).astype(np.intp), len(audio.samples))
+        hi = np.minimum(np.round((starts + min_silence_len) * samples_per_ms).astype(np.intp), len(audio.samples))
+        rms = np.sqrt((squares[hi] - squares[lo]) / np.maximum(hi - lo, 1))
+
+        silence_starts = starts[rms <= 10 ** (silence_thresh / 20.0)]
+        if not len(silence_starts):
+            return [(0, total_ms)]
+
+        # Merge overlapping or adjacent silent windows into ranges
+        gaps = np.diff(silence_starts)
+        breaks = np.flatnonzero((gaps != seek_step) & (gaps > min_silence_len))
+        range_starts = silence_starts[np.concatenate(([0], breaks + 1))]
+        range_ends = silence_starts[np.concatenate((breaks, [len(silence_starts) - 1]))] + min_silence_len
+
+        if len(range_starts) == 1 and range_starts[0] == 0 and range_ends[0] == total_ms:
+            return []
+
+        nonsilent = []
+        prev_end = 0
+        for start, end in zip(range_starts.tolist(), range_ends.tolist()):
+            nonsilent.append((prev_end, start))
+            prev_end = end
+        if prev_end != total_ms:
+            nonsilent.append((prev_end, total_ms))
+        if nonsilent[0] == (0, 0):
+            nonsilent.pop(0)
+        return nonsilent
+
     def _fit_segments_to_count(self, segments: List[tuple], target_count: int, total_ms: int) -> List[tuple]:
         """Merge or split speech segments to match expected word count."""
         normalized = list(segments)
@@ -188,12 +448,10 @@ class LibrosaAudioComparator(IAudioComparator):
             segments.append((start, max(end, start + 1)))
         return segments
 
-    def _extract_feature_sequence(self, file_path: str) -> tuple:
+    def _extract_feature_sequence(self, audio: DecodedAudio) -> tuple:
         """Return MFCC feature sequence and timing metadata."""
-        y, sr = librosa.load(file_path, sr=16000)
-        hop_length = 512
-        mfcc = librosa.feature.mfcc(y=y, sr=sr, n_mfcc=13, hop_length=hop_length)
-        return mfcc, sr, hop_length
+        mfcc = librosa.feature.mfcc(y=audio.samples, sr=audio.sr, n_mfcc=self.N_MFCC, hop_length=self.HOP_LENGTH)
+        return mfcc, audio.sr, self.HOP_LENGTH
 
     def _mapped_recorded_frame_range(self, path: Any, ref_start: int, ref_end: int) -> tuple:
         """Map a reference frame span to recorded frame span using DTW path."""
@@ -232,30 +490,123 @@ class LibrosaAudioComparator(IAudioComparator):
             return "Needs improvement"
         return "Try again"
 
-    def _chunk_audio(self, audio_path: str) -> List[str]:
-        """Split audio into 1-second chunks."""
-        audio = AudioSegment.from_file(audio_path)
-        audio = audio.set_frame_rate(16000).set_channels(1)
-        chunk_length_ms = 1000
-        chunks = []
-        base, _ = os.path.splitext(audio_path)
-
-        for i, start in enumerate(range(0, len(audio), chunk_length_ms)):
-            chunk = audio[start:start + chunk_length_ms]
-            chunk_path = f"{base}_chunk{i+1}.wav"
-            chunk.export(chunk_path, format="wav")
-            chunks.append(chunk_path)
-
-        return chunks
-
-    def _compare_features(self, audio_original: str, audio_recorded: str) -> float:
-        """Compare features between two audio chunks."""
-        features_original = self._extract_features(audio_original)
-        features_recorded = self._extract_features(audio_recorded)
-        return float(np.linalg.norm(features_original - features_recorded))
-
-    def _extract_features(self, file_path: str) -> Any:
-        """Extract MFCC features from audio file."""
-        y, sr = librosa.load(file_path, sr=None)
-        mfccs = librosa.feature.mfcc(y=y, sr=sr, n_mfcc=13)
-        return np.mean(mfccs.T, axis=0)
+    def _seconds_count(self, features: AudioFeatures) -> int:
+        """Number of 1-second windows, counting a trailing partial second."""
+        return -(-features.n_samples // features.sr)
+
+    def _pool_per_second(self, features: Any, sr: int, seconds: int) -> Any:
+        """
+        Mean-pool a framewise feature matrix into 1-second windows.
+
+        Args:
+            features: Matrix of shape (n_features, n_frames) with HOP_LENGTH spacing
+            sr: Sample rate the features were computed at
+            seconds: Number of windows
+
+        Returns:
+            Matrix of shape (seconds, n_features)
+        """
+        n_frames = features.shape[1]
+        if not seconds or not n_frames:
+            return np.zeros((0, features.shape[0]))
+
+        # Frame f is centered on sample f * HOP_LENGTH
+        bounds = -(-np.arange(seconds + 1) * sr // self.HOP_LENGTH)
+        starts = np.minimum(bounds[:-1], n_frames - 1)
+        ends = np.clip(bounds[1:], starts + 1, n_frames)
+
+        cumulative = np.concatenate((np.zeros((1, features.shape[0])), np.cumsum(features.T, axis=0)))
+        return (cumulative[ends] - cumulative[starts]) / (ends - starts)[:, np.newaxis]
+
+
+class LibrosaComparisonStream(IComparisonStream):
+    """
+    Streaming comparison of one recording against a cached reference.
+
+    Captured blocks are queued to a worker thread, so capture never waits
+    for analysis. The worker turns them into MFCC frames and extends an
+    incremental DTW against the reference with each frame. When the loudest
+    frame so far rises, the dynamic range clip of earlier frames changes and
+    rows from the first changed frame are replayed, which mostly happens
+    early in the recording. `finish` flushes the last frames and backtracks.
+    """
+
+    def __init__(self, comparator: LibrosaAudioComparator, reference: AudioFeatures, words: List[str]):
+        self._comparator = comparator
+        self._reference = reference
+        self._words = words
+        self._extractor = StreamingFeatureExtractor(reference.sr, reference.hop_length, comparator.N_MFCC)
+        self._dtw = dtw_alignment.IncrementalDTW(reference.mfcc) if words else None
+        self._aligned = np.zeros((comparator.N_MFCC, 0))
+        self._aligned_peak = -np.inf
+        self._blocks = queue.Queue()
+        self._worker = None
+        self._lock = threading.Lock()
+        self._failed = False
+        self._finished = False
+
+    def feed(self, samples: Any, sample_rate: int) -> None:
+        """Queue a block of captured audio for analysis."""
+        with self._lock:
+            if self._finished:
+                return
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, daemon=True)
+                self._worker.start()
+            self._blocks.put((samples, sample_rate))
+
+    def finish(self) -> Optional[List[Dict[str, Any]]]:
+        """Complete the comparison of the fed audio."""
+        with self._lock:
+            if self._finished:
+                return None
+            self._finished = True
+            worker = self._worker
+        if worker is None:
+            return None
+        self._blocks.put(None)
+        worker.join()
+        if self._failed or not self._extractor.n_samples:
+            return None
+
+        try:
+            recorded = self._extractor.finish()
+            if self._dtw is None:
+                return self._comparator._compare_by_seconds(self._reference, recorded)
+            self._align(recorded.mfcc, self._extractor.peak_db)
+            _, path = self._dtw.result()
+            return self._comparator._compare_by_words(self._reference, recorded, self._words, path=path)
+        except Exception as e:
+            print(f"Warning: Streaming comparison failed: {e}")
+            return None
+
+    def _run(self) -> None:
+        """Analyze queued blocks until finish queues the end marker."""
+        while True:
+            block = self._blocks.get()
+            if block is None:
+                return
+            if self._failed:
+                continue
+            try:
+                frames = self._extractor.feed(*block)
+                if self._dtw is None or not frames.shape[1]:
+                    continue
+                if self._extractor.peak_db == self._aligned_peak:
+                    self._dtw.append(frames)
+                    self._aligned = np.concatenate((self._aligned, frames), axis=1)
+                else:
+                    self._align(self._extractor.mfcc(), self._extractor.peak_db)
+            except Exception as e:
+                print(f"Warning: Streaming audio analysis stopped: {e}")
+                self._failed = True
+
+    def _align(self, features: Any, peak_db: float) -> None:
+        """Bring the incremental alignment in line with the recorded features so far."""
+        count = min(self._aligned.shape[1], features.shape[1])
+        changed = np.flatnonzero(np.abs(self._aligned[:, :count] - features[:, :count]).max(axis=0, initial=0.0) > 1e-6)
+        start = int(changed[0]) if len(changed) else count
+        self._dtw.truncate(start)
+        self._dtw.append(features[:, start:])
+        self._aligned = features
+        self._aligned_peak = peak_db
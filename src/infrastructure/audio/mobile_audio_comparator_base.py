@@ -4,7 +4,7 @@
 import os
 import re
 from math import ceil
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple
 
 from domain.services.audio_comparator import IAudioComparator
 
@@ -16,8 +16,10 @@ class MobileAudioComparatorBase(IAudioComparator):
         self,
         original_path: str,
         recorded_path: str,
-        reference_text: str = ""
+        reference_text: str = "",
+        recorded_audio: Optional[Tuple[Any, int]] = None
     ) -> List[Dict[str, Any]]:
+        # Scores come from file metadata, so captured samples are not used
         if not self.is_available():
             return [{"score": 0.0, "feedback": "Audio comparison not available"}]
 
@@ -0,0 +1,158 @@
+# Copyright 2026 The terCAD team. All rights reserved.
+# Use of this source code is governed by a CC BY-NC-ND 4.0 license that can be found in the LICENSE file.
+
+import hashlib
+import json
+import os
+import threading
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from infrastructure.audio.audio_features import AudioFeatures
+
+
+class ReferenceFeatureCache:
+    """
+    Content-addressed on-disk cache of reference audio features.
+
+    Entries are keyed by a hash of the file content and of the analysis
+    parameters. Each entry is an MFCC `.npy` file, memory-mapped on read,
+    plus a JSON sidecar with sample rate, hop length, length and speech
+    segments. Least recently used entries are evicted once the directory
+    grows past `max_bytes`.
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, cache_dir: str, max_bytes: int = 64 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._digests: Dict[Tuple[str, int, int], str] = {}
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def key(self, file_path: str, params: str) -> str:
+        """
+        Build the cache key of an audio file.
+
+        Args:
+            file_path: Reference audio file
+            params: Fingerprint of the analysis settings
+
+        Returns:
+            Hex digest of file content and parameters
+        """
+        stat = os.stat(file_path)
+        identity = (os.path.abspath(file_path), stat.st_size, stat.st_mtime_ns)
+        digest = self._digests.get(identity)
+        if digest is None:
+            content = hashlib.sha256()
+            with open(file_path, 'rb') as f:
+                for block in iter(lambda: f.read(1 << 20), b''):
+                    content.update(block)
+            digest = content.hexdigest()
+            self._digests[identity] = digest
+
+        return hashlib.sha256(f"{self.FORMAT_VERSION}:{params}:{digest}".encode('utf-8')).hexdigest()[:40]
+
+    def get(self, key: str) -> Optional[AudioFeatures]:
+        """Load an entry, or None when it is missing or unreadable."""
+        mfcc_path, meta_path = self._paths(key)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            mfcc = np.load(mfcc_path, mmap_mode='r')
+            # Mark as recently used for eviction
+            os.utime(meta_path)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return AudioFeatures(
+            mfcc=mfcc,
+            sr=meta['sr'],
+            hop_length=meta['hop_length'],
+            n_samples=meta['n_samples'],
+            speech_segments=[tuple(segment) for segment in meta['speech_segments']]
+        )
+
+    def put(self, key: str, features: AudioFeatures) -> None:
+        """Store an entry and evict old ones when over budget."""
+        mfcc_path, meta_path = self._paths(key)
+        meta = {
+            'sr': int(features.sr),
+            'hop_length': int(features.hop_length),
+            'n_samples': int(features.n_samples),
+            'speech_segments': [[int(start), int(end)] for start, end in features.speech_segments or []]
+        }
+
+        # Worker processes share the directory; each writer gets its own temporary files
+        suffix = f".{os.getpid()}.{threading.get_ident()}.tmp"
+        with self._lock:
+            try:
+                # The sidecar is written last; an entry without it is never read
+                with open(f"{mfcc_path}{suffix}", 'wb') as f:
+                    np.save(f, np.ascontiguousarray(features.mfcc, dtype=np.float32))
+                os.replace(f"{mfcc_path}{suffix}", mfcc_path)
+                with open(f"{meta_path}{suffix}", 'w', encoding='utf-8') as f:
+                    json.dump(meta, f)
+                os.replace(f"{meta_path}{suffix}", meta_path)
+            except OSError as e:
+                print(f"Warning: Could not cache audio features: {e}")
+                for path in (f"{mfcc_path}{suffix}", f"{meta_path}{suffix}"):
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+                return
+            self._evict()
+
+    def stats(self) -> Dict[str, int]:
+        """Get size and hit/miss/eviction counters for diagnostics."""
+        entries = self._entries()
+        return {
+            'entries': len(entries),
+            'bytes': sum(size for _, size, _ in entries),
+            'max_bytes': self.max_bytes,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions
+        }
+
+    def _paths(self, key: str) -> Tuple[str, str]:
+        base = os.path.join(self.cache_dir, key)
+        return f"{base}.npy", f"{base}.json"
+
+    def _entries(self):
+        """List (key, bytes, last used) of complete entries."""
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith('.json'):
+                continue
+            key = name[:-len('.json')]
+            mfcc_path, meta_path = self._paths(key)
+            try:
+                entries.append((key, os.path.getsize(mfcc_path) + os.path.getsize(meta_path), os.path.getmtime(meta_path)))
+            except OSError:
+                continue
+        return entries
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until the cache fits its budget."""
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        total = sum(size for _, size, _ in entries)
+        for key, size, _ in entries:
+            if total <= self.max_bytes:
+                break
+            for path in reversed(self._paths(key)):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            total -= size
+            self.evictions += 1
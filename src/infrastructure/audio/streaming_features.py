@@ -0,0 +1,173 @@
+# Copyright 2026 The terCAD team. All rights reserved.
+# Use of this source code is governed by a CC BY-NC-ND 4.0 license that can be found in the LICENSE file.
+
+from typing import Any, List
+
+import numpy as np
+import librosa
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy.fft import dct
+
+from infrastructure.audio.audio_features import AudioFeatures
+
+
+class StreamingFeatureExtractor:
+    """
+    Online MFCC and voice activity analysis of captured audio blocks.
+
+    Blocks are resampled to the analysis rate and cut into the same centered
+    frames as librosa.feature.mfcc, so the final matrix equals the offline
+    MFCCs of the whole signal. The 80 dB dynamic range clip of the offline
+    path depends on the loudest frame of the recording, so MFCCs are always
+    relative to the loudest frame seen so far (`peak_db`); earlier frames can
+    change when it rises.
+
+    Voice activity is an energy gate per frame: a frame is speech when it is
+    VAD_MARGIN_DB above the quietest frame so far and above VAD_MIN_DB.
+    """
+
+    N_FFT = 2048
+    N_MELS = 128
+    TOP_DB = 80.0
+    VAD_MARGIN_DB = 12.0
+    VAD_MIN_DB = -50.0
+    VAD_FLOOR_DB = -90.0
+
+    def __init__(self, sr: int = 16000, hop_length: int = 512, n_mfcc: int = 13):
+        self.sr = sr
+        self.hop_length = hop_length
+        self.n_mfcc = n_mfcc
+        self.n_samples = 0
+        self._window = librosa.filters.get_window('hann', self.N_FFT, fftbins=True)
+        self._mel_basis = librosa.filters.mel(sr=sr, n_fft=self.N_FFT, n_mels=self.N_MELS)
+        self._resampler = None
+        self._input_sr = None
+        # Unconsumed samples, starting with the centering pad of the first frame
+        self._buffer = np.zeros(self.N_FFT // 2, dtype=np.float32)
+        self._log_mel: List[Any] = []
+        self._frame_db: List[Any] = []
+        self.peak_db = -np.inf
+        self._finished = False
+
+    @property
+    def frame_count(self) -> int:
+        """Number of frames analyzed so far."""
+        return sum(chunk.shape[1] for chunk in self._log_mel)
+
+    def feed(self, samples: Any, sample_rate: int) -> Any:
+        """
+        Analyze a captured block.
+
+        Args:
+            samples: PCM block, int16 or float, mono or of shape (n, 1)
+            sample_rate: Capture sample rate in Hz
+
+        Returns:
+            MFCC frames completed by this block relative to the current peak,
+            shape (n_mfcc, k)
+        """
+        if self._finished:
+            raise RuntimeError("Stream is already finished")
+        return self._consume(self._resample(self._to_float(samples), sample_rate))
+
+    def finish(self) -> AudioFeatures:
+        """
+        Flush the remaining frames and get the features of the whole recording.
+
+        Returns:
+            AudioFeatures with the exact MFCCs and detected speech segments
+        """
+        if not self._finished:
+            if self._resampler is not None:
+                self._consume(self._resampler.resample_chunk(np.zeros(0, dtype=np.float32), last=True))
+            self._finished = True
+            # Trailing centering pad completes the last 1 + n_samples // hop frames
+            self._emit(np.concatenate((self._buffer, np.zeros(self.N_FFT // 2, dtype=np.float32))))
+
+        return AudioFeatures(
+            mfcc=self.mfcc(),
+            sr=self.sr,
+            hop_length=self.hop_length,
+            n_samples=self.n_samples,
+            speech_segments=self.speech_segments()
+        )
+
+    def mfcc(self) -> Any:
+        """MFCCs of every frame so far relative to the current peak, shape (n_mfcc, frames)."""
+        if not self._log_mel:
+            return np.zeros((self.n_mfcc, 0), dtype=np.float32)
+        return self._mfcc(np.concatenate(self._log_mel, axis=1), self.peak_db)
+
+    def speech_flags(self) -> Any:
+        """Voice activity per frame."""
+        frame_db = np.concatenate(self._frame_db) if self._frame_db else np.zeros(0)
+        if not len(frame_db):
+            return np.zeros(0, dtype=bool)
+        floor = max(float(frame_db.min()), self.VAD_FLOOR_DB)
+        return (frame_db > floor + self.VAD_MARGIN_DB) & (frame_db > self.VAD_MIN_DB)
+
+    def speech_segments(self) -> List[tuple]:
+        """Voiced (start_ms, end_ms) ranges of the frames analyzed so far."""
+        flags = self.speech_flags()
+        if not flags.any():
+            return []
+        edges = np.flatnonzero(np.diff(np.concatenate(([0], flags.astype(np.int8), [0]))))
+        ms_per_frame = self.hop_length * 1000.0 / self.sr
+        total_ms = self.n_samples * 1000.0 / self.sr
+        return [
+            (int(round(start * ms_per_frame)), int(round(min(end * ms_per_frame, total_ms))))
+            for start, end in zip(edges[::2], edges[1::2])
+        ]
+
+    def _to_float(self, samples: Any) -> Any:
+        """Convert a block to mono float32 in [-1, 1]."""
+        samples = np.asarray(samples)
+        if samples.ndim > 1:
+            samples = samples.mean(axis=1) if samples.shape[1] > 1 else samples[:, 0]
+        if np.issubdtype(samples.dtype, np.integer):
+            return samples.astype(np.float32) / float(np.iinfo(samples.dtype).max + 1)
+        return samples.astype(np.float32, copy=False)
+
+    def _resample(self, samples: Any, sample_rate: int) -> Any:
+        """Convert a block to the analysis rate, keeping the resampler state between blocks."""
+        if sample_rate == self.sr:
+            return samples
+        if self._resampler is None:
+            import soxr
+            # Same quality as librosa.load's default 'soxr_hq'
+            self._resampler = soxr.ResampleStream(sample_rate, self.sr, 1, dtype='float32', quality='HQ')
+            self._input_sr = sample_rate
+        elif sample_rate != self._input_sr:
+            raise ValueError(f"Sample rate changed from {self._input_sr} to {sample_rate}")
+        return self._resampler.resample_chunk(samples)
+
+    def _consume(self, samples: Any) -> Any:
+        """Append samples and analyze every frame they complete."""
+        self.n_samples += len(samples)
+        return self._emit(np.concatenate((self._buffer, samples)))
+
+    def _emit(self, buffer: Any) -> Any:
+        """Analyze complete frames at the start of the buffer and keep the rest."""
+        count = (len(buffer) - self.N_FFT) // self.hop_length + 1 if len(buffer) >= self.N_FFT else 0
+        if self._finished:
+            # Only frames centered on recorded samples exist offline
+            count = min(count, 1 + self.n_samples // self.hop_length - self.frame_count)
+        if count <= 0:
+            self._buffer = buffer
+            return np.zeros((self.n_mfcc, 0), dtype=np.float32)
+
+        frames = sliding_window_view(buffer, self.N_FFT)[:count * self.hop_length:self.hop_length]
+        power = np.abs(np.fft.rfft(frames * self._window, axis=1)) ** 2
+        mel = self._mel_basis @ power.T.astype(np.float32)
+        log_mel = 10.0 * np.log10(np.maximum(mel, 1e-10))
+        self._buffer = buffer[count * self.hop_length:]
+
+        self.peak_db = max(self.peak_db, float(log_mel.max()))
+        self._log_mel.append(log_mel)
+        self._frame_db.append(10.0 * np.log10(np.maximum(np.mean(np.square(frames), axis=1), 1e-10)))
+        return self._mfcc(log_mel, self.peak_db)
+
+    def _mfcc(self, log_mel: Any, max_db: float) -> Any:
+        """MFCCs of log-mel frames clipped to TOP_DB below the given peak."""
+        clipped = np.maximum(log_mel, max_db - self.TOP_DB)
+        return dct(clipped, axis=0, type=2, norm='ortho')[:self.n_mfcc]
@@ -0,0 +1,194 @@
+# Copyright 2026 The terCAD team. All rights reserved.
+# Use of this source code is governed by a CC BY-NC-ND 4.0 license that can be found in the LICENSE file.
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+from application.services.media_service import ITtsAudioCache
+
+
+class TtsAudioCache(ITtsAudioCache):
+    """
+    Content-addressed on-disk cache of generated speech.
+
+    Entries are keyed by a hash of (text, lang), so the same word spoken in
+    different languages never collides and a word shared by language pairs is
+    stored once. Clips live in `<key[:2]>/<key>.mp3` files; an SQLite index
+    next to them tracks size, last access and hit count of each entry. Least
+    recently used entries are evicted once the clips grow past `max_bytes`.
+
+    Reads only query the index: access times and hit counts are collected in
+    memory and written in one transaction on the next put, stats or close.
+    """
+
+    FORMAT_VERSION = 1
+    INDEX_FILE = 'index.db'
+
+    def __init__(self, cache_dir: str, max_bytes: int = 100 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        # Unwritten reads: key -> (last access, hit count)
+        self._accesses: Dict[str, Tuple[float, int]] = {}
+        os.makedirs(cache_dir, exist_ok=True)
+        # One connection shared by prefetch threads; access is serialized by _lock
+        self._db = sqlite3.connect(os.path.join(cache_dir, self.INDEX_FILE), check_same_thread=False)
+        self._db.executescript("""
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                text TEXT NOT NULL,
+                lang TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created REAL NOT NULL,
+                last_access REAL NOT NULL,
+                hit_count INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE INDEX IF NOT EXISTS idx_entries_last_access ON entries(last_access);
+        """)
+        self._db.commit()
+
+    def key(self, text: str, lang: str) -> str:
+        """Build the cache key of a text spoken in a language."""
+        identity = f"{self.FORMAT_VERSION}:{lang.lower()}:{text}"
+        return hashlib.sha256(identity.encode('utf-8')).hexdigest()[:40]
+
+    def get(self, text: str, lang: str) -> Optional[str]:
+        """Get the cached clip path and mark it as recently used, or None on a miss."""
+        key = self.key(text, lang)
+        path = self._path(key)
+        with self._lock:
+            row = self._db.execute('SELECT size FROM entries WHERE key = ?', (key,)).fetchone()
+            if row is None or not self._is_complete(path, row[0]):
+                if row is not None:
+                    # Removed or damaged outside of the cache
+                    self._accesses.pop(key, None)
+                    self._db.execute('DELETE FROM entries WHERE key = ?', (key,))
+                    self._db.commit()
+                self.misses += 1
+                return None
+            _, hit_count = self._accesses.get(key, (0.0, 0))
+            self._accesses[key] = (time.time(), hit_count + 1)
+            self.hits += 1
+        return path
+
+    def put(self, text: str, lang: str, audio: bytes) -> Optional[str]:
+        """Store a clip, evict old ones when over budget and return its path."""
+        key = self.key(text, lang)
+        path = self._path(key)
+        now = time.time()
+        with self._lock:
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                # The index row is written last; a clip without it is never read
+                with open(f"{path}.tmp", 'wb') as f:
+                    f.write(audio)
+                os.replace(f"{path}.tmp", path)
+                # A replaced entry starts counting again
+                self._accesses.pop(key, None)
+                self._write_accesses()
+                self._db.execute(
+                    'INSERT OR REPLACE INTO entries (key, text, lang, size, created, last_access, hit_count) '
+                    'VALUES (?, ?, ?, ?, ?, ?, 0)',
+                    (key, text, lang.lower(), len(audio), now, now)
+                )
+                self._db.commit()
+            except (OSError, sqlite3.Error) as e:
+                print(f"Warning: Could not cache TTS audio: {e}")
+                return None
+            self._evict(keep=key)
+        return path
+
+    def stats(self) -> Dict:
+        """Get size, usage and hit/miss/eviction counters for sizing the budget."""
+        with self._lock:
+            try:
+                self._write_accesses()
+                self._db.commit()
+            except sqlite3.Error as e:
+                print(f"Warning: Could not update TTS cache index: {e}")
+            entries, total, hit_count = self._db.execute(
+                'SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(hit_count), 0) FROM entries'
+            ).fetchone()
+            # Entries never read back since they were generated
+            unused_entries, unused_bytes = self._db.execute(
+                'SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries WHERE hit_count = 0'
+            ).fetchone()
+            languages = {
+                lang: {'entries': count, 'bytes': size}
+                for lang, count, size in self._db.execute(
+                    'SELECT lang, COUNT(*), SUM(size) FROM entries GROUP BY lang ORDER BY lang'
+                )
+            }
+        lookups = self.hits + self.misses
+        return {
+            'entries': entries,
+            'bytes': total,
+            'max_bytes': self.max_bytes,
+            'average_bytes': total // entries if entries else 0,
+            'unused_entries': unused_entries,
+            'unused_bytes': unused_bytes,
+            'total_hit_count': hit_count,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'languages': languages
+        }
+
+    def close(self) -> None:
+        """Write pending reads and close the index connection."""
+        with self._lock:
+            try:
+                self._write_accesses()
+                self._db.commit()
+            except sqlite3.Error as e:
+                print(f"Warning: Could not update TTS cache index: {e}")
+            self._db.close()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], f"{key}.mp3")
+
+    @staticmethod
+    def _is_complete(path: str, size: int) -> bool:
+        try:
+            return size > 0 and os.path.getsize(path) == size
+        except OSError:
+            return False
+
+    def _write_accesses(self) -> None:
+        """Add pending reads to the index; the caller commits."""
+        if not self._accesses:
+            return
+        self._db.executemany(
+            'UPDATE entries SET last_access = MAX(last_access, ?), hit_count = hit_count + ? WHERE key = ?',
+            [(last_access, hit_count, key) for key, (last_access, hit_count) in self._accesses.items()]
+        )
+        self._accesses.clear()
+
+    def _evict(self, keep: str) -> None:
+        """Remove least recently used entries (but `keep`) until the cache fits its budget."""
+        total = self._db.execute('SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        evicted = []
+        for key, size in self._db.execute(
+            'SELECT key, size FROM entries WHERE key != ? ORDER BY last_access', (keep,)
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+            evicted.append((key,))
+            total -= size
+        self._db.executemany('DELETE FROM entries WHERE key = ?', evicted)
+        self._db.commit()
+        self.evictions += len(evicted)
@@ -0,0 +1,162 @@
+# Copyright 2026 The terCAD team. All rights reserved.
+# Use of this source code is governed by a CC BY-NC-ND 4.0 license that can be found in the LICENSE file.
+
+import json
+import os
+import threading
+import time
+from typing import Callable, Dict
+
+from application.services.media_service import ITtsFailureTracker
+
+
+class TtsFailureTracker(ITtsFailureTracker):
+    """
+    Negative cache and circuit breaker for TTS generation, persisted as JSON.
+
+    A failed (text, lang) is not requested again for `base_backoff` seconds,
+    doubling with each further failure up to `max_backoff`. After
+    `failure_threshold` consecutive network failures of any words the circuit
+    opens and every request fails fast for `cooldown` seconds, doubling per
+    trip up to `max_cooldown`. Once the cooldown passed a single probe request
+    is let through (half-open); its outcome closes or re-opens the circuit.
+
+    Responses without audio only back off their word, since the service was
+    reachable. State is saved on every change, so an app restarted while
+    offline keeps failing fast.
+    """
+
+    FORMAT_VERSION = 1
+    MAX_KEYS = 5000
+
+    def __init__(
+        self,
+        state_path: str,
+        base_backoff: float = 30.0,
+        max_backoff: float = 24 * 3600.0,
+        failure_threshold: int = 3,
+        cooldown: float = 30.0,
+        max_cooldown: float = 600.0,
+        probe_timeout: float = 30.0,
+        clock: Callable[[], float] = time.time
+    ):
+        self.state_path = state_path
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.probe_timeout = probe_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        # key -> {'failures': count, 'retry_at': timestamp}
+        self._keys: Dict[str, Dict] = {}
+        self._consecutive_failures = 0
+        self._trips = 0
+        self._open_until = 0.0
+        # In-memory only: a probe interrupted by a restart must not block the next one
+        self._probe_until = 0.0
+        self._load()
+
+    def allow(self, text: str, lang: str) -> bool:
+        """Check whether a request may be sent now."""
+        now = self._clock()
+        with self._lock:
+            entry = self._keys.get(self._key(text, lang))
+            if entry is not None and now < entry['retry_at']:
+                return False
+            if self._trips:
+                if now < self._open_until or now < self._probe_until:
+                    return False
+                # Half-open: this request probes the service, others wait for its outcome
+                self._probe_until = now + self.probe_timeout
+            return True
+
+    def record_success(self, text: str, lang: str) -> None:
+        """Forget failures of a key and close the circuit."""
+        with self._lock:
+            known = self._keys.pop(self._key(text, lang), None) is not None
+            changed = known or self._trips or self._consecutive_failures
+            self._consecutive_failures = 0
+            self._trips = 0
+            self._open_until = 0.0
+            self._probe_until = 0.0
+            if changed:
+                self._save()
+
+    def record_failure(self, text: str, lang: str, network: bool = True) -> None:
+        """Back off a key; network failures count towards opening the circuit."""
+        now = self._clock()
+        with self._lock:
+            key = self._key(text, lang)
+            failures = self._keys.get(key, {}).get('failures', 0) + 1
+            backoff = min(self.base_backoff * 2 ** (failures - 1), self.max_backoff)
+            self._keys[key] = {'failures': failures, 'retry_at': now + backoff}
+            if len(self._keys) > self.MAX_KEYS:
+                # Forget the keys that would be retried first
+                for stale in sorted(self._keys, key=lambda k: self._keys[k]['retry_at'])[:len(self._keys) - self.MAX_KEYS]:
+                    del self._keys[stale]
+
+            if network:
+                self._consecutive_failures += 1
+                if self._trips or self._consecutive_failures >= self.failure_threshold:
+                    # Opens the circuit, or re-opens it after a failed probe
+                    self._trips += 1
+                    self._open_until = now + min(self.cooldown * 2 ** (self._trips - 1), self.max_cooldown)
+                    self._probe_until = 0.0
+            self._save()
+
+    def stats(self) -> Dict:
+        """Get backed off keys and circuit state for diagnostics."""
+        now = self._clock()
+        with self._lock:
+            return {
+                'backed_off': sum(1 for entry in self._keys.values() if now < entry['retry_at']),
+                'tracked': len(self._keys),
+                'consecutive_failures': self._consecutive_failures,
+                'circuit_open': bool(self._trips) and now < self._open_until,
+                'open_until': self._open_until if self._trips else None,
+                'trips': self._trips
+            }
+
+    @staticmethod
+    def _key(text: str, lang: str) -> str:
+        return f"{lang.lower()}:{text}"
+
+    def _load(self) -> None:
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            if state.get('version') != self.FORMAT_VERSION:
+                return
+            self._keys = {
+                key: {'failures': int(entry['failures']), 'retry_at': float(entry['retry_at'])}
+                for key, entry in state['keys'].items()
+            }
+            self._consecutive_failures = int(state['consecutive_failures'])
+            self._trips = int(state['trips'])
+            self._open_until = float(state['open_until'])
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            print(f"Warning: Could not load TTS failure state: {e}")
+            self._keys = {}
+            self._consecutive_failures = 0
+            self._trips = 0
+            self._open_until = 0.0
+
+    def _save(self) -> None:
+        state = {
+            'version': self.FORMAT_VERSION,
+            'keys': self._keys,
+            'consecutive_failures': self._consecutive_failures,
+            'trips': self._trips,
+            'open_until': self._open_until
+        }
+        try:
+            os.makedirs(os.path.dirname(self.state_path) or '.', exist_ok=True)
+            with open(f"{self.state_path}.tmp", 'w', encoding='utf-8') as f:
+                json.dump(state, f, ensure_ascii=False)
+            os.replace(f"{self.state_path}.tmp", self.state_path)
+        except OSError as e:
+            print(f"Warning: Could not save TTS failure state: {e}")
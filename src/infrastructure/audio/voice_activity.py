@@ -0,0 +1,112 @@
+# Copyright 2026 The terCAD team. All rights reserved.
+# Use of this source code is governed by a CC BY-NC-ND 4.0 license that can be found in the LICENSE file.
+
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+
+
+class VoiceActivityDetector:
+    """
+    Energy and zero-crossing voice activity detection of captured blocks.
+
+    A block is speech when its level is MARGIN_DB above the noise floor and
+    above MIN_DB, or, for unvoiced sounds such as /s/ and /f/ that are quiet
+    but noisy, FRICATIVE_MARGIN_DB above the floor with a zero-crossing rate of
+    at least FRICATIVE_ZCR. The noise floor is a low percentile of the block
+    levels so far, so it follows the room rather than single quiet blocks.
+    Speech starts after MIN_SPEECH seconds of consecutive speech blocks, so
+    clicks and bumps do not count.
+    """
+
+    MARGIN_DB = 12.0
+    MIN_DB = -50.0
+    FRICATIVE_MARGIN_DB = 6.0
+    FRICATIVE_ZCR = 0.3
+    FLOOR_PERCENTILE = 10
+    # Digital silence (e.g. the first blocks of a stream) says nothing about the room
+    SILENCE_DB = -90.0
+    MIN_SPEECH = 0.06  # seconds
+
+    def __init__(self, sample_rate: int):
+        self.sample_rate = sample_rate
+        self.n_samples = 0
+        self.speech_start: Optional[int] = None
+        self.speech_end: Optional[int] = None
+        self._levels: List[float] = []
+        self._run_start: Optional[int] = None
+
+    @property
+    def speech_detected(self) -> bool:
+        return self.speech_start is not None
+
+    @property
+    def trailing_silence(self) -> float:
+        """Seconds since the last speech block (0 before speech starts)."""
+        if self.speech_end is None:
+            return 0.0
+        return (self.n_samples - self.speech_end) / self.sample_rate
+
+    @property
+    def noise_floor_db(self) -> Optional[float]:
+        if not self._levels:
+            return None
+        return float(np.percentile(self._levels, self.FLOOR_PERCENTILE))
+
+    def process(self, samples: Any) -> bool:
+        """
+        Classify the next captured block.
+
+        Args:
+            samples: PCM block, int16 or float, mono or of shape (n, 1)
+
+        Returns:
+            Whether the block is speech
+        """
+        x = np.asarray(samples)
+        if x.ndim > 1:
+            x = x[:, 0]
+        if np.issubdtype(x.dtype, np.integer):
+            x = x.astype(np.float32) / float(np.iinfo(x.dtype).max + 1)
+        start = self.n_samples
+        self.n_samples += len(x)
+        if not len(x):
+            return False
+
+        level_db = 10.0 * np.log10(max(float(np.mean(np.square(x, dtype=np.float64))), 1e-10))
+        zcr = float(np.mean(np.signbit(x[1:]) != np.signbit(x[:-1]))) if len(x) > 1 else 0.0
+        if level_db > self.SILENCE_DB:
+            self._levels.append(level_db)
+        floor = self.noise_floor_db
+        floor = level_db if floor is None else floor
+
+        speech = level_db > self.MIN_DB and (
+            level_db > floor + self.MARGIN_DB
+            or (zcr >= self.FRICATIVE_ZCR and level_db > floor + self.FRICATIVE_MARGIN_DB)
+        )
+        if not speech:
+            self._run_start = None
+            return False
+
+        if self._run_start is None:
+            self._run_start = start
+        if self.speech_start is None and self.n_samples - self._run_start >= self.MIN_SPEECH * self.sample_rate:
+            self.speech_start = self._run_start
+        if self.speech_start is not None:
+            self.speech_end = self.n_samples
+        return True
+
+    def speech_bounds(self, padding: float = 0.0) -> Tuple[int, int]:
+        """
+        Sample range of the speech so far, widened by padding on both sides.
+
+        Args:
+            padding: Seconds of audio kept around the speech
+
+        Returns:
+            (start, end) sample indices; the whole input when no speech was found
+        """
+        if self.speech_start is None:
+            return 0, self.n_samples
+        pad = int(padding * self.sample_rate)
+        return max(0, self.speech_start - pad), min(self.n_samples, self.speech_end + pad)
@@ -1,10 +1,11 @@
 # Copyright 2025 The terCAD team. All rights reserved.
 # Use of this source code is governed by a CC BY-NC-ND 4.0 license that can be found in the LICENSE file.
 
-from typing import Optional
+from typing import Callable, Optional
 import kivy.resources
 import os
 import sys
+import threading
 
 from lib.ini_config_parser import IniConfigParser
 from kivy.utils import platform
@@ -51,6 +52,11 @@ class DependencyContainer:
     def __init__(self, user_data_dir: str):
         self._user_data_dir = user_data_dir
         self._instances = {}
+        self._lock = threading.Lock()
+        self._creation_locks = {}
+        self._audio_loader = None
+        self._audio_loaded = threading.Event()
+        self._audio_callbacks = []
 
         # Setup resource paths early (needed for database schema loading)
         self._setup_resource_paths()
@@ -66,9 +72,13 @@ class DependencyContainer:
         kivy.resources.resource_add_path(persistence_dir)
 
     def _get_or_create(self, key: str, factory):
-        """Get or create a singleton instance."""
+        """Get or create a singleton instance (also from the audio loading thread)."""
         if key not in self._instances:
-            self._instances[key] = factory()
+            with self._lock:
+                creation_lock = self._creation_locks.setdefault(key, threading.RLock())
+            with creation_lock:
+                if key not in self._instances:
+                    self._instances[key] = factory()
         return self._instances[key]
 
     def database(self) -> DatabaseConnection:
@@ -164,7 +174,9 @@ class DependencyContainer:
 
             try:
                 from infrastructure.audio.librosa_audio_comparator import LibrosaAudioComparator
-                return LibrosaAudioComparator()
+                from infrastructure.audio.reference_feature_cache import ReferenceFeatureCache
+                feature_cache = ReferenceFeatureCache(os.path.join(self._user_data_dir, 'audio_features'))
+                return LibrosaAudioComparator(feature_cache)
             except Exception as e:
                 print(f"⚠️  Audio comparator disabled due to error: {e}")
                 return None
@@ -174,6 +186,103 @@ class DependencyContainer:
             create_audio_comparator
         )
 
+    def comparison_executor(self):
+        """Get the worker-process comparison executor (desktop only, None elsewhere)."""
+        def create_comparison_executor():
+            if platform in ('android', 'ios'):
+                return None
+            comparator = self.audio_comparator()
+            try:
+                from infrastructure.audio.librosa_audio_comparator import LibrosaAudioComparator
+                from infrastructure.audio.comparison_executor import ComparisonExecutor
+                if not isinstance(comparator, LibrosaAudioComparator) or not comparator.is_available():
+                    return None
+                executor = ComparisonExecutor(
+                    os.path.join(self._user_data_dir, 'audio_features'),
+                    alignment=comparator.alignment
+                )
+                executor.warm_up()
+                return executor
+            except Exception as e:
+                print(f"⚠️  Comparison workers disabled due to error: {e}")
+                return None
+
+        return self._get_or_create(
+            'comparison_executor',
+            create_comparison_executor
+        )
+
+    def load_audio_services(self, on_ready: Optional[Callable[[], None]] = None) -> None:
+        """
+        Load the recording and comparison stacks on a background thread.
+
+        The first call starts loading the recorder backend, the audio comparator
+        and the comparison workers; later calls only register callbacks. The
+        comparator is preloaded after the callbacks ran, so recording is
+        available before the analysis libraries are warm.
+
+        Args:
+            on_ready: Optional callback, called on the loading thread once the
+                services are resolved (right away when they already are)
+        """
+        with self._lock:
+            ready = self._audio_loaded.is_set()
+            if not ready:
+                if on_ready is not None:
+                    self._audio_callbacks.append(on_ready)
+                if self._audio_loader is None:
+                    self._audio_loader = threading.Thread(target=self._load_audio_services, daemon=True)
+                    self._audio_loader.start()
+        if ready and on_ready is not None:
+            on_ready()
+
+    def _load_audio_services(self):
+        """Resolve the audio services, notify waiting callbacks, then warm up the comparator."""
+        comparator = None
+        try:
+            self.recorder_service().warm_up()
+            # Resolves the comparator too; worker processes start while the comparator preloads
+            self.comparison_executor()
+            comparator = self.audio_comparator()
+        except Exception as e:
+            print(f"⚠️  Audio services failed to load: {e}")
+        finally:
+            with self._lock:
+                self._audio_loaded.set()
+                callbacks, self._audio_callbacks = self._audio_callbacks, []
+            for callback in callbacks:
+                try:
+                    callback()
+                except Exception as e:
+                    print(f"Warning: Audio services callback failed: {e}")
+
+        if comparator is not None:
+            try:
+                comparator.preload()
+            except Exception as e:
+                print(f"Warning: Audio comparator preload failed: {e}")
+
+    def shutdown(self):
+        """Release background resources (worker processes, HTTP connections, cache index, audio packs)."""
+        creation_lock = self._creation_locks.get('comparison_executor')
+        if creation_lock is not None:
+            # Wait for a comparison executor still being created by the loading thread
+            with creation_lock:
+                pass
+        executor = self._instances.pop('comparison_executor', None)
+        if executor is not None:
+            executor.shutdown()
+        session = self._instances.pop('http_session', None)
+        if session is not None:
+            session.close()
+        audio_cache = self._instances.pop('tts_audio_cache', None)
+        if audio_cache is not None:
+            audio_cache.close()
+        for key in [key for key in self._instances if key.startswith('audio_pack:')]:
+            audio_pack = self._instances.pop(key)
+            if audio_pack is not None:
+                audio_pack.close()
+
     def recorder_controller(self) -> IRecorderController:
         """Get platform-specific recorder controller."""
         if platform == 'android':
@@ -184,7 +293,13 @@ class DependencyContainer:
             return RecorderControllerIos()
         else:
             from controller.recorder_controller_desktop import RecorderControllerDesktop
-            return RecorderControllerDesktop()
+            # Seconds of trailing silence that end a recording; 0 records until stopped
+            try:
+                auto_stop_silence = float(self.config_repository().get_app_setting('recording_auto_stop_silence', '1.5'))
+            except ValueError:
+                auto_stop_silence = 1.5
+            trim_silence = self.config_repository().get_app_setting('recording_trim_silence', '1') != '0'
+            return RecorderControllerDesktop(auto_stop_silence or None, trim_silence)
 
     # Use Cases
     def load_vocabulary_use_case(self) -> LoadVocabularyUseCase:
@@ -248,7 +363,59 @@ class DependencyContainer:
 
     def media_service(self, lang: str = 'en', audio_dir: str = 'assets/data/EN/audio/') -> MediaService:
         """Get media service instance."""
-        return MediaService(lang, audio_dir, self.audio_playback_backend())
+        return MediaService(
+            lang,
+            audio_dir,
+            self.audio_playback_backend(),
+            self.http_session(),
+            audio_cache=self.tts_audio_cache(),
+            failure_tracker=self.tts_failure_tracker(),
+            audio_pack=self.audio_pack(lang)
+        )
+
+    def audio_pack(self, locale: str):
+        """Get the memory-mapped audio pack of a locale, or None without one."""
+        def create_audio_pack():
+            pack_path = self.resource_repository().get_audio_pack(locale)
+            if not pack_path:
+                return None
+            try:
+                from infrastructure.audio.audio_pack import AudioPack
+                return AudioPack(pack_path, os.path.join(self._user_data_dir, 'audio_pack'))
+            except (OSError, ValueError) as e:
+                print(f"⚠️  Audio pack {pack_path} unavailable: {e}")
+                return None
+
+        return self._get_or_create(f'audio_pack:{locale}', create_audio_pack)
+
+    def tts_audio_cache(self):
+        """Get the on-disk cache of generated speech shared by media services."""
+        def create_tts_audio_cache():
+            from infrastructure.audio.tts_audio_cache import TtsAudioCache
+            # Byte budget of generated speech; least recently played clips go first
+            try:
+                max_mb = float(self.config_repository().get_app_setting('tts_cache_max_mb', '100'))
+            except ValueError:
+                max_mb = 100
+            return TtsAudioCache(os.path.join(self._user_data_dir, 'tts_cache'), int(max_mb * 1024 * 1024))
+
+        return self._get_or_create('tts_audio_cache', create_tts_audio_cache)
+
+    def tts_failure_tracker(self):
+        """Get the persisted TTS failure backoff and circuit breaker shared by media services."""
+        def create_tts_failure_tracker():
+            from infrastructure.audio.tts_failure_tracker import TtsFailureTracker
+            return TtsFailureTracker(os.path.join(self._user_data_dir, 'tts_cache', 'failures.json'))
+
+        return self._get_or_create('tts_failure_tracker', create_tts_failure_tracker)
+
+    def http_session(self):
+        """Get the keep-alive HTTP session shared by network clients (TTS)."""
+        def create_http_session():
+            import requests
+            return requests.Session()
+
+        return self._get_or_create('http_session', create_http_session)
 
     def audio_playback_backend(self):
         """Get platform-specific audio playback backend."""
@@ -0,0 +1,137 @@
+# Copyright 2026 The terCAD team. All rights reserved.
+# Use of this source code is governed by a CC BY-NC-ND 4.0 license that can be found in the LICENSE file.
+
+import numpy as np
+from typing import Dict, Iterable, Optional
+
+
+class EmbeddingMatrix:
+    """
+    Contiguous matrix of L2-normalized word embeddings.
+
+    Rows are appended incrementally (amortized growth), so cosine similarity
+    of many words against the whole vocabulary is a single matrix product.
+    Stored as float32 to halve memory of large vocabularies.
+    """
+
+    dtype = np.float32
+
+    def __init__(self, dim: int, chunk_elements: int = 1 << 22):
+        self.dim = dim
+        # Upper bound of similarity cells held in memory at once
+        self.chunk_elements = chunk_elements
+
+        self._data = np.zeros((0, dim), dtype=self.dtype)
+        self._valid = np.zeros(0, dtype=bool)
+        self._size = 0
+        self._index: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, word: str) -> bool:
+        return word in self._index
+
+    @property
+    def vectors(self) -> np.ndarray:
+        """Normalized embeddings, one row per word."""
+        return self._data[:self._size]
+
+    @property
+    def valid(self) -> np.ndarray:
+        """Flags of rows holding a non-zero embedding."""
+        return self._valid[:self._size]
+
+    def index_of(self, word: str) -> Optional[int]:
+        """Get the row of a word, if present."""
+        return self._index.get(word)
+
+    def add(self, word: str, embedding: np.ndarray) -> int:
+        """
+        Append (or replace) the embedding of a word.
+
+        Args:
+            word: Word the embedding belongs to
+            embedding: Raw (not normalized) embedding
+
+        Returns:
+            Row index of the word
+        """
+        row = self._index.get(word)
+        if row is None:
+            if self._size == len(self._data):
+                self._grow(max(16, 2 * len(self._data)))
+            row = self._size
+            self._size += 1
+            self._index[word] = row
+
+        norm = np.linalg.norm(embedding)
+        self._valid[row] = norm > 0
+        self._data[row] = embedding / norm if norm > 0 else 0.0
+        return row
+
+    def add_all(self, embeddings: Dict[str, np.ndarray]) -> None:
+        """Append several embeddings at once, normalizing them in bulk."""
+        new_words = []
+        for word, embedding in embeddings.items():
+            if word in self._index:
+                self.add(word, embedding)
+            else:
+                new_words.append(word)
+        if not new_words:
+            return
+
+        vectors = np.array([embeddings[word] for word in new_words], dtype=self.dtype)
+        norms = np.linalg.norm(vectors, axis=1)
+        valid = norms > 0
+        vectors[valid] /= norms[valid, np.newaxis]
+
+        start = self._size
+        end = start + len(new_words)
+        if end > len(self._data):
+            self._grow(end)
+        self._data[start:end] = vectors
+        self._valid[start:end] = valid
+        self._index.update((word, start + i) for i, word in enumerate(new_words))
+        self._size = end
+
+    def max_similarity(self, rows: Iterable[int]) -> np.ndarray:
+        """
+        Get the highest cosine similarity of each given row to any other row.
+
+        Zero embeddings are ignored on both sides, like an undefined cosine.
+
+        Args:
+            rows: Row indexes of the query words
+
+        Returns:
+            Max similarity per query row; -inf when there is nothing to compare
+        """
+        rows = np.asarray(list(rows), dtype=np.intp)
+        result = np.full(len(rows), -np.inf, dtype=self.dtype)
+        if not len(rows) or self._size < 2:
+            return result
+
+        matrix = self.vectors
+        invalid_columns = ~self.valid
+        step = max(1, self.chunk_elements // self._size)
+
+        for start in range(0, len(rows), step):
+            chunk = rows[start:start + step]
+            similarities = matrix[chunk] @ matrix.T
+            similarities[:, invalid_columns] = -np.inf
+            similarities[np.arange(len(chunk)), chunk] = -np.inf
+            chunk_max = similarities.max(axis=1)
+            chunk_max[~self._valid[chunk]] = -np.inf
+            result[start:start + step] = chunk_max
+
+        return result
+
+    def _grow(self, capacity: int) -> None:
+        """Reallocate storage to hold at least `capacity` rows."""
+        data = np.zeros((capacity, self.dim), dtype=self.dtype)
+        data[:self._size] = self.vectors
+        valid = np.zeros(capacity, dtype=bool)
+        valid[:self._size] = self._valid[:self._size]
+        self._data = data
+        self._valid = valid
@@ -0,0 +1,197 @@
+# Copyright 2026 The terCAD team. All rights reserved.
+# Use of this source code is governed by a CC BY-NC-ND 4.0 license that can be found in the LICENSE file.
+
+import numpy as np
+from pathlib import Path
+from typing import Iterable, Optional
+
+from infrastructure.ml.embedding_matrix import EmbeddingMatrix
+
+
+class LSHIndex:
+    """
+    Random-projection LSH index over the rows of an EmbeddingMatrix.
+
+    Each of `n_tables` tables hashes a vector to the signs of `n_bits` random
+    projections of the vector minus the data mean (character embeddings all
+    lie in one orthant, so uncentered hyperplanes barely split them).
+    Buckets are kept as codes sorted per table, so a lookup is a binary search
+    and the index persists as plain arrays. Rows added after the last merge
+    stay in a small unsorted tail that is scanned linearly.
+
+    Max similarity is computed exactly, but only against rows sharing a
+    bucket with the query, so it is approximate (never above the exact value).
+    """
+
+    def __init__(
+        self,
+        dim: int,
+        n_tables: int = 16,
+        n_bits: int = 12,
+        seed: int = 0,
+        merge_threshold: int = 1024
+    ):
+        self.dim = dim
+        self.n_tables = n_tables
+        self.n_bits = n_bits
+        self.merge_threshold = merge_threshold
+
+        rng = np.random.default_rng(seed)
+        self._planes = rng.standard_normal((n_tables, n_bits, dim))
+        self._center = np.zeros(dim, dtype=EmbeddingMatrix.dtype)
+        self._weights = (1 << np.arange(n_bits)).astype(np.int64)
+
+        # Sorted buckets: per table, row ids ordered by code
+        self._sorted_rows = np.zeros((n_tables, 0), dtype=np.int64)
+        self._sorted_codes = np.zeros((n_tables, 0), dtype=np.int64)
+        # Rows hashed since the last merge
+        self._tail_rows = np.zeros(0, dtype=np.int64)
+        self._tail_codes = np.zeros((n_tables, 0), dtype=np.int64)
+
+    def __len__(self) -> int:
+        return self._sorted_rows.shape[1] + len(self._tail_rows)
+
+    def hash(self, vectors: np.ndarray) -> np.ndarray:
+        """
+        Hash vectors in every table.
+
+        Args:
+            vectors: Matrix with one vector per row
+
+        Returns:
+            Codes of shape (n_tables, len(vectors))
+        """
+        projections = np.einsum('tbd,nd->tnb', self._planes, vectors - self._center)
+        return (projections > 0).astype(np.int64) @ self._weights
+
+    def build(self, matrix: EmbeddingMatrix) -> None:
+        """Index every row of the matrix, replacing previous content."""
+        if matrix.valid.any():
+            self._center = matrix.vectors[matrix.valid].mean(axis=0)
+        self._tail_rows = np.arange(len(matrix), dtype=np.int64)
+        self._tail_codes = self.hash(matrix.vectors)
+        self._sorted_rows = np.zeros((self.n_tables, 0), dtype=np.int64)
+        self._sorted_codes = np.zeros((self.n_tables, 0), dtype=np.int64)
+        self._merge()
+
+    def add(self, row: int, vector: np.ndarray) -> None:
+        """Index one matrix row."""
+        codes = self.hash(vector[np.newaxis, :])
+        self._tail_rows = np.append(self._tail_rows, row)
+        self._tail_codes = np.concatenate([self._tail_codes, codes], axis=1)
+        if len(self._tail_rows) >= self.merge_threshold:
+            self._merge()
+
+    def candidates(self, codes: np.ndarray) -> np.ndarray:
+        """
+        Get rows sharing at least one bucket with a query.
+
+        Args:
+            codes: Query codes of shape (n_tables,)
+
+        Returns:
+            Unique candidate row ids
+        """
+        bounds = self._bucket_bounds(codes[:, np.newaxis])
+        return self._gather(codes, bounds[0][:, 0], bounds[1][:, 0])
+
+    def max_similarity(self, matrix: EmbeddingMatrix, rows: Iterable[int]) -> np.ndarray:
+        """
+        Approximate `EmbeddingMatrix.max_similarity` using bucket candidates.
+
+        Args:
+            matrix: Matrix the index was built for
+            rows: Row indexes of the query words
+
+        Returns:
+            Max similarity per query row; -inf when no candidate is found
+        """
+        rows = np.asarray(list(rows), dtype=np.intp)
+        result = np.full(len(rows), -np.inf, dtype=matrix.dtype)
+        if not len(rows):
+            return result
+
+        vectors = matrix.vectors
+        valid = matrix.valid
+        codes = self.hash(vectors[rows])
+        lefts, rights = self._bucket_bounds(codes)
+        for i, row in enumerate(rows):
+            if not valid[row]:
+                continue
+            candidates = self._gather(codes[:, i], lefts[:, i], rights[:, i])
+            candidates = candidates[(candidates != row) & valid[candidates]]
+            if len(candidates):
+                result[i] = (vectors[candidates] @ vectors[row]).max()
+        return result
+
+    def save(self, path: str) -> None:
+        """Persist the index as a NumPy archive."""
+        self._merge()
+        with open(path, 'wb') as f:
+            np.savez(
+                f,
+                planes=self._planes,
+                center=self._center,
+                sorted_rows=self._sorted_rows,
+                sorted_codes=self._sorted_codes
+            )
+
+    @classmethod
+    def load(cls, path: str, expected_rows: Optional[int] = None) -> Optional['LSHIndex']:
+        """
+        Load a persisted index.
+
+        Args:
+            path: File written by `save`
+            expected_rows: Number of matrix rows the index must cover
+
+        Returns:
+            Index, or None when missing or out of date
+        """
+        if not Path(path).exists():
+            return None
+
+        with np.load(path) as data:
+            planes = data['planes']
+            n_tables, n_bits, dim = planes.shape
+            index = cls(dim, n_tables=n_tables, n_bits=n_bits)
+            index._planes = planes
+            index._center = data['center']
+            index._sorted_rows = data['sorted_rows']
+            index._sorted_codes = data['sorted_codes']
+
+        if expected_rows is not None and len(index) != expected_rows:
+            return None
+        return index
+
+    def _bucket_bounds(self, codes: np.ndarray):
+        """Locate the sorted bucket range of each query code in every table."""
+        lefts = np.empty(codes.shape, dtype=np.intp)
+        rights = np.empty(codes.shape, dtype=np.intp)
+        for table in range(self.n_tables):
+            lefts[table] = np.searchsorted(self._sorted_codes[table], codes[table], side='left')
+            rights[table] = np.searchsorted(self._sorted_codes[table], codes[table], side='right')
+        return lefts, rights
+
+    def _gather(self, codes: np.ndarray, lefts: np.ndarray, rights: np.ndarray) -> np.ndarray:
+        """Collect unique rows of the given bucket ranges and matching tail rows."""
+        parts = [self._sorted_rows[table, lefts[table]:rights[table]] for table in range(self.n_tables)]
+        if len(self._tail_rows):
+            matches = (self._tail_codes == codes[:, np.newaxis]).any(axis=0)
+            parts.append(self._tail_rows[matches])
+        return np.unique(np.concatenate(parts))
+
+    def _merge(self) -> None:
+        """Fold the unsorted tail into the sorted buckets."""
+        if not len(self._tail_rows):
+            return
+
+        tail_rows = np.broadcast_to(self._tail_rows, self._tail_codes.shape)
+        rows = np.concatenate([self._sorted_rows, tail_rows], axis=1)
+        codes = np.concatenate([self._sorted_codes, self._tail_codes], axis=1)
+        order = np.argsort(codes, axis=1, kind='stable')
+        self._sorted_rows = np.take_along_axis(rows, order, axis=1)
+        self._sorted_codes = np.take_along_axis(codes, order, axis=1)
+
+        self._tail_rows = np.zeros(0, dtype=np.int64)
+        self._tail_codes = np.zeros((self.n_tables, 0), dtype=np.int64)
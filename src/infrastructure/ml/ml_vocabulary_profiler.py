@@ -3,13 +3,16 @@
 
 import json
 import numpy as np
+import os
 import pickle
 import time
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Optional
 from domain.entities.vocabulary_item import VocabularyItem
 from domain.services.vocabulary_profiler import IVocabularyProfiler
-from infrastructure.ml.ml_embeddings import MLEmbeddings
+from infrastructure.ml.embedding_matrix import EmbeddingMatrix
+from infrastructure.ml.lsh_index import LSHIndex
+from infrastructure.ml.profile_event_log import ProfileEventLog, apply_answer
 
 
 class MLVocabularyProfiler(IVocabularyProfiler):
@@ -18,13 +21,21 @@ class MLVocabularyProfiler(IVocabularyProfiler):
     Uses embeddings and user history to prioritize vocabulary items.
 
     This is an infrastructure implementation of the domain interface.
+
+    Once the vocabulary reaches `ann_min_size` words, similarity is looked up
+    through an LSH index persisted next to the model (None disables it).
     """
 
-    def __init__(self, user_profile_path: str, model_path: str):
+    def __init__(self, user_profile_path: str, model_path: str, ann_min_size: Optional[int] = 20000):
         self.user_profile_path = user_profile_path
         self.model_path = model_path
+        self.embeddings_path = f"{model_path}.embeddings.npy"
+        self.words_path = f"{model_path}.words.json"
+        self.ann_index_path = f"{model_path}.lsh.npz"
+        self.ann_min_size = ann_min_size
 
-        # User interaction tracking
+        # User interaction tracking (snapshot + append-only answer log)
+        self._profile_log = ProfileEventLog(user_profile_path)
         self.user_history: Dict[str, Dict] = {}
         self.word_embeddings: Dict[str, np.ndarray] = {}
 
@@ -33,6 +44,11 @@ class MLVocabularyProfiler(IVocabularyProfiler):
         self.learning_rate = 0.01
         self.decay_factor = 0.95
 
+        # Normalized copy of word_embeddings for vectorized similarity
+        self._embedding_matrix = EmbeddingMatrix(self.embedding_dim)
+        self._ann_index: Optional[LSHIndex] = None
+        self._model_dirty = False
+
         # Difficulty scoring weights
         self.difficulty_weights = {
             'length': 0.2,
@@ -47,32 +63,34 @@ class MLVocabularyProfiler(IVocabularyProfiler):
 
     def mark_positive(self, item: VocabularyItem) -> None:
         """Mark a vocabulary item as correctly answered."""
-        word = item.origin
-        if word not in self.user_history:
-            self.user_history[word] = {
-                'correct': 0,
-                'incorrect': 0,
-                'last_seen': time.time()
-            }
-
-        self.user_history[word]['correct'] += 1
-        self.user_history[word]['last_seen'] = time.time()
-        self._save_user_profile()
+        self._record_answer(item.origin, correct=True)
 
     def mark_negative(self, item: VocabularyItem) -> None:
         """Mark a vocabulary item as incorrectly answered."""
-        word = item.origin
-        if word not in self.user_history:
-            self.user_history[word] = {
-                'correct': 0,
-                'incorrect': 0,
-                'last_seen': time.time()
-            }
-
-        self.user_history[word]['incorrect'] += 1
-        self.user_history[word]['last_seen'] = time.time()
+        self._record_answer(item.origin, correct=False)
+
+    def flush(self) -> None:
+        """Fold the answer log into the profile snapshot."""
         self._save_user_profile()
 
+    def close(self) -> None:
+        """Compact the profile, save new embeddings and release the log file."""
+        self._save_user_profile()
+        self._profile_log.close()
+        if self._model_dirty:
+            self._save_model()
+
+    def _record_answer(self, word: str, correct: bool) -> None:
+        """Apply an answer in memory and append it to the profile log."""
+        now = time.time()
+        apply_answer(self.user_history, word, correct, now)
+        try:
+            self._profile_log.append(word, correct, now)
+            if self._profile_log.should_compact():
+                self._save_user_profile()
+        except Exception as e:
+            print(f"Warning: Could not save user profile: {e}")
+
     def get_prioritized_items(
         self,
         items: List[VocabularyItem],
@@ -82,10 +100,14 @@ class MLVocabularyProfiler(IVocabularyProfiler):
         if not items:
             return []
 
+        # Embed every candidate first, then score similarity in one pass
+        rows = [self._embedding_row(item.origin) for item in items]
+        similarities = self._max_similarities(rows)
+
         # Calculate difficulty scores for all items
         scored_items = []
-        for item in items:
-            difficulty = self._calculate_word_difficulty(item)
+        for item, similarity in zip(items, similarities):
+            difficulty = self._calculate_word_difficulty(item, similarity)
             scored_items.append((item, difficulty))
 
         # Sort by difficulty (higher = harder, should be shown more)
@@ -94,8 +116,14 @@ class MLVocabularyProfiler(IVocabularyProfiler):
         # Return top items up to limit
         return [item for item, _ in scored_items[:limit]]
 
-    def _calculate_word_difficulty(self, item: VocabularyItem) -> float:
-        """Calculate difficulty score for a vocabulary item."""
+    def _calculate_word_difficulty(self, item: VocabularyItem, max_similarity: Optional[float] = None) -> float:
+        """
+        Calculate difficulty score for a vocabulary item.
+
+        Args:
+            item: Vocabulary item
+            max_similarity: Precomputed highest similarity to other words
+        """
         word = item.origin
 
         # Length-based difficulty
@@ -105,19 +133,12 @@ class MLVocabularyProfiler(IVocabularyProfiler):
         frequency_score = 0.5
 
         # Similarity score
+        if max_similarity is None:
+            row = self._embedding_row(word)
+            max_similarity = self._max_similarities([row])[0]
         similarity_score = 0.5
-        if len(self.word_embeddings) > 1:
-            word_emb = self._create_word_embedding(word)
-            similarities = []
-            for other_word, other_emb in self.word_embeddings.items():
-                if other_word != word:
-                    dot_product = np.dot(word_emb, other_emb)
-                    norm_product = np.linalg.norm(word_emb) * np.linalg.norm(other_emb)
-                    if norm_product > 0:
-                        similarity = dot_product / norm_product
-                        similarities.append(similarity)
-            if similarities:
-                similarity_score = 1.0 - max(similarities)
+        if np.isfinite(max_similarity):
+            similarity_score = 1.0 - max_similarity
 
         # User history score
         history_score = 0.5
@@ -141,12 +162,26 @@ class MLVocabularyProfiler(IVocabularyProfiler):
 
         return difficulty
 
+    def _max_similarities(self, rows: List[int]) -> np.ndarray:
+        """Get max similarity of matrix rows to other words (approximate with ANN index)."""
+        if self._ann_index is not None:
+            return self._ann_index.max_similarity(self._embedding_matrix, rows)
+        return self._embedding_matrix.max_similarity(rows)
+
+    def _embedding_row(self, word: str) -> int:
+        """Get the similarity matrix row of a word, embedding it if needed."""
+        row = self._embedding_matrix.index_of(word)
+        if row is None:
+            self._create_word_embedding(word)
+            row = self._embedding_matrix.index_of(word)
+        return row
+
     def _create_word_embedding(self, word: str) -> np.ndarray:
         """Create a simple character-based embedding for a word."""
         if word in self.word_embeddings:
             return self.word_embeddings[word]
 
-        embedding = np.zeros(self.embedding_dim)
+        embedding = np.zeros(self.embedding_dim, dtype=np.float32)
 
         # Character frequency features
         for char in word.lower()[:26]:
@@ -168,53 +203,105 @@ class MLVocabularyProfiler(IVocabularyProfiler):
                 embedding[29] = vowels / max(1, len(word))
 
         self.word_embeddings[word] = embedding
+        row = self._embedding_matrix.add(word, embedding)
+        self._model_dirty = True
+
+        if self._ann_index is not None:
+            self._ann_index.add(row, self._embedding_matrix.vectors[row])
+        elif self.ann_min_size is not None and len(self._embedding_matrix) >= self.ann_min_size:
+            self._build_ann_index()
         return embedding
 
     def _load_user_profile(self):
-        """Load user interaction history from file."""
+        """Load user interaction history from snapshot and log."""
         try:
-            if Path(self.user_profile_path).exists():
-                with open(self.user_profile_path, 'r', encoding='utf-8') as f:
-                    loaded_history = json.load(f)
-                    # Normalize loaded data to ensure all required keys exist
-                    self.user_history = {}
-                    for word, history in loaded_history.items():
-                        self.user_history[word] = {
-                            'correct': history.get('correct', 0),
-                            'incorrect': history.get('incorrect', 0),
-                            'last_seen': history.get('last_seen', time.time())
-                        }
+            self.user_history = self._profile_log.load()
         except Exception as e:
             print(f"Warning: Could not load user profile: {e}")
             self.user_history = {}
 
     def _save_user_profile(self):
-        """Save user interaction history to file."""
+        """Compact user interaction history into the snapshot file."""
+        if not self._profile_log.pending_events:
+            return
         try:
-            with open(self.user_profile_path, 'w', encoding='utf-8') as f:
-                json.dump(self.user_history, f, indent=2, ensure_ascii=False)
+            self._profile_log.compact(self.user_history)
         except Exception as e:
             print(f"Warning: Could not save user profile: {e}")
 
     def _load_model(self):
         """Load word embeddings and model state."""
+        self.word_embeddings = {}
         try:
-            if Path(self.model_path).exists():
+            if Path(self.embeddings_path).exists() and Path(self.words_path).exists():
+                # Memory-mapped float32 matrix, one row per word of the index table
+                matrix = np.load(self.embeddings_path, mmap_mode='r')
+                with open(self.words_path, 'r', encoding='utf-8') as f:
+                    words = json.load(f)
+                self.word_embeddings = dict(zip(words, matrix))
+            elif Path(self.model_path).exists():
+                # Legacy pickled model, rewritten in the new format on save
                 with open(self.model_path, 'rb') as f:
                     data = pickle.load(f)
-                    self.word_embeddings = data.get('embeddings', {})
+                    self.word_embeddings = {
+                        word: np.asarray(embedding, dtype=np.float32)
+                        for word, embedding in data.get('embeddings', {}).items()
+                    }
+                self._model_dirty = bool(self.word_embeddings)
         except Exception as e:
             print(f"Warning: Could not load model: {e}")
             self.word_embeddings = {}
 
+        self._embedding_matrix = EmbeddingMatrix(self.embedding_dim)
+        self._embedding_matrix.add_all(self.word_embeddings)
+        self._load_ann_index()
+
+    def _load_ann_index(self):
+        """Load the persisted ANN index, rebuilding it only when out of date."""
+        self._ann_index = None
+        if self.ann_min_size is None or len(self._embedding_matrix) < self.ann_min_size:
+            return
+
+        try:
+            index = LSHIndex.load(self.ann_index_path, expected_rows=len(self._embedding_matrix))
+            if index is not None and index.dim == self.embedding_dim:
+                self._ann_index = index
+                return
+        except Exception as e:
+            print(f"Warning: Could not load ANN index: {e}")
+
+        self._build_ann_index()
+
+    def _build_ann_index(self):
+        """Index every known embedding for approximate similarity lookups."""
+        self._ann_index = LSHIndex(self.embedding_dim)
+        self._ann_index.build(self._embedding_matrix)
+        self._model_dirty = True
+
     def _save_model(self):
-        """Save word embeddings and model state."""
+        """Save word embeddings as a float32 matrix with a word index table."""
         try:
-            data = {
-                'embeddings': self.word_embeddings,
-                'timestamp': time.time()
-            }
-            with open(self.model_path, 'wb') as f:
-                pickle.dump(data, f)
+            words = list(self.word_embeddings)
+            if not words:
+                return
+            matrix = np.zeros((len(words), self.embedding_dim), dtype=np.float32)
+            for i, word in enumerate(words):
+                matrix[i] = self.word_embeddings[word]
+            # Release the memory map before replacing the file it maps
+            self.word_embeddings = dict(zip(words, matrix))
+
+            tmp_path = f"{self.embeddings_path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                np.save(f, matrix)
+            os.replace(tmp_path, self.embeddings_path)
+
+            tmp_path = f"{self.words_path}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(words, f, ensure_ascii=False)
+            os.replace(tmp_path, self.words_path)
+
+            if self._ann_index is not None:
+                self._ann_index.save(self.ann_index_path)
+            self._model_dirty = False
         except Exception as e:
             print(f"Warning: Could not save model: {e}")
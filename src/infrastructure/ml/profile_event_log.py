@@ -0,0 +1,143 @@
+# Copyright 2026 The terCAD team. All rights reserved.
+# Use of this source code is governed by a CC BY-NC-ND 4.0 license that can be found in the LICENSE file.
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, Optional, TextIO
+
+
+def apply_answer(history: Dict[str, Dict], word: str, correct: bool, timestamp: float) -> None:
+    """Fold one answer into an aggregated user history."""
+    entry = history.setdefault(word, {'correct': 0, 'incorrect': 0, 'last_seen': timestamp})
+    if correct:
+        entry['correct'] += 1
+    else:
+        entry['incorrect'] += 1
+    entry['last_seen'] = timestamp
+
+
+class ProfileEventLog:
+    """
+    Append-only storage for the user answer history.
+
+    The aggregated history lives in a compact JSON snapshot; each answer is
+    appended as one JSON line to `<snapshot>.log`. Loading reads the snapshot
+    and replays the log tail, `compact()` folds the log into a new snapshot.
+    Events carry a sequence number, so a crash between writing the snapshot and
+    truncating the log never applies an event twice.
+
+    Snapshots written before this format (a flat `word -> counts` JSON dict)
+    are migrated on load; if that write fails the legacy snapshot is kept
+    and the next compaction migrates it.
+    """
+
+    FORMAT_VERSION = 2
+
+    def __init__(self, snapshot_path: str, compact_every: int = 500):
+        self.snapshot_path = snapshot_path
+        self.log_path = f"{snapshot_path}.log"
+        self.compact_every = compact_every
+
+        self._sequence = 0
+        self._snapshot_sequence = 0
+        self._log_file: Optional[TextIO] = None
+
+    @property
+    def pending_events(self) -> int:
+        """Number of logged events not yet folded into the snapshot."""
+        return self._sequence - self._snapshot_sequence
+
+    def load(self) -> Dict[str, Dict]:
+        """
+        Load the snapshot and replay the log tail.
+
+        Returns:
+            Aggregated history: word -> {'correct', 'incorrect', 'last_seen'}
+        """
+        history: Dict[str, Dict] = {}
+        legacy = False
+
+        if Path(self.snapshot_path).exists():
+            with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if isinstance(data.get('format'), int):
+                self._snapshot_sequence = data.get('sequence', 0)
+                stored = data.get('history', {})
+            else:
+                legacy = True
+                stored = data
+
+            # Normalize loaded data to ensure all required keys exist
+            for word, entry in stored.items():
+                history[word] = {
+                    'correct': entry.get('correct', 0),
+                    'incorrect': entry.get('incorrect', 0),
+                    'last_seen': entry.get('last_seen', time.time())
+                }
+
+        self._sequence = self._snapshot_sequence
+        if Path(self.log_path).exists():
+            with open(self.log_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        event = json.loads(line)
+                        sequence = event['s']
+                    except (ValueError, KeyError, TypeError):
+                        # Torn write from an interrupted append
+                        continue
+                    if sequence <= self._snapshot_sequence:
+                        continue
+                    apply_answer(history, event['w'], bool(event['c']), event['t'])
+                    self._sequence = max(self._sequence, sequence)
+
+        if legacy:
+            try:
+                self.compact(history)
+            except OSError as e:
+                print(f"Warning: Could not migrate user profile snapshot: {e}")
+
+        return history
+
+    def append(self, word: str, correct: bool, timestamp: float) -> None:
+        """Append one answer to the log."""
+        if self._log_file is None:
+            self._log_file = open(self.log_path, 'a', encoding='utf-8')
+
+        self._sequence += 1
+        event = {'s': self._sequence, 'w': word, 'c': 1 if correct else 0, 't': timestamp}
+        self._log_file.write(json.dumps(event, ensure_ascii=False) + '\n')
+        self._log_file.flush()
+
+    def should_compact(self) -> bool:
+        """Check whether the log grew enough to fold it into the snapshot."""
+        return self.pending_events >= self.compact_every
+
+    def compact(self, history: Dict[str, Dict]) -> None:
+        """
+        Write `history` as the new snapshot and truncate the log.
+
+        Args:
+            history: Aggregated history including every logged event
+        """
+        data = {
+            'format': self.FORMAT_VERSION,
+            'sequence': self._sequence,
+            'history': history
+        }
+        tmp_path = f"{self.snapshot_path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, self.snapshot_path)
+        self._snapshot_sequence = self._sequence
+
+        self.close()
+        with open(self.log_path, 'w', encoding='utf-8'):
+            pass
+
+    def close(self) -> None:
+        """Close the log file handle."""
+        if self._log_file is not None:
+            self._log_file.close()
+            self._log_file = None
@@ -0,0 +1,165 @@
+# Copyright 2026 The terCAD team. All rights reserved.
+# Use of this source code is governed by a CC BY-NC-ND 4.0 license that can be found in the LICENSE file.
+
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+
+@dataclass
+class ProgressDelta:
+    """Coalesced answer counts for one word that are not yet persisted."""
+
+    correct: int = 0
+    incorrect: int = 0
+
+    @property
+    def study_count(self) -> int:
+        return self.correct + self.incorrect
+
+
+class ProgressJournal:
+    """
+    Write-behind buffer for learning progress events.
+
+    Answers are coalesced per word in memory and handed to `writer` in one
+    batch from a background thread: after `flush_interval` seconds, as soon as
+    `max_pending` words are buffered, or on an explicit `flush()`.
+    A crash therefore loses at most the events of the last flush window.
+
+    The background thread only lives while events are pending; `on_worker_exit`
+    runs on it before it ends (e.g. to close a thread-local connection).
+    """
+
+    def __init__(
+        self,
+        writer: Callable[[Dict[str, ProgressDelta]], None],
+        flush_interval: float = 2.0,
+        max_pending: int = 50,
+        on_worker_exit: Optional[Callable[[], None]] = None
+    ):
+        self._writer = writer
+        self._on_worker_exit = on_worker_exit
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+
+        self._pending: Dict[str, ProgressDelta] = {}
+        # Batch handed to the writer, still visible to readers until committed
+        self._in_flight: Dict[str, ProgressDelta] = {}
+
+        self._lock = threading.RLock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._worker: Optional[threading.Thread] = None
+
+    def record(self, word: str, correct: bool) -> None:
+        """Buffer one answer for a word."""
+        with self._lock:
+            delta = self._pending.setdefault(word, ProgressDelta())
+            if correct:
+                delta.correct += 1
+            else:
+                delta.incorrect += 1
+            pending_count = len(self._pending)
+
+        if self._closed:
+            self.flush()
+            return
+
+        self._ensure_worker()
+        if pending_count >= self.max_pending:
+            self._wakeup.set()
+
+    def get_pending(self, word: str) -> Tuple[int, int]:
+        """
+        Get buffered (correct, incorrect) counts for a word.
+
+        Args:
+            word: Origin word
+
+        Returns:
+            Counts not yet visible in persistent storage
+        """
+        with self._lock:
+            correct, incorrect = 0, 0
+            for buffer in (self._in_flight, self._pending):
+                delta = buffer.get(word)
+                if delta:
+                    correct += delta.correct
+                    incorrect += delta.incorrect
+            return correct, incorrect
+
+    def get_all_pending(self) -> Dict[str, Tuple[int, int]]:
+        """Get buffered (correct, incorrect) counts for every word."""
+        with self._lock:
+            words = set(self._in_flight) | set(self._pending)
+            return {word: self.get_pending(word) for word in words}
+
+    def has_pending(self) -> bool:
+        """Check whether any events wait to be persisted."""
+        with self._lock:
+            return bool(self._pending or self._in_flight)
+
+    def flush(self) -> None:
+        """Persist all buffered events in one batch."""
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending:
+                    return
+                self._in_flight = self._pending
+                self._pending = {}
+
+            failed = False
+            try:
+                self._writer(self._in_flight)
+            except Exception as e:
+                print(f"Error flushing progress journal: {e}")
+                failed = True
+
+            with self._lock:
+                if failed:
+                    # Keep failed events for the next attempt
+                    for word, delta in self._in_flight.items():
+                        merged = self._pending.setdefault(word, ProgressDelta())
+                        merged.correct += delta.correct
+                        merged.incorrect += delta.incorrect
+                self._in_flight = {}
+
+    def close(self) -> None:
+        """Stop the background writer and persist remaining events."""
+        self._closed = True
+        self._wakeup.set()
+        worker = self._worker
+        if worker and worker is not threading.current_thread():
+            worker.join(timeout=self.flush_interval + 5.0)
+        self.flush()
+
+    def _ensure_worker(self) -> None:
+        """Start the background writer on first use."""
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._run,
+                    name='ProgressJournal',
+                    daemon=True
+                )
+                self._worker.start()
+
+    def _run(self) -> None:
+        """Background loop flushing on timer or size threshold."""
+        try:
+            while True:
+                self._wakeup.wait(self.flush_interval)
+                self._wakeup.clear()
+                self.flush()
+                with self._lock:
+                    if self._closed or not self._pending:
+                        self._worker = None
+                        break
+        finally:
+            if self._on_worker_exit:
+                try:
+                    self._on_worker_exit()
+                except Exception as e:
+                    print(f"Error stopping progress journal: {e}")
@@ -2,11 +2,15 @@
 # Use of this source code is governed by a CC BY-NC-ND 4.0 license that can be found in the LICENSE file.
 
 import numpy as np
-import pickle
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional, Tuple
 from domain.entities.vocabulary_item import VocabularyItem
 from domain.services.vocabulary_profiler import IVocabularyProfiler
+from infrastructure.ml.progress_journal import ProgressDelta, ProgressJournal
 from infrastructure.persistence.database_connection import DatabaseConnection
+from lib.lru_cache import LRUCache
+
+# Storage format of ml_embeddings.embedding_vector
+EMBEDDING_DTYPE = np.dtype('<f4')
 
 
 class SQLiteMLVocabularyProfiler(IVocabularyProfiler):
@@ -17,7 +21,14 @@ class SQLiteMLVocabularyProfiler(IVocabularyProfiler):
     Replaces JSON/pickle file storage with relational database.
     """
 
-    def __init__(self, db_connection: DatabaseConnection, locale_from: str, locale_to: str):
+    def __init__(
+        self,
+        db_connection: DatabaseConnection,
+        locale_from: str,
+        locale_to: str,
+        flush_interval: float = 2.0,
+        embedding_cache_size: int = 1024
+    ):
         self._db = db_connection
         self.locale_from = locale_from
         self.locale_to = locale_to
@@ -35,8 +46,17 @@ class SQLiteMLVocabularyProfiler(IVocabularyProfiler):
             'user_history': 0.25
         }
 
-        # Cache for embeddings (loaded on demand)
-        self._embedding_cache: Dict[str, np.ndarray] = {}
+        # Bounded cache for character embeddings, warmed up on first use
+        self._embedding_cache_size = embedding_cache_size
+        self._embedding_cache: LRUCache[str, np.ndarray] = LRUCache(embedding_cache_size)
+        self._embeddings_warm = False
+
+        # Write-behind buffer for answers, flushed off the UI thread
+        self._journal = ProgressJournal(
+            self._write_progress,
+            flush_interval=flush_interval,
+            on_worker_exit=self._db.close
+        )
 
     def mark_positive(self, item: VocabularyItem) -> None:
         """Mark a vocabulary item as correctly answered."""
@@ -46,64 +66,62 @@ class SQLiteMLVocabularyProfiler(IVocabularyProfiler):
         """Mark a vocabulary item as incorrectly answered."""
         self._update_progress(item, correct=False)
 
+    def flush(self) -> None:
+        """Persist buffered learning progress."""
+        self._journal.flush()
+
+    def close(self) -> None:
+        """Stop background writes and persist buffered learning progress."""
+        self._journal.close()
+
     def _update_progress(self, item: VocabularyItem, correct: bool) -> None:
         """
         Update learning progress for an item.
+        The answer is buffered and persisted by the progress journal.
 
         Args:
             item: Vocabulary item
             correct: Whether answer was correct
         """
-        try:
-            # Get vocabulary item ID
-            vocab_id = self._get_vocabulary_item_id(item.origin)
-            if not vocab_id:
-                print(f"Warning: Could not find vocabulary item: {item.origin}")
-                return
+        self._journal.record(item.origin, correct)
 
-            with self._db.transaction() as conn:
-                # Check if progress record exists
-                row = conn.execute(
-                    """SELECT id, correct_count, incorrect_count, study_count
-                       FROM learning_progress
-                       WHERE vocabulary_item_id = ? AND user_id = 'default'""",
-                    (vocab_id,)
-                ).fetchone()
-
-                if row:
-                    # Update existing record
-                    correct_count = row['correct_count'] + (1 if correct else 0)
-                    incorrect_count = row['incorrect_count'] + (0 if correct else 1)
-                    study_count = row['study_count'] + 1
-                    total = correct_count + incorrect_count
-                    difficulty_score = 1.0 - (correct_count / total) if total > 0 else 0.5
-
-                    conn.execute(
-                        """UPDATE learning_progress
-                           SET correct_count = ?,
-                               incorrect_count = ?,
-                               study_count = ?,
-                               difficulty_score = ?,
-                               last_studied_at = datetime('now'),
-                               updated_at = datetime('now')
-                           WHERE id = ?""",
-                        (correct_count, incorrect_count, study_count, difficulty_score, row['id'])
-                    )
-                else:
-                    # Create new record
-                    correct_count = 1 if correct else 0
-                    incorrect_count = 0 if correct else 1
-                    difficulty_score = 0.0 if correct else 1.0
-
-                    conn.execute(
-                        """INSERT INTO learning_progress
-                           (vocabulary_item_id, correct_count, incorrect_count,
-                            difficulty_score, last_studied_at, study_count)
-                           VALUES (?, ?, ?, ?, datetime('now'), 1)""",
-                        (vocab_id, correct_count, incorrect_count, difficulty_score)
-                    )
-        except Exception as e:
-            print(f"Error updating progress: {e}")
+    def _write_progress(self, deltas: Dict[str, ProgressDelta]) -> None:
+        """
+        Persist coalesced progress for several words in one transaction.
+
+        Args:
+            deltas: Buffered answer counts per origin word
+        """
+        vocab_ids = self._get_vocabulary_item_ids(list(deltas))
+
+        rows = []
+        for origin, delta in deltas.items():
+            vocab_id = vocab_ids.get(origin)
+            if not vocab_id:
+                print(f"Warning: Could not find vocabulary item: {origin}")
+                continue
+            difficulty_score = 1.0 - delta.correct / delta.study_count
+            rows.append((vocab_id, delta.correct, delta.incorrect, difficulty_score, delta.study_count))
+
+        if not rows:
+            return
+
+        with self._db.transaction() as conn:
+            conn.executemany(
+                """INSERT INTO learning_progress
+                   (vocabulary_item_id, correct_count, incorrect_count,
+                    difficulty_score, last_studied_at, study_count)
+                   VALUES (?, ?, ?, ?, datetime('now'), ?)
+                   ON CONFLICT(vocabulary_item_id, user_id) DO UPDATE SET
+                       correct_count = correct_count + excluded.correct_count,
+                       incorrect_count = incorrect_count + excluded.incorrect_count,
+                       study_count = study_count + excluded.study_count,
+                       difficulty_score = 1.0 - CAST(correct_count + excluded.correct_count AS REAL) /
+                           (correct_count + excluded.correct_count + incorrect_count + excluded.incorrect_count),
+                       last_studied_at = datetime('now'),
+                       updated_at = datetime('now')""",
+                rows
+            )
 
     def get_prioritized_items(
         self,
@@ -111,20 +129,77 @@ class SQLiteMLVocabularyProfiler(IVocabularyProfiler):
         limit: int
     ) -> List[VocabularyItem]:
         """Get vocabulary items prioritized by difficulty and user performance."""
-        if not items:
+        if not items or limit <= 0:
             return []
 
-        # Calculate difficulty scores for all items
-        scored_items = []
-        for item in items:
-            difficulty = self._calculate_word_difficulty(item)
-            scored_items.append((item, difficulty))
+        # Score the whole set at once from a single history query
+        scores = self._calculate_difficulty_scores(items)
+
+        # Select top items (higher = harder, should be shown more)
+        return [items[i] for i in self._select_top_indices(scores, limit)]
+
+    def _calculate_difficulty_scores(self, items: List[VocabularyItem]) -> np.ndarray:
+        """
+        Calculate difficulty scores for all items in one pass.
+
+        Produces the same values as `_calculate_word_difficulty`, but reads
+        the learning history of the whole language pair with one query.
+
+        Args:
+            items: Vocabulary items
+
+        Returns:
+            Difficulty scores aligned with `items` (0.0 - 1.0, higher = harder)
+        """
+        history = self._get_history_counts()
+
+        lengths = np.fromiter((len(item.origin) for item in items), dtype=np.float64, count=len(items))
+        correct = np.zeros(len(items))
+        incorrect = np.zeros(len(items))
+        for i, item in enumerate(items):
+            counts = history.get(item.origin)
+            if counts:
+                correct[i], incorrect[i] = counts
 
-        # Sort by difficulty (higher = harder, should be shown more)
-        scored_items.sort(key=lambda x: x[1], reverse=True)
+        # Length-based difficulty
+        length_scores = np.minimum(lengths / 15.0, 1.0)
+
+        # User history score (neutral for new items)
+        total = correct + incorrect
+        history_scores = np.full(len(items), 0.5)
+        np.subtract(1.0, correct / np.maximum(total, 1), out=history_scores, where=total > 0)
+
+        # Frequency and similarity are neutral for now
+        return (
+            self.difficulty_weights['length'] * length_scores +
+            self.difficulty_weights['frequency'] * 0.5 +
+            self.difficulty_weights['similarity'] * 0.5 +
+            self.difficulty_weights['user_history'] * history_scores
+        )
 
-        # Return top items up to limit
-        return [item for item, _ in scored_items[:limit]]
+    @staticmethod
+    def _select_top_indices(scores: np.ndarray, limit: int) -> np.ndarray:
+        """
+        Select indices of the highest scores without sorting the whole array.
+
+        Ties keep the original item order, matching a stable descending sort.
+
+        Args:
+            scores: Difficulty scores
+            limit: Maximum number of indices to return
+
+        Returns:
+            Indices ordered by descending score
+        """
+        if limit < len(scores):
+            # Threshold of the limit-th highest score; keep every tie with it
+            threshold = np.partition(scores, len(scores) - limit)[len(scores) - limit]
+            candidates = np.flatnonzero(scores >= threshold)
+        else:
+            candidates = np.arange(len(scores))
+
+        order = np.argsort(-scores[candidates], kind='stable')
+        return candidates[order][:limit]
 
     def _calculate_word_difficulty(self, item: VocabularyItem) -> float:
         """
@@ -182,19 +257,56 @@ class SQLiteMLVocabularyProfiler(IVocabularyProfiler):
                 (vocab_id,)
             )
 
+            # Answers still buffered in the journal count as well
+            correct, incorrect = self._journal.get_pending(origin)
             if row:
-                correct = row['correct_count']
-                incorrect = row['incorrect_count']
-                total = correct + incorrect
-                if total > 0:
-                    accuracy = correct / total
-                    return 1.0 - accuracy  # Low accuracy = high difficulty
+                correct += row['correct_count']
+                incorrect += row['incorrect_count']
+
+            total = correct + incorrect
+            if total > 0:
+                accuracy = correct / total
+                return 1.0 - accuracy  # Low accuracy = high difficulty
 
             return 0.5  # Neutral score for new items
         except Exception as e:
             print(f"Error getting history score: {e}")
             return 0.5
 
+    def _get_history_counts(self) -> Dict[str, Tuple[int, int]]:
+        """
+        Get answer counts for every word of the language pair.
+
+        Returns:
+            Mapping of origin word to (correct, incorrect) counts
+        """
+        query = """
+            SELECT v.origin, p.correct_count, p.incorrect_count
+            FROM vocabulary_items v
+            JOIN language_pairs lp ON v.language_pair_id = lp.id
+            LEFT JOIN learning_progress p
+                ON p.vocabulary_item_id = v.id AND p.user_id = 'default'
+            WHERE lp.locale_from = ? AND lp.locale_to = ?
+            ORDER BY v.id
+        """
+
+        history: Dict[str, Tuple[int, int]] = {}
+        try:
+            for row in self._db.fetchall(query, (self.locale_from, self.locale_to)):
+                # The first row per origin wins, as in `_get_vocabulary_item_id`
+                if row['origin'] in history:
+                    continue
+                history[row['origin']] = (row['correct_count'] or 0, row['incorrect_count'] or 0)
+        except Exception as e:
+            print(f"Error getting history counts: {e}")
+
+        # Answers still buffered in the journal count as well
+        for origin, (correct, incorrect) in self._journal.get_all_pending().items():
+            if origin in history:
+                stored_correct, stored_incorrect = history[origin]
+                history[origin] = (stored_correct + correct, stored_incorrect + incorrect)
+        return history
+
     def _get_vocabulary_item_id(self, origin: str) -> Optional[int]:
         """
         Get vocabulary item ID by origin word.
@@ -215,6 +327,67 @@ class SQLiteMLVocabularyProfiler(IVocabularyProfiler):
         row = self._db.fetchone(query, (self.locale_from, self.locale_to, origin))
         return row['id'] if row else None
 
+    def _get_vocabulary_item_ids(self, origins: List[str]) -> Dict[str, int]:
+        """
+        Get vocabulary item IDs for several origin words.
+
+        Args:
+            origins: Origin words
+
+        Returns:
+            Mapping of origin word to vocabulary item ID (unknown words are omitted)
+        """
+        ids: Dict[str, int] = {}
+        # Stay below the SQLite host parameter limit
+        for start in range(0, len(origins), 500):
+            chunk = origins[start:start + 500]
+            query = f"""
+                SELECT v.id, v.origin
+                FROM vocabulary_items v
+                JOIN language_pairs lp ON v.language_pair_id = lp.id
+                WHERE lp.locale_from = ? AND lp.locale_to = ?
+                  AND v.origin IN ({', '.join('?' * len(chunk))})
+                ORDER BY v.id
+            """
+            for row in self._db.fetchall(query, (self.locale_from, self.locale_to, *chunk)):
+                ids.setdefault(row['origin'], row['id'])
+        return ids
+
+    def warm_up_embeddings(self) -> None:
+        """
+        Load embeddings of every character used by the active language pair.
+
+        Stored embeddings are read with one query and characters without an
+        embedding yet are created in one batch. The cache is sized to hold at
+        least the whole character set, so warming it up cannot evict itself.
+        """
+        rows = self._db.fetchall(
+            """SELECT DISTINCT v.origin
+               FROM vocabulary_items v
+               JOIN language_pairs lp ON v.language_pair_id = lp.id
+               WHERE lp.locale_from = ? AND lp.locale_to = ?""",
+            (self.locale_from, self.locale_to)
+        )
+        characters = {char for row in rows for char in row['origin']}
+
+        stored = self._load_embeddings()
+        warm = {char: stored[char] for char in characters if char in stored}
+        missing = [char for char in characters if char not in warm]
+        if missing:
+            warm.update(self._create_embeddings(missing))
+
+        # The pair's character set is its alphabet (tens of letters, a few
+        # thousand for CJK) and does not grow with the vocabulary, so it is
+        # the bound when it exceeds the configured size
+        self._embedding_cache.resize(max(self._embedding_cache_size, len(warm)))
+        for character, embedding in warm.items():
+            self._embedding_cache.put(character, embedding)
+        self._embeddings_warm = True
+
+    def embedding_cache_stats(self) -> Dict[str, int]:
+        """Get size, hit/miss and eviction counters of the embedding cache."""
+        return self._embedding_cache.stats()
+
     def _get_or_create_embedding(self, character: str) -> np.ndarray:
         """
         Get or create character embedding.
@@ -225,33 +398,121 @@ class SQLiteMLVocabularyProfiler(IVocabularyProfiler):
         Returns:
             Embedding vector
         """
+        return self._get_or_create_embeddings([character])[character]
+
+    def _get_or_create_embeddings(self, characters: Iterable[str]) -> Dict[str, np.ndarray]:
+        """
+        Get or create embeddings for several characters.
+
+        Cached characters cost nothing, stored ones are read with one query
+        and new ones are inserted in one batch.
+
+        Args:
+            characters: Characters to embed
+
+        Returns:
+            Mapping of character to embedding vector
+        """
+        if not self._embeddings_warm:
+            self.warm_up_embeddings()
+
         # Check cache first
-        if character in self._embedding_cache:
-            return self._embedding_cache[character]
+        result: Dict[str, np.ndarray] = {}
+        unknown = []
+        for character in dict.fromkeys(characters):
+            embedding = self._embedding_cache.get(character)
+            if embedding is None:
+                unknown.append(character)
+            else:
+                result[character] = embedding
+        if not unknown:
+            return result
 
         # Check database
-        row = self._db.fetchone(
-            "SELECT embedding_vector FROM ml_embeddings WHERE character = ?",
-            (character,)
-        )
+        result.update(self._fetch_embeddings(unknown))
+
+        # Create new embeddings
+        missing = [character for character in unknown if character not in result]
+        if missing:
+            result.update(self._create_embeddings(missing))
+
+        for character in unknown:
+            self._embedding_cache.put(character, result[character])
+        return result
+
+    def _fetch_embeddings(self, characters: List[str]) -> Dict[str, np.ndarray]:
+        """
+        Read stored embeddings of the given characters.
 
-        if row:
-            embedding = pickle.loads(row['embedding_vector'])
-            self._embedding_cache[character] = embedding
-            return embedding
+        Args:
+            characters: Characters to look up
 
-        # Create new embedding
-        embedding = np.random.randn(self.embedding_dim) * 0.1
+        Returns:
+            Mapping of character to embedding for the stored ones
+        """
+        embeddings: Dict[str, np.ndarray] = {}
+        # Stay below the SQLite host parameter limit
+        for start in range(0, len(characters), 500):
+            chunk = characters[start:start + 500]
+            rows = self._db.fetchall(
+                f"""SELECT character, embedding_vector FROM ml_embeddings
+                    WHERE character IN ({', '.join('?' * len(chunk))})""",
+                tuple(chunk)
+            )
+            for row in rows:
+                embeddings[row['character']] = decode_embedding(row['embedding_vector'])
+        return embeddings
+
+    def _create_embeddings(self, characters: List[str]) -> Dict[str, np.ndarray]:
+        """
+        Create embeddings for new characters and store them in one transaction.
+
+        Args:
+            characters: Characters without a stored embedding
+
+        Returns:
+            Mapping of character to embedding vector
+        """
+        vectors = (np.random.randn(len(characters), self.embedding_dim) * 0.1).astype(EMBEDDING_DTYPE)
+        embeddings = dict(zip(characters, vectors))
 
         # Save to database
         try:
-            self._db.execute(
-                "INSERT INTO ml_embeddings (character, embedding_vector) VALUES (?, ?)",
-                (character, pickle.dumps(embedding))
-            )
-            self._db.get_connection().commit()
+            with self._db.transaction() as conn:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO ml_embeddings (character, embedding_vector) VALUES (?, ?)",
+                    [(character, encode_embedding(embedding)) for character, embedding in embeddings.items()]
+                )
         except Exception as e:
             print(f"Error saving embedding: {e}")
+        return embeddings
+
+    def _load_embeddings(self) -> Dict[str, np.ndarray]:
+        """
+        Load every stored character embedding with one query.
+
+        The BLOBs are joined and viewed as one float32 matrix, so there is no
+        per-row deserialization.
+
+        Returns:
+            Mapping of character to embedding (rows of a shared matrix)
+        """
+        rows = self._db.fetchall(
+            "SELECT character, embedding_vector FROM ml_embeddings WHERE length(embedding_vector) = ?",
+            (self.embedding_dim * EMBEDDING_DTYPE.itemsize,)
+        )
+        if not rows:
+            return {}
+
+        matrix = decode_embedding(b''.join(row['embedding_vector'] for row in rows)).reshape(len(rows), -1)
+        return {row['character']: matrix[i] for i, row in enumerate(rows)}
+
+
+def encode_embedding(embedding: np.ndarray) -> bytes:
+    """Serialize an embedding as a raw little-endian float32 BLOB."""
+    return np.ascontiguousarray(embedding, dtype=EMBEDDING_DTYPE).tobytes()
+
 
-        self._embedding_cache[character] = embedding
-        return embedding
+def decode_embedding(blob: bytes) -> np.ndarray:
+    """View a raw little-endian float32 BLOB as an embedding (read-only, no copy)."""
+    return np.frombuffer(blob, dtype=EMBEDDING_DTYPE)
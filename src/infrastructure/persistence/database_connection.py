@@ -182,17 +182,26 @@ class DatabaseConnection:
         """
         Context manager for database transactions.
 
+        A transaction opened inside another one on the same thread joins it:
+        only the outermost one commits, or rolls everything back on error.
+
         Usage:
             with db.transaction() as conn:
                 conn.execute("INSERT ...")
         """
         conn = self.get_connection()
+        depth = getattr(self._local, 'transaction_depth', 0)
+        self._local.transaction_depth = depth + 1
         try:
             yield conn
-            conn.commit()
+            if depth == 0:
+                conn.commit()
         except Exception:
-            conn.rollback()
+            if depth == 0:
+                conn.rollback()
             raise
+        finally:
+            self._local.transaction_depth = depth
 
     def execute(self, query: str, params=None) -> sqlite3.Cursor:
         """
@@ -29,6 +29,8 @@ CREATE TABLE IF NOT EXISTS vocabulary_items (
 
 CREATE INDEX IF NOT EXISTS idx_vocab_language_pair ON vocabulary_items(language_pair_id);
 CREATE INDEX IF NOT EXISTS idx_vocab_origin ON vocabulary_items(origin);
+-- Generated category_key/origin_key columns and idx_vocab_pair_keys
+-- (language_pair_id, category_key, origin_key) are added by patch vocabulary_normalized_keys
 
 -- User learning progress for each vocabulary item
 CREATE TABLE IF NOT EXISTS learning_progress (
@@ -55,7 +57,7 @@ CREATE INDEX IF NOT EXISTS idx_progress_last_studied ON learning_progress(last_s
 CREATE TABLE IF NOT EXISTS ml_embeddings (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     character TEXT UNIQUE NOT NULL,
-    embedding_vector BLOB NOT NULL,  -- Serialized numpy array
+    embedding_vector BLOB NOT NULL,  -- Raw little-endian float32 vector
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
 
@@ -17,6 +17,7 @@ class KivyResourceRepository(IResourceRepository):
         self._user_data_dir = user_data_dir
         self._home_dir = os.path.join(user_data_dir, ".terCAD", "app-language")
         os.makedirs(self._home_dir, exist_ok=True)
+        self._audio_dirs = {}
 
     def find_resource(self, path: str) -> Optional[str]:
         """Find a resource, checking user directory first."""
@@ -37,11 +38,26 @@ class KivyResourceRepository(IResourceRepository):
         return path
 
     def get_audio_dir(self, locale: str) -> str:
-        """Get the audio directory for a specific locale."""
-        path = os.path.join(self._home_dir, "assets", "data", locale, "audio")
-        os.makedirs(path, exist_ok=True)
+        """
+        Get the audio directory for a specific locale.
+
+        Loose files there are the fallback for clips missing from the
+        locale's audio pack (see get_audio_pack).
+        """
+        path = self._audio_dirs.get(locale)
+        if path is None:
+            path = os.path.join(self._home_dir, "assets", "data", locale, "audio")
+            os.makedirs(path, exist_ok=True)
+            self._audio_dirs[locale] = path
         return path
 
+    def get_audio_pack(self, locale: str) -> Optional[str]:
+        """Get the audio pack next to the audio directory, from the user directory or the bundled assets."""
+        path = self.find_resource(f"assets/data/{locale}/audio.pack")
+        if path and os.path.exists(f"{path}.idx"):
+            return path
+        return None
+
     def get_image_dir(self, locale: str) -> str:
         """Get the image directory for a specific locale."""
         path = os.path.join(self._home_dir, "assets", "data", locale, "images")
@@ -456,8 +456,10 @@ class SQLiteConfigRepository:
 
                 conn.execute(
                     """DELETE FROM vocabulary_items
-                       WHERE language_pair_id = ? AND category = ?""",
-                    (language_pair_id, vocabulary_source)
+                       WHERE language_pair_id = ?
+                         AND category_key = lower(trim(?))
+                         AND category = ?""",
+                    (language_pair_id, vocabulary_source, vocabulary_source)
                 )
 
                 cursor = conn.execute(
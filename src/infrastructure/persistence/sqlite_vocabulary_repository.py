@@ -1,7 +1,7 @@
 # Copyright 2025 The terCAD team. All rights reserved.
 # Use of this source code is governed by a CC BY-NC-ND 4.0 license that can be found in the LICENSE file.
 
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from domain.entities.vocabulary_item import VocabularyItem
 from domain.repositories.vocabulary_repository import IVocabularyRepository
 from infrastructure.persistence.database_connection import DatabaseConnection
@@ -101,6 +101,27 @@ class SQLiteVocabularyRepository(IVocabularyRepository):
         Returns:
             List of vocabulary items
         """
+        return list(self.iter_by_language_pair(locale_from, locale_to, category))
+
+    def iter_by_language_pair(
+        self,
+        locale_from: str,
+        locale_to: str,
+        category: Optional[str] = None,
+        batch_size: int = 500
+    ) -> Iterator[VocabularyItem]:
+        """
+        Stream vocabulary items for a language pair from a database cursor.
+
+        Args:
+            locale_from: Source language locale
+            locale_to: Target language locale
+            category: Optional category filter (verbs, articulation, dictionary, numbers)
+            batch_size: Number of rows fetched from the cursor at a time
+
+        Returns:
+            Iterator of vocabulary items in insertion order
+        """
         if category:
             query = """
                 SELECT v.id, v.origin, v.translation, v.sound_path, v.image_path, v.category
@@ -109,7 +130,7 @@ class SQLiteVocabularyRepository(IVocabularyRepository):
                 WHERE lp.locale_from = ? AND lp.locale_to = ? AND v.category = ?
                 ORDER BY v.id
             """
-            rows = self._db.fetchall(query, (locale_from, locale_to, category))
+            cursor = self._db.execute(query, (locale_from, locale_to, category))
         else:
             query = """
                 SELECT v.id, v.origin, v.translation, v.sound_path, v.image_path, v.category
@@ -118,23 +139,26 @@ class SQLiteVocabularyRepository(IVocabularyRepository):
                 WHERE lp.locale_from = ? AND lp.locale_to = ?
                 ORDER BY v.id
             """
-            rows = self._db.fetchall(query, (locale_from, locale_to))
-
-        items = []
-        for row in rows:
-            try:
-                item = VocabularyItem(
-                    origin=row['origin'],
-                    translation=row['translation'],
-                    sound=row['sound_path'],
-                    image=row['image_path'],
-                    category=row['category'] if 'category' in row.keys() else None
-                )
-                items.append(item)
-            except ValueError as e:
-                print(f"Warning: Skipping invalid item: {e}")
+            cursor = self._db.execute(query, (locale_from, locale_to))
 
-        return items
+        try:
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    try:
+                        yield VocabularyItem(
+                            origin=row['origin'],
+                            translation=row['translation'],
+                            sound=row['sound_path'],
+                            image=row['image_path'],
+                            category=row['category'] if 'category' in row.keys() else None
+                        )
+                    except ValueError as e:
+                        print(f"Warning: Skipping invalid item: {e}")
+        finally:
+            cursor.close()
 
     def save_to_file(self, file_path: str, items: List[VocabularyItem]) -> None:
         """
@@ -158,7 +182,8 @@ class SQLiteVocabularyRepository(IVocabularyRepository):
         locale_from: str,
         locale_to: str,
         items: List[VocabularyItem],
-        replace: bool = True
+        replace: bool = True,
+        check_existing: bool = True
     ) -> None:
         """
         Save vocabulary items for a language pair.
@@ -168,6 +193,8 @@ class SQLiteVocabularyRepository(IVocabularyRepository):
             locale_to: Target language locale
             items: List of vocabulary items
             replace: If True, replace existing items; if False, append
+            check_existing: When appending, reject words that are already stored;
+                False for the later batches of a replacing import
         """
         try:
             with self._db.transaction() as conn:
@@ -194,38 +221,19 @@ class SQLiteVocabularyRepository(IVocabularyRepository):
                         "DELETE FROM vocabulary_items WHERE language_pair_id = ?",
                         (language_pair_id,)
                     )
-                else:
-                    for item in items:
-                        normalized_origin = item.origin.strip()
-
-                        if item.category is None:
-                            existing = conn.execute(
-                                """SELECT id FROM vocabulary_items
-                                   WHERE language_pair_id = ?
-                                     AND category IS NULL
-                                     AND lower(trim(origin)) = lower(?)""",
-                                (language_pair_id, normalized_origin)
-                            ).fetchone()
-                        else:
-                            existing = conn.execute(
-                                """SELECT id FROM vocabulary_items
-                                   WHERE language_pair_id = ?
-                                     AND lower(trim(category)) = lower(?)
-                                     AND lower(trim(origin)) = lower(?)""",
-                                (language_pair_id, item.category.strip(), normalized_origin)
-                            ).fetchone()
-
-                        if existing is not None:
-                            raise ValueError(
-                                f"Word already exists in category '{item.category or ''}': {item.origin}"
-                            )
+                elif check_existing:
+                    existing = self._find_existing_item(conn, language_pair_id, items)
+                    if existing is not None:
+                        raise ValueError(
+                            f"Word already exists in category '{existing.category or ''}': {existing.origin}"
+                        )
 
                 # Insert new items
-                for item in items:
-                    conn.execute(
-                        """INSERT INTO vocabulary_items
-                           (language_pair_id, origin, translation, sound_path, image_path, category)
-                           VALUES (?, ?, ?, ?, ?, ?)""",
+                conn.executemany(
+                    """INSERT INTO vocabulary_items
+                       (language_pair_id, origin, translation, sound_path, image_path, category)
+                       VALUES (?, ?, ?, ?, ?, ?)""",
+                    (
                         (
                             language_pair_id,
                             item.origin,
@@ -234,11 +242,74 @@ class SQLiteVocabularyRepository(IVocabularyRepository):
                             item.image,
                             item.category
                         )
+                        for item in items
                     )
+                )
         except Exception as e:
             print(f"Error saving vocabulary: {e}")
             raise
 
+    def transaction(self):
+        """Group several saves into one transaction (see DatabaseConnection.transaction)."""
+        return self._db.transaction()
+
+    def _find_existing_item(
+        self,
+        conn,
+        language_pair_id: int,
+        items: List[VocabularyItem]
+    ) -> Optional[VocabularyItem]:
+        """
+        Find the first incoming item whose word already exists in its category.
+
+        Normalized keys are staged in a temp table and matched against the
+        language pair with one join instead of a query per item; each key is
+        an index seek on (language_pair_id, category_key, origin_key).
+
+        Args:
+            conn: Connection of the running transaction
+            language_pair_id: Language pair ID
+            items: Incoming vocabulary items
+
+        Returns:
+            First item (in payload order) that is already stored, or None
+        """
+        conn.execute(
+            """CREATE TEMP TABLE IF NOT EXISTS vocabulary_import_keys (
+                   position INTEGER PRIMARY KEY,
+                   category_key TEXT,
+                   origin_key TEXT NOT NULL
+               )"""
+        )
+        conn.execute("DELETE FROM temp.vocabulary_import_keys")
+        try:
+            conn.executemany(
+                "INSERT INTO temp.vocabulary_import_keys VALUES (?, lower(?), lower(?))",
+                (
+                    (
+                        position,
+                        item.category.strip() if item.category is not None else None,
+                        item.origin.strip()
+                    )
+                    for position, item in enumerate(items)
+                )
+            )
+            row = conn.execute(
+                """SELECT k.position
+                   FROM temp.vocabulary_import_keys k
+                   JOIN vocabulary_items v
+                     ON v.language_pair_id = ?
+                    AND v.category_key IS k.category_key
+                    AND v.origin_key = k.origin_key
+                   ORDER BY k.position
+                   LIMIT 1""",
+                (language_pair_id,)
+            ).fetchone()
+        finally:
+            conn.execute("DELETE FROM temp.vocabulary_import_keys")
+
+        return items[row[0]] if row else None
+
     def get_vocabulary_item_id(self, locale_from: str, locale_to: str, origin: str) -> Optional[int]:
         """
         Get vocabulary item ID by origin word.
@@ -251,11 +322,15 @@ class SQLiteVocabularyRepository(IVocabularyRepository):
         Returns:
             Vocabulary item ID or None
         """
+        # Resolve the pair first so the word is an index seek on origin
+        # rather than a scan of every item of the pair
         query = """
-            SELECT v.id
-            FROM vocabulary_items v
-            JOIN language_pairs lp ON v.language_pair_id = lp.id
-            WHERE lp.locale_from = ? AND lp.locale_to = ? AND v.origin = ?
+            SELECT id
+            FROM vocabulary_items
+            WHERE language_pair_id = (
+                SELECT id FROM language_pairs WHERE locale_from = ? AND locale_to = ?
+            )
+              AND origin = ?
         """
 
         row = self._db.fetchone(query, (locale_from, locale_to, origin))
@@ -272,21 +347,25 @@ class SQLiteVocabularyRepository(IVocabularyRepository):
         """Delete vocabulary item(s) for language pair and return number of deleted rows."""
         try:
             with self._db.transaction() as conn:
+                # Key predicates let the delete seek idx_vocab_pair_keys
                 conditions = [
                     "language_pair_id = (SELECT id FROM language_pairs WHERE locale_from = ? AND locale_to = ?)",
+                    "origin_key = lower(trim(?))",
                     "origin = ?",
                 ]
-                params = [locale_from, locale_to, origin]
+                params = [locale_from, locale_to, origin, origin]
 
                 if translation is not None:
                     conditions.append("translation = ?")
                     params.append(translation)
 
                 if category is None:
+                    conditions.append("category_key IS NULL")
                     conditions.append("category IS NULL")
                 else:
+                    conditions.append("category_key = lower(trim(?))")
                     conditions.append("category = ?")
-                    params.append(category)
+                    params.extend((category, category))
 
                 query = f"DELETE FROM vocabulary_items WHERE {' AND '.join(conditions)}"
                 cursor = conn.execute(query, tuple(params))
@@ -0,0 +1,119 @@
+# Copyright 2026 The terCAD team. All rights reserved.
+# Use of this source code is governed by a CC BY-NC-ND 4.0 license that can be found in the LICENSE file.
+
+import json
+from typing import Any, Container, Iterator, TextIO, Tuple
+
+_WHITESPACE = ' \t\n\r'
+_DELIMITERS = _WHITESPACE + ',:]}'
+
+
+class JsonStreamReader:
+    """
+    Incremental reader for a top-level JSON object.
+
+    Members are decoded one at a time from a text stream read in chunks, and
+    selected array members are yielded item by item, so memory stays bounded
+    by the largest single value rather than the whole document.
+    """
+
+    def __init__(self, fh: TextIO, chunk_size: int = 1 << 16):
+        self._fh = fh
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+
+    def members(self, stream_keys: Container[str] = ()) -> Iterator[Tuple[str, Any]]:
+        """
+        Iterate over the members of the top-level object.
+
+        Args:
+            stream_keys: Keys whose array value is yielded as an iterator of items
+                instead of a list; items left unconsumed are skipped
+
+        Returns:
+            Iterator of (key, value) pairs in document order
+
+        Raises:
+            ValueError: If the document is not a well-formed JSON object
+        """
+        self._expect('{')
+        if self._peek() == '}':
+            self._pos += 1
+            return
+
+        while True:
+            key = self._value()
+            if not isinstance(key, str):
+                raise ValueError(f"Invalid JSON: expected a member name at offset {self._pos}")
+            self._expect(':')
+
+            if key in stream_keys:
+                items = self._array_items()
+                yield key, items
+                for _ in items:
+                    pass
+            else:
+                yield key, self._value()
+
+            if self._expect(',}') == '}':
+                return
+
+    def _array_items(self) -> Iterator[Any]:
+        """Yield the items of the array starting at the current position."""
+        self._expect('[')
+        if self._peek() == ']':
+            self._pos += 1
+            return
+
+        while True:
+            yield self._value()
+            if self._expect(',]') == ']':
+                return
+
+    def _fill(self) -> bool:
+        """Append the next chunk to the unread part of the buffer."""
+        chunk = self._fh.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _peek(self) -> str:
+        """Get the next non-whitespace character without consuming it ('' at end of input)."""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                return ''
+
+    def _expect(self, chars: str) -> str:
+        """Consume one of the given structural characters."""
+        char = self._peek()
+        if not char or char not in chars:
+            found = repr(char) if char else 'end of input'
+            raise ValueError(f"Invalid JSON: expected one of {chars!r}, found {found}")
+        self._pos += 1
+        return char
+
+    def _value(self) -> Any:
+        """Decode one complete value, reading more input until it is available."""
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+                # A number cut at the end of a chunk may continue in the next one,
+                # so a value only counts as complete when a delimiter follows it
+                if self._eof or (end < len(self._buffer) and self._buffer[end] in _DELIMITERS):
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError as e:
+                if self._eof:
+                    raise ValueError(f"Invalid JSON: {e}") from e
+            self._fill()
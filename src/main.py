@@ -16,56 +16,67 @@
 # Dependencies:
 # > choco install ffmpeg
 
+import multiprocessing
 import os
-import kivy
-import kivy.resources
 import sys
 from pathlib import Path
+
+if __name__ == '__main__':
+    # Frozen desktop builds start comparison workers by running the app
+    # executable again; such a process runs its worker here and exits
+    multiprocessing.freeze_support()
+
+import kivy
+import kivy.resources
 from kivy.config import Config
 
 _PROJECT_ROOT = Path(__file__).resolve().parent.parent
 _BOOTSTRAP_ICON = _PROJECT_ROOT / 'assets' / 'images' / 'logo_44.png'
 Config.set('kivy', 'window_icon', str(_BOOTSTRAP_ICON))
 
-from component.card_screen import CardScreen
-from component.loading_screen import LoadingScreen
-from component.main_screen import MainScreen
-from component.dictionary_screen import DictionaryScreen
-from component.dictionary_management_screen import DictionaryManagementScreen
-from component.phonetics_screen import PhoneticsScreen
-from component.articulation_screen import ArticulationScreen
-from component.store_update_screen import StoreUpdateScreen
-from component.structure_screen import StructureScreen
-from component.structure_update_screen import StructureUpdateScreen
-from component.language_screen import LanguageScreen
-from component.vocabulary_add_screen import VocabularyAddScreen
-from component.category_add_screen import CategoryAddScreen
-from component.language_pair_add_screen import LanguagePairAddScreen
-from component.language_pair_io_screen import LanguagePairExportScreen, LanguagePairImportScreen
-
 # Clean Architecture imports
 from infrastructure.di.container import DependencyContainer
 
-## Load all widgets (for distribution) to avoid:
-# AttributeError: module 'component' has no attribute 'recorder_widget'
-import component.harmonica_widget
-import component.phonetics_widget
-import component.recorder_widget
-import component.card_layout_widget
-
 from kivy.app import App
 from kivy.clock import Clock
-from kivy.core.window import Window
 from kivy.lang import Builder
 from kivy.metrics import dp
 from kivy.properties import BooleanProperty, StringProperty, ListProperty, ObjectProperty, NumericProperty
 from kivy.uix.screenmanager import ScreenManager
 from kivy.uix.scrollview import ScrollView
-from kivy.uix.textinput import TextInput
 from kivy.utils import platform
 
-from kivy.base import EventLoop
-EventLoop.ensure_window()
+# Spawned comparison workers import this file as __mp_main__; the screens,
+# widgets and everything else that opens the window belong to the app only
+if __name__ != '__mp_main__':
+    from component.card_screen import CardScreen
+    from component.loading_screen import LoadingScreen
+    from component.main_screen import MainScreen
+    from component.dictionary_screen import DictionaryScreen
+    from component.dictionary_management_screen import DictionaryManagementScreen
+    from component.phonetics_screen import PhoneticsScreen
+    from component.articulation_screen import ArticulationScreen
+    from component.store_update_screen import StoreUpdateScreen
+    from component.structure_screen import StructureScreen
+    from component.structure_update_screen import StructureUpdateScreen
+    from component.language_screen import LanguageScreen
+    from component.vocabulary_add_screen import VocabularyAddScreen
+    from component.category_add_screen import CategoryAddScreen
+    from component.language_pair_add_screen import LanguagePairAddScreen
+    from component.language_pair_io_screen import LanguagePairExportScreen, LanguagePairImportScreen
+
+    ## Load all widgets (for distribution) to avoid:
+    # AttributeError: module 'component' has no attribute 'recorder_widget'
+    import component.harmonica_widget
+    import component.phonetics_widget
+    import component.recorder_widget
+    import component.card_layout_widget
+
+    from kivy.core.window import Window
+    from kivy.uix.textinput import TextInput
+
+    from kivy.base import EventLoop
+    EventLoop.ensure_window()
 
 class MainApp(App):
     """
@@ -177,6 +188,28 @@ class MainApp(App):
         """Get the image directory for current locale."""
         return self._resource_service.get_image_directory(self.locale_to)
 
+    def _flush_vocabulary_progress(self):
+        """Persist answers buffered by the current vocabulary service."""
+        if self._vocabulary_service:
+            self._vocabulary_service.flush_progress()
+
+    def on_start(self):
+        # Audio stacks load in the background once the first frame is on screen
+        if self._config_repo.get_app_setting('audio_prewarm', '1') != '0':
+            Window.bind(on_flip=self._on_first_frame)
+
+    def _on_first_frame(self, *args):
+        Window.unbind(on_flip=self._on_first_frame)
+        self._container.load_audio_services()
+
+    def on_pause(self):
+        self._flush_vocabulary_progress()
+        return True
+
+    def on_stop(self):
+        self._flush_vocabulary_progress()
+        self._container.shutdown()
+
     def _sync_store_from_vocabulary_service(self, force_shuffle: bool, limit: int = 25):
         """Prepare the current study set and publish it to the app store."""
         self._vocabulary_service.prepare_study_set(limit, force_shuffle)
@@ -248,6 +281,9 @@ class MainApp(App):
             force_shuffle: If True, uses random shuffle instead of ML prioritization.
         """
         if data_path:
+            # Buffered answers belong to the service being replaced
+            self._flush_vocabulary_progress()
+
             # Check if we should load from database
             # If data_path is not a file path (no extension or assets/ prefix), treat it as database request
             is_file_path = (data_path.startswith('assets/') or '.' in data_path.split('/')[-1])
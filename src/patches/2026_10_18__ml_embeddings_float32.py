@@ -0,0 +1,39 @@
+# Copyright 2026 The terCAD team. All rights reserved.
+# Use of this source code is governed by a CC BY-NC-ND 4.0 license that can be found in the LICENSE file.
+
+"""
+Patch: Store ML embeddings as raw float32 (2026-10-18).
+Converts pickled numpy arrays in ml_embeddings to little-endian float32 BLOBs.
+"""
+
+import pickle
+import sqlite3
+import numpy as np
+from infrastructure.persistence.database_patches import DatabasePatches
+
+
+@DatabasePatches.register("ml_embeddings_raw_float32", version="1.0.0")
+def patch_ml_embeddings_raw_float32(conn: sqlite3.Connection) -> None:
+    """
+    Convert ml_embeddings.embedding_vector from pickle to raw float32.
+
+    Embeddings are then loaded with a single query and viewed through
+    np.frombuffer instead of being unpickled row by row. Rows that cannot be
+    unpickled are dropped; they are regenerated on demand.
+    """
+    cursor = conn.cursor()
+    cursor.execute("SELECT id, embedding_vector FROM ml_embeddings")
+    rows = cursor.fetchall()
+
+    converted = []
+    broken = []
+    for row_id, blob in rows:
+        try:
+            vector = pickle.loads(blob)
+            converted.append((np.asarray(vector, dtype='<f4').tobytes(), row_id))
+        except Exception:
+            broken.append((row_id,))
+
+    cursor.executemany("UPDATE ml_embeddings SET embedding_vector = ? WHERE id = ?", converted)
+    cursor.executemany("DELETE FROM ml_embeddings WHERE id = ?", broken)
+    conn.commit()
@@ -0,0 +1,41 @@
+# Copyright 2026 The terCAD team. All rights reserved.
+# Use of this source code is governed by a CC BY-NC-ND 4.0 license that can be found in the LICENSE file.
+
+"""
+Patch: Normalized vocabulary keys (2026-10-18).
+Adds generated category_key/origin_key columns and a composite lookup index.
+"""
+
+import sqlite3
+from infrastructure.persistence.database_patches import DatabasePatches
+
+
+@DatabasePatches.register("vocabulary_normalized_keys", version="1.0.0")
+def patch_vocabulary_normalized_keys(conn: sqlite3.Connection) -> None:
+    """
+    Add lower(trim(...)) key columns to vocabulary_items and index them.
+
+    The columns are VIRTUAL generated columns, so they never drift from
+    origin/category. The (language_pair_id, category_key, origin_key) index
+    turns duplicate checks, per-word lookups and deletes into index seeks.
+    """
+    cursor = conn.cursor()
+    # Generated columns are only listed by table_xinfo
+    columns = {row[1] for row in cursor.execute("PRAGMA table_xinfo(vocabulary_items)")}
+
+    if 'category_key' not in columns:
+        cursor.execute(
+            """ALTER TABLE vocabulary_items
+               ADD COLUMN category_key TEXT GENERATED ALWAYS AS (lower(trim(category))) VIRTUAL"""
+        )
+    if 'origin_key' not in columns:
+        cursor.execute(
+            """ALTER TABLE vocabulary_items
+               ADD COLUMN origin_key TEXT GENERATED ALWAYS AS (lower(trim(origin))) VIRTUAL"""
+        )
+
+    cursor.execute(
+        """CREATE INDEX IF NOT EXISTS idx_vocab_pair_keys
+           ON vocabulary_items(language_pair_id, category_key, origin_key)"""
+    )
+    conn.commit()
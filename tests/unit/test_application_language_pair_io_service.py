@@ -0,0 +1,203 @@
+# Copyright 2026 The terCAD team. All rights reserved.
+# Use of this source code is governed by a CC BY-NC-ND 4.0 license that can be found in the LICENSE file.
+
+"""Tests for streaming LanguagePairIOService export and import."""
+
+import json
+
+import pytest
+
+from application.services.language_pair_io_service import LanguagePairIOService
+from domain.entities.vocabulary_item import VocabularyItem
+from infrastructure.persistence.database_connection import DatabaseConnection
+from infrastructure.persistence.sqlite_config_repository import SQLiteConfigRepository
+from infrastructure.persistence.sqlite_vocabulary_repository import SQLiteVocabularyRepository
+
+
+class TestLanguagePairIOService:
+    """Test language pair export/import."""
+
+    @pytest.fixture
+    def db_connection(self, tmp_path):
+        """Create a temporary database connection for testing."""
+        return DatabaseConnection(str(tmp_path / "test_tlum.db"))
+
+    @pytest.fixture
+    def vocab_repo(self, db_connection):
+        """Create a vocabulary repository for testing."""
+        return SQLiteVocabularyRepository(db_connection)
+
+    @pytest.fixture
+    def service(self, db_connection, vocab_repo):
+        """Create a service with one exported-ready language pair."""
+        config_repo = SQLiteConfigRepository(db_connection)
+        config_repo.add_language_pair("EN", "PL", "EN-PL")
+        config_repo.add_game_category("EN", "PL", "Verbs", "verbs")
+        vocab_repo.save_vocabulary_items("EN", "PL", [
+            VocabularyItem("hello", "cześć", sound="hello.mp3", category="verbs"),
+            VocabularyItem("quote \"x\"", "line\nbreak", category="verbs"),
+            VocabularyItem("cat", "kot"),
+        ])
+        return LanguagePairIOService(vocab_repo, config_repo)
+
+    def write_pack(self, path, payload):
+        """Write an import file the way json.dump would."""
+        with open(path, 'w', encoding='utf-8') as fh:
+            json.dump(payload, fh, ensure_ascii=False, indent=2)
+
+    def test_export_matches_json_dump_layout(self, service, tmp_path):
+        """Test that the streamed export is byte-identical to json.dump with indent=2."""
+        path = tmp_path / "pack.json"
+
+        count = service.export_language_pair("EN", "PL", str(path))
+
+        text = path.read_text(encoding='utf-8')
+        payload = json.loads(text)
+        assert count == 3
+        assert text == json.dumps(payload, ensure_ascii=False, indent=2)
+        assert [entry['origin'] for entry in payload['vocabulary']] == ["hello", "quote \"x\"", "cat"]
+        assert payload['categories'][0]['vocabulary_source'] == "verbs"
+
+    def test_export_empty_vocabulary(self, service, vocab_repo, tmp_path):
+        """Test that a pair without words exports an empty array."""
+        vocab_repo.save_vocabulary_items("EN", "PL", [])
+        path = tmp_path / "pack.json"
+
+        assert service.export_language_pair("EN", "PL", str(path)) == 0
+        assert json.loads(path.read_text(encoding='utf-8'))['vocabulary'] == []
+
+    def test_round_trip_to_new_pair(self, service, vocab_repo, tmp_path):
+        """Test that an exported pack imports into another language pair."""
+        path = tmp_path / "pack.json"
+        service.export_language_pair("EN", "PL", str(path))
+        payload = json.loads(path.read_text(encoding='utf-8'))
+        payload['locale_to'] = "es"
+        self.write_pack(path, payload)
+
+        result = service.import_language_pair(str(path))
+
+        assert result == {
+            'locale_from': "EN",
+            'locale_to': "ES",
+            'categories_imported': 1,
+            'vocabulary_imported': 3,
+        }
+        items = vocab_repo.load_by_language_pair("EN", "ES")
+        assert [(item.origin, item.translation, item.sound) for item in items] == [
+            ("hello", "cześć", "hello.mp3"),
+            ("quote \"x\"", "line\nbreak", None),
+            ("cat", "kot", None),
+        ]
+
+    def test_import_in_batches_reports_progress(self, service, vocab_repo, tmp_path):
+        """Test that a replacing import is saved batch by batch with progress."""
+        path = tmp_path / "pack.json"
+        self.write_pack(path, {
+            'locale_from': "EN",
+            'locale_to': "PL",
+            'vocabulary': [{'origin': f"w{i}", 'translation': f"t{i}"} for i in range(5)],
+        })
+        progress = []
+
+        result = service.import_language_pair(str(path), batch_size=2, progress=lambda *args: progress.append(args))
+
+        assert progress == [(2, 5), (4, 5), (5, 5)]
+        assert result['vocabulary_imported'] == 5
+        assert [item.origin for item in vocab_repo.load_by_language_pair("EN", "PL")] == [f"w{i}" for i in range(5)]
+
+    def test_import_merge_appends(self, service, vocab_repo, tmp_path):
+        """Test that merging keeps existing words."""
+        path = tmp_path / "pack.json"
+        self.write_pack(path, {
+            'locale_from': "EN",
+            'locale_to': "PL",
+            'vocabulary': [{'origin': "dog", 'translation': "pies"}],
+        })
+
+        service.import_language_pair(str(path), merge=True)
+
+        assert len(vocab_repo.load_by_language_pair("EN", "PL")) == 4
+
+    def test_import_header_after_vocabulary(self, service, vocab_repo, tmp_path):
+        """Test that member order in the file does not matter."""
+        path = tmp_path / "pack.json"
+        path.write_text(
+            '{"vocabulary": [{"origin": "dog", "translation": "pies"}], "locale_to": "DE", "locale_from": "EN"}',
+            encoding='utf-8'
+        )
+
+        result = service.import_language_pair(str(path))
+
+        assert result['vocabulary_imported'] == 1
+        assert vocab_repo.load_by_language_pair("EN", "DE")[0].origin == "dog"
+
+    def test_invalid_entry_fails_before_writing(self, service, vocab_repo, tmp_path):
+        """Test that entries are validated before existing words are replaced."""
+        path = tmp_path / "pack.json"
+        self.write_pack(path, {
+            'locale_from': "EN",
+            'locale_to': "PL",
+            'vocabulary': [{'origin': f"w{i}", 'translation': f"t{i}"} for i in range(3)] + [{'origin': "x"}],
+        })
+
+        with pytest.raises(KeyError):
+            service.import_language_pair(str(path), batch_size=2)
+
+        assert len(vocab_repo.load_by_language_pair("EN", "PL")) == 3
+
+    def test_duplicate_across_batches_keeps_previous_vocabulary(self, service, vocab_repo, tmp_path):
+        """Test that a word repeated in a later batch fails the import without touching stored words."""
+        vocab_repo.save_vocabulary_items("EN", "PL", [VocabularyItem("keep", "trzymać", category="c")])
+        path = tmp_path / "pack.json"
+        self.write_pack(path, {
+            'locale_from': "EN",
+            'locale_to': "PL",
+            'vocabulary': [{'origin': origin, 'translation': "t", 'category': "c"} for origin in ("w0", "w1", "w2", "w0")],
+        })
+
+        with pytest.raises(ValueError, match="Duplicate word"):
+            service.import_language_pair(str(path), batch_size=2)
+
+        assert [item.origin for item in vocab_repo.load_by_language_pair("EN", "PL")] == ["keep"]
+
+    def test_failed_batch_rolls_back_earlier_batches(self, service, vocab_repo, tmp_path):
+        """Test that all batches of an import share one transaction."""
+        vocab_repo.save_vocabulary_items("EN", "PL", [VocabularyItem("w2", "t", category="c")])
+        path = tmp_path / "pack.json"
+        self.write_pack(path, {
+            'locale_from': "EN",
+            'locale_to': "PL",
+            'vocabulary': [{'origin': f"w{i}", 'translation': "t", 'category': "c"} for i in range(4)],
+        })
+
+        with pytest.raises(ValueError, match="already exists"):
+            service.import_language_pair(str(path), merge=True, batch_size=2)
+
+        assert [item.origin for item in vocab_repo.load_by_language_pair("EN", "PL")] == ["w2"]
+
+    def test_replacing_import_in_batches(self, service, vocab_repo, tmp_path):
+        """Test that every batch of a replacing import lands, also over pre-existing words."""
+        vocab_repo.save_vocabulary_items("EN", "PL", [VocabularyItem("w3", "old", category="c")])
+        path = tmp_path / "pack.json"
+        self.write_pack(path, {
+            'locale_from': "EN",
+            'locale_to': "PL",
+            'vocabulary': [{'origin': f"w{i}", 'translation': "new", 'category': "c"} for i in range(5)],
+        })
+
+        service.import_language_pair(str(path), batch_size=2)
+
+        items = vocab_repo.load_by_language_pair("EN", "PL")
+        assert [(item.origin, item.translation) for item in items] == [(f"w{i}", "new") for i in range(5)]
+
+    def test_truncated_file_is_rejected(self, service, tmp_path):
+        """Test that an incomplete document raises ValueError."""
+        path = tmp_path / "pack.json"
+        path.write_text('{"locale_from": "EN", "locale_to": "PL", "vocabulary": [{"origin": "a"', encoding='utf-8')
+
+        with pytest.raises(ValueError):
+            service.import_language_pair(str(path))
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -3,11 +3,75 @@
 
 """Tests for MediaService."""
 
-import pytest
+import base64
+import json
 import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+import pytest
+import requests
 from unittest.mock import Mock, patch
 
 from application.services.media_service import MediaService
+from infrastructure.audio.tts_audio_cache import TtsAudioCache
+from infrastructure.audio.tts_failure_tracker import TtsFailureTracker
+
+
+def fake_mp3(word):
+    """Bytes whose base64 form starts with the //OE marker the TTS parser looks for."""
+    return b'\xff\xf3\x84' + word.encode('utf-8')
+
+
+class FakeTTSServer(ThreadingHTTPServer):
+    """Local stand-in for the TTS endpoint; records concurrency and client connections."""
+
+    daemon_threads = True
+    delay = 0.2
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), FakeTTSHandler)
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+        self.words = []
+        self.clients = set()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}/batchexecute"
+
+
+class FakeTTSHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_POST(self):
+        server = self.server
+        form = parse_qs(self.rfile.read(int(self.headers['Content-Length'])).decode('utf-8'))
+        word = json.loads(json.loads(form['f.req'][0])[0][0][1])[0]
+        with server.lock:
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+            server.words.append(word)
+            server.clients.add(self.client_address)
+        time.sleep(server.delay)
+        with server.lock:
+            server.active -= 1
+
+        if word.startswith('fail'):
+            status, body = 500, b'error'
+        else:
+            audio = base64.b64encode(fake_mp3(word)).decode('ascii')
+            status, body = 200, f')]}}\'\n[["wrb.fr","jQ1olc","[\\"{audio}\\"]"]]'.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
 
 
 class TestMediaService:
@@ -48,5 +112,160 @@ class TestMediaService:
         assert result is not None
 
 
+class TestMediaServicePrefetch:
+    """Test concurrent TTS prefetch against a local server."""
+
+    @pytest.fixture
+    def server(self):
+        server = FakeTTSServer()
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield server
+        server.shutdown()
+        server.server_close()
+
+    @pytest.fixture
+    def session(self):
+        session = requests.Session()
+        yield session
+        session.close()
+
+    @pytest.fixture
+    def media_service(self, tmp_path, server, session):
+        return MediaService('en', str(tmp_path / "audio"), Mock(), session, server.url)
+
+    def test_generates_missing_files_concurrently(self, media_service, server):
+        """Test that a study set is generated over a bounded pool with per-item callbacks."""
+        words = [f"word{i}" for i in range(8)]
+        events = []
+
+        start = time.perf_counter()
+        paths = media_service.prefetch_audio_files(
+            [(word, None) for word in words],
+            on_item=lambda word, path, completed, total: events.append((word, path, completed, total)),
+            max_workers=4
+        ).result(timeout=30)
+        elapsed = time.perf_counter() - start
+
+        assert [os.path.basename(path) for path in paths] == [f"{word}.mp3" for word in words]
+        for word, path in zip(words, paths):
+            with open(path, 'rb') as f:
+                assert f.read() == fake_mp3(word)
+        assert sorted(word for word, *_ in events) == sorted(words)
+        assert [completed for *_, completed, _ in events] == list(range(1, 9))
+        assert all(total == 8 for *_, total in events)
+        assert 1 < server.max_active <= 4
+        assert elapsed < 8 * server.delay * 0.75
+        # Keep-alive: one connection per worker at most
+        assert len(server.clients) <= 4
+
+    def test_existing_and_duplicate_files(self, media_service, server, tmp_path):
+        """Test that local files need no request and repeated words are generated once."""
+        os.makedirs(tmp_path / "audio")
+        (tmp_path / "audio" / "cached.mp3").write_bytes(b'local')
+        events = []
+
+        future = media_service.prefetch_audio_files(
+            [("cached", None), ("new", None), ("new", "new.mp3")],
+            on_item=lambda word, path, completed, total: events.append(word)
+        )
+        assert events[0] == "cached"
+        paths = future.result(timeout=30)
+
+        assert server.words == ["new"]
+        assert paths[1] == paths[2] == str(tmp_path / "audio" / "new.mp3")
+        assert sorted(events) == ["cached", "new", "new"]
+
+    def test_failures_report_none(self, media_service, server, tmp_path):
+        """Test that failed words complete with None and leave no partial files."""
+        paths = media_service.prefetch_audio_files([("fail-1", None), ("ok", None)]).result(timeout=30)
+
+        assert paths[0] is None
+        assert paths[1] is not None
+        assert sorted(os.listdir(tmp_path / "audio")) == ["ok.mp3"]
+
+    def test_empty_request(self, media_service, server):
+        assert media_service.prefetch_audio_files([]).result(timeout=1) == []
+        assert server.words == []
+
+    def test_get_audio_file_uses_session(self, media_service, server, session):
+        """Test that single lookups reuse the injected session."""
+        with patch.object(session, 'post', wraps=session.post) as post:
+            path = media_service.get_audio_file("single")
+
+        assert post.call_count == 1
+        assert path.endswith("single.mp3")
+
+
+class TestMediaServiceCache:
+    """Test speech generation through the TTS cache."""
+
+    @pytest.fixture
+    def server(self):
+        server = FakeTTSServer()
+        server.delay = 0
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield server
+        server.shutdown()
+        server.server_close()
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        cache = TtsAudioCache(str(tmp_path / "tts"))
+        yield cache
+        cache.close()
+
+    def create_service(self, tmp_path, server, cache, lang):
+        return MediaService(lang, str(tmp_path / lang / "audio"), Mock(), None, server.url, audio_cache=cache)
+
+    def test_generated_audio_is_shared_across_directories(self, tmp_path, server, cache):
+        """Test that a word is generated once per language and not written to the audio directory."""
+        first = self.create_service(tmp_path, server, cache, 'pl')
+        second = self.create_service(tmp_path, server, cache, 'pl')
+
+        path = first.get_audio_file("dom")
+        assert second.get_audio_file("dom") == path
+        assert second.find_audio_file("dom", "custom.mp3") == path
+        assert server.words == ["dom"]
+        assert not os.path.exists(tmp_path / "pl" / "audio" / "dom.mp3")
+
+        other = self.create_service(tmp_path, server, cache, 'be')
+        assert other.find_audio_file("dom") is None
+        assert other.get_audio_file("dom") != path
+        assert server.words == ["dom", "dom"]
+        assert first.get_cache_stats()['entries'] == 2
+
+    def test_audio_directory_files_take_precedence(self, tmp_path, server, cache):
+        """Test that existing loose files keep being used."""
+        service = self.create_service(tmp_path, server, cache, 'en')
+        os.makedirs(tmp_path / "en" / "audio")
+        (tmp_path / "en" / "audio" / "local.mp3").write_bytes(b'local')
+
+        paths = service.prefetch_audio_files([("local", None), ("new", None)]).result(timeout=30)
+
+        assert paths[0] == str(tmp_path / "en" / "audio" / "local.mp3")
+        assert paths[1] == cache.get("new", "en")
+        assert server.words == ["new"]
+
+    def test_no_cache_stats_without_cache(self, tmp_path):
+        assert MediaService('en', str(tmp_path), Mock()).get_cache_stats() is None
+
+    def test_failures_fail_fast(self, tmp_path, server, cache):
+        """Test that failed words and an unreachable service are not requested again."""
+        tracker = TtsFailureTracker(str(tmp_path / "failures.json"), failure_threshold=2)
+        service = MediaService('en', str(tmp_path / "audio"), Mock(), None, server.url, cache, tracker)
+
+        assert service.get_audio_file("fail-1") is None
+        assert service.get_audio_file("fail-1") is None
+        assert server.words == ["fail-1"]
+
+        assert service.get_audio_file("fail-2") is None
+        # Circuit open: other words fail without a request
+        paths = service.prefetch_audio_files([("ok", None), ("fine", None)]).result(timeout=5)
+        assert paths == [None, None]
+        assert server.words == ["fail-1", "fail-2"]
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -6,7 +6,7 @@
 import pytest
 from unittest.mock import Mock
 
-from application.services.recorder_service import RecorderService
+from application.services.recorder_service import IRecorderController, RecorderService
 
 
 class TestRecorderService:
@@ -50,6 +50,46 @@ class TestRecorderService:
         assert recorder_service.is_recording() is False
         mock_controller.stop_recording.assert_called_once()
 
+    def test_set_block_listener(self, recorder_service, mock_controller):
+        """Test forwarding a block listener to the controller."""
+        listener = Mock()
+        recorder_service.set_block_listener(listener)
+
+        mock_controller.set_block_listener.assert_called_once_with(listener)
+
+    def test_set_auto_stop_listener(self, recorder_service, mock_controller):
+        """Test forwarding an auto-stop listener to the controller."""
+        listener = Mock()
+        recorder_service.set_auto_stop_listener(listener)
+
+        mock_controller.set_auto_stop_listener.assert_called_once_with(listener)
+
+    def test_warm_up(self, recorder_service, mock_controller):
+        """Test that warming up loads the controller's backend."""
+        recorder_service.warm_up()
+
+        mock_controller.warm_up.assert_called_once()
+
+    def test_get_last_audio(self, recorder_service, mock_controller):
+        """Test that captured samples come from the controller."""
+        mock_controller.get_last_audio.return_value = ([0, 1], 44100)
+
+        assert recorder_service.get_last_audio() == ([0, 1], 44100)
+
+    def test_default_controller_keeps_no_audio(self):
+        """Test that controllers without captured samples return None."""
+        class Controller(IRecorderController):
+            def get_initial_status(self, status_label):
+                return True
+
+            def start_recording(self, status_label):
+                return None
+
+            def stop_recording(self, status_label):
+                return None
+
+        assert RecorderService(Controller()).get_last_audio() is None
+
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -54,6 +54,7 @@ class TestResourceService:
         repo = Mock(spec=IResourceRepository)
         repo.find_resource.return_value = "/path/to/resource"
         repo.get_audio_dir.return_value = "/audio/en"
+        repo.get_audio_pack.return_value = "/audio/en.pack"
         repo.get_image_dir.return_value = "/images/en"
         repo.get_path_with_home_dir.return_value = "/home/user/file"
         return repo
@@ -77,6 +78,11 @@ class TestResourceService:
         assert result == "/audio/en"
         mock_repository.get_audio_dir.assert_called_once_with("en")
 
+    def test_get_audio_pack(self, resource_service, mock_repository):
+        """Test getting the audio pack."""
+        assert resource_service.get_audio_pack("en") == "/audio/en.pack"
+        mock_repository.get_audio_pack.assert_called_once_with("en")
+
     def test_get_image_directory(self, resource_service, mock_repository):
         """Test getting image directory."""
         result = resource_service.get_image_directory("en")
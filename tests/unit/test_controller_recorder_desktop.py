@@ -0,0 +1,126 @@
+# Copyright 2026 The terCAD team. All rights reserved.
+# Use of this source code is governed by a CC BY-NC-ND 4.0 license that can be found in the LICENSE file.
+
+"""Tests for RecorderControllerDesktop capture, auto-stop and trimming."""
+
+import numpy as np
+import pytest
+from unittest.mock import MagicMock, patch
+
+import controller.recorder_controller_desktop as desktop
+from controller.recorder_controller_desktop import RecorderControllerDesktop
+
+soundfile = pytest.importorskip("soundfile")
+
+SR = RecorderControllerDesktop.SAMPLE_RATE
+
+
+def speech_then_silence(rng, lead=0.5, speech=0.8, seconds=15):
+    """Room noise with a tone 'utterance' after `lead` seconds."""
+    signal = 0.002 * rng.standard_normal(SR * seconds)
+    t = np.arange(int(speech * SR)) / SR
+    start = int(lead * SR)
+    signal[start:start + len(t)] += 0.3 * np.sin(2 * np.pi * 220 * t)
+    return (signal * 32767).astype(np.int16)[:, None]
+
+
+class FakeInputStream:
+    """Plays a fixed signal through stream.read; calls on_read with the read count."""
+
+    def __init__(self, signal, on_read=None):
+        self.signal = signal
+        self.on_read = on_read
+        self.position = 0
+        self.reads = 0
+
+    def __call__(self, **kwargs):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def read(self, frames):
+        data = self.signal[self.position:self.position + frames]
+        self.position += frames
+        self.reads += 1
+        if self.on_read:
+            self.on_read(self.reads)
+        return data, False
+
+
+@pytest.fixture
+def capture(tmp_path, monkeypatch):
+    """Run start_recording against a fake input stream and collect listener calls."""
+    monkeypatch.setattr(desktop, '_load_desktop_audio', lambda: True)
+    monkeypatch.setattr(desktop, 'np', np)
+    monkeypatch.setattr(desktop, 'sf', soundfile)
+
+    def run(controller, stream):
+        blocks = []
+        stops = []
+        monkeypatch.setattr(desktop, 'sd', MagicMock(InputStream=stream))
+        controller.set_block_listener(lambda data, fs: blocks.append(np.array(data)))
+        controller.auto_stop_listener = lambda: stops.append(stream.position)
+        app = MagicMock(get_home_dir=lambda: str(tmp_path))
+        with patch.object(desktop.App, 'get_running_app', return_value=app):
+            path = controller.start_recording(None)
+        streamed = np.concatenate(blocks) if blocks else np.zeros((0, 1), dtype=np.int16)
+        return path, streamed, stops
+
+    return run
+
+
+class TestRecorderControllerDesktop:
+    """Test voice activity handling of desktop capture."""
+
+    def test_auto_stop_and_trim(self, capture):
+        """Test that trailing silence ends the recording and only padded speech is kept and streamed."""
+        signal = speech_then_silence(np.random.default_rng(0))
+        controller = RecorderControllerDesktop(auto_stop_silence=1.0)
+
+        path, streamed, stops = capture(controller, FakeInputStream(signal))
+
+        audio, fs = controller.get_last_audio()
+        pad = controller.TRIM_PADDING
+        assert fs == SR
+        assert len(stops) == 1 and controller.recording is False
+        # Speech ends at 1.3 s; one second of silence later the capture stops
+        assert stops[0] / SR == pytest.approx(2.3, abs=0.05)
+        assert len(audio) / SR == pytest.approx(0.8 + 2 * pad, abs=0.05)
+        assert np.array_equal(streamed, audio)
+        assert soundfile.info(path).frames == pytest.approx(len(audio), abs=2048)
+
+    def test_no_speech_keeps_recording(self, capture):
+        """Test that silence alone neither stops nor trims the recording."""
+        signal = speech_then_silence(np.random.default_rng(1), speech=0)
+        controller = RecorderControllerDesktop(auto_stop_silence=1.0)
+
+        def stop_after(reads):
+            if reads == 100:
+                controller.stop_recording(None)
+
+        _, streamed, stops = capture(controller, FakeInputStream(signal, stop_after))
+
+        audio, _ = controller.get_last_audio()
+        assert stops == []
+        assert len(audio) == 100 * controller.BLOCK_SIZE
+        assert np.array_equal(streamed, audio)
+
+    def test_duration_limit_notifies(self, capture):
+        """Test that reaching the duration limit counts as stopping by itself."""
+        signal = speech_then_silence(np.random.default_rng(2), speech=0)
+        controller = RecorderControllerDesktop(auto_stop_silence=None, trim_silence=False)
+
+        _, streamed, stops = capture(controller, FakeInputStream(signal))
+
+        audio, _ = controller.get_last_audio()
+        assert stops == [SR * controller.MAX_DURATION]
+        assert len(audio) == SR * controller.MAX_DURATION
+        assert np.array_equal(streamed, audio)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
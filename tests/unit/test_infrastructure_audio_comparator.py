@@ -3,11 +3,28 @@
 
 """Tests for LibrosaAudioComparator."""
 
+import time
+
+import numpy as np
 import pytest
 from unittest.mock import patch
 
 from domain.services.audio_comparator import IAudioComparator
-from infrastructure.audio.librosa_audio_comparator import LibrosaAudioComparator
+from infrastructure.audio.librosa_audio_comparator import DecodedAudio, LibrosaAudioComparator
+
+
+def synthesize_words(tmp_path, name, pattern, sr=16000):
+    """Write a WAV with a tone per word separated by silence; pattern is (tone_s, pause_s) pairs."""
+    soundfile = pytest.importorskip("soundfile")
+    rng = np.random.default_rng(len(name))
+    parts = []
+    for index, (tone, pause) in enumerate(pattern):
+        t = np.arange(int(tone * sr)) / sr
+        parts.append(0.5 * np.sin(2 * np.pi * (220 + 110 * index) * t))
+        parts.append(0.001 * rng.standard_normal(int(pause * sr)))
+    path = str(tmp_path / f"{name}.wav")
+    soundfile.write(path, np.concatenate(parts).astype(np.float32), sr)
+    return path
 
 
 class TestLibrosaAudioComparator:
@@ -39,5 +56,140 @@ class TestLibrosaAudioComparator:
             assert "feedback" in result[0]
 
 
+
+class TestLibrosaAudioPipeline:
+    """Test the single-decode comparison pipeline."""
+
+    WORDS = [(0.4, 0.3), (0.5, 0.3), (0.3, 0.2)]
+
+    @pytest.fixture
+    def comparator(self):
+        """Create a comparator, skipping when audio dependencies are missing."""
+        comparator = LibrosaAudioComparator()
+        if not comparator.is_available():
+            pytest.skip("numpy and librosa are required")
+        return comparator
+
+    @pytest.fixture
+    def files(self, tmp_path):
+        """Reference and recorded files with three spoken 'words'."""
+        original = synthesize_words(tmp_path, "original", self.WORDS)
+        recorded = synthesize_words(tmp_path, "recorded", [(0.45, 0.25), (0.5, 0.35), (0.3, 0.2)])
+        return original, recorded
+
+    def test_nonsilent_ranges_match_pydub(self, comparator, files):
+        """Test that buffer-based silence detection follows pydub."""
+        silence = pytest.importorskip("pydub.silence")
+        AudioSegment = pytest.importorskip("pydub").AudioSegment
+        audio = comparator._decode_audio(files[0])
+
+        segment = AudioSegment.from_file(files[0])
+        threshold = segment.dBFS - 20
+        expected = silence.detect_nonsilent(segment, min_silence_len=140, silence_thresh=threshold, seek_step=5)
+        result = comparator._detect_nonsilent(audio, min_silence_len=140, silence_thresh=threshold, seek_step=5)
+
+        assert comparator._dbfs(audio.samples) == pytest.approx(threshold + 20, abs=0.1)
+        assert len(result) == len(expected) == 3
+        for (start, end), (expected_start, expected_end) in zip(result, expected):
+            assert abs(start - expected_start) <= 5
+            assert abs(end - expected_end) <= 5
+
+    def test_word_boundaries_from_buffer(self, comparator, files):
+        """Test that word segments are found in the decoded buffer."""
+        audio = comparator._decode_audio(files[0])
+
+        segments = comparator._word_boundaries(comparator._analyze(audio, with_segments=True), 3)
+
+        assert [round(start / 100) for start, _ in segments] == [0, 7, 15]
+
+    def test_each_file_decoded_once(self, comparator, files):
+        """Test that one comparison decodes each file exactly once."""
+        with patch.object(comparator, '_decode_audio', wraps=comparator._decode_audio) as decode:
+            words = comparator.compare_audio(*files, reference_text="one two three")
+            seconds = comparator.compare_audio(*files)
+
+        assert [call.args[0] for call in decode.call_args_list] == list(files) * 2
+        assert [item["word"] for item in words] == ["one", "two", "three"]
+        assert len(seconds) == 2
+        assert all(0.0 <= item["score"] <= 100.0 for item in words + seconds)
+
+    def test_captured_samples_skip_decoding(self, comparator, files, tmp_path):
+        """Test that captured PCM is compared like the file it would be saved as, without decoding it."""
+        soundfile = pytest.importorskip("soundfile")
+        samples = (np.sin(2 * np.pi * 330 * np.arange(44100 * 2) / 44100) * 12000).astype(np.int16)[:, None]
+        captured = str(tmp_path / "captured.wav")
+        soundfile.write(captured, samples, 44100, subtype='PCM_16')
+        expected = comparator.compare_audio(files[0], captured, reference_text="one two three")
+
+        with patch.object(comparator, '_decode_audio', wraps=comparator._decode_audio) as decode:
+            result = comparator.compare_audio(
+                files[0], "not-written.mp3", reference_text="one two three", recorded_audio=(samples, 44100)
+            )
+
+        assert [call.args[0] for call in decode.call_args_list] == [files[0]]
+        assert [item["score"] for item in result] == pytest.approx([item["score"] for item in expected], abs=0.5)
+
+    def test_latency_bounded_by_two_decodes(self, comparator, files):
+        """Test that comparison latency grows by two decodes, not one per analysis step."""
+        decode_delay = 0.25
+        decode = comparator._decode_audio
+        comparator.compare_audio(*files, reference_text="one two three")
+
+        start = time.perf_counter()
+        comparator.compare_audio(*files, reference_text="one two three")
+        baseline = time.perf_counter() - start
+
+        def slow_decode(file_path):
+            time.sleep(decode_delay)
+            return decode(file_path)
+
+        with patch.object(comparator, '_decode_audio', side_effect=slow_decode):
+            start = time.perf_counter()
+            comparator.compare_audio(*files, reference_text="one two three")
+            elapsed = time.perf_counter() - start
+
+        assert elapsed - baseline < 2.5 * decode_delay
+
+    def test_pool_per_second(self, comparator):
+        """Test that frames are averaged into the second their center falls in."""
+        hop = comparator.HOP_LENGTH
+        features = np.arange(2 * 70, dtype=float).reshape(2, 70)
+
+        pooled = comparator._pool_per_second(features, 16000, 3)
+
+        # 16000 / 512 = 31.25 frames per second
+        expected = [features[:, 0:32].mean(axis=1), features[:, 32:63].mean(axis=1), features[:, 63:70].mean(axis=1)]
+        assert hop == 512
+        assert pooled == pytest.approx(np.array(expected))
+
+    def test_seconds_use_one_mfcc_per_recording(self, comparator, files, tmp_path):
+        """Test that the per-second mode extracts features once per recording, in memory."""
+        before = sorted(tmp_path.iterdir())
+        mfcc = comparator._extract_feature_sequence
+
+        with patch.object(comparator, '_extract_feature_sequence', wraps=mfcc) as extract:
+            seconds = comparator.compare_audio(*files)
+        with patch.object(comparator, '_extract_feature_sequence', wraps=mfcc) as extract_fallback, \
+                patch.object(comparator, '_word_boundaries', return_value=[]):
+            fallback = comparator.compare_audio(*files, reference_text="one two three")
+
+        assert extract.call_count == 2
+        assert extract_fallback.call_count == 2
+        assert fallback == seconds
+        assert sorted(tmp_path.iterdir()) == before
+
+    def test_missing_recorded_seconds_score_low(self, comparator):
+        """Test that seconds absent from the recording get the maximum deviation."""
+        rng = np.random.default_rng(0)
+        original = DecodedAudio(rng.standard_normal(16000 * 3).astype(np.float32) * 0.1, 16000)
+        recorded = DecodedAudio(original.samples[:16000].copy(), 16000)
+
+        summary = comparator._compare_by_seconds(comparator._analyze(original), comparator._analyze(recorded))
+
+        assert [item["second"] for item in summary] == [1, 2, 3]
+        assert [item["deviation"] for item in summary[1:]] == [100.0, 100.0]
+        assert summary[0]["deviation"] < 5.0
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
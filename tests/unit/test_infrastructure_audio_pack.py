@@ -0,0 +1,217 @@
+# Copyright 2026 The terCAD team. All rights reserved.
+# Use of this source code is governed by a CC BY-NC-ND 4.0 license that can be found in the LICENSE file.
+
+"""Tests for the audio pack format and builder."""
+
+import json
+import os
+from concurrent.futures import Future
+
+import pytest
+
+from domain.entities.vocabulary_item import VocabularyItem
+from unittest.mock import Mock
+
+from application.services.media_service import MediaService
+from infrastructure.audio.audio_pack import AudioPack, AudioPackWriter, pack_index_path, read_pack_index
+from infrastructure.audio.audio_pack_builder import AudioPackBuilder, PackStats, pack_entries
+
+
+class FakeMediaService:
+    """Serves files of an audio directory and 'generates' the rest, except words starting with 'fail'."""
+
+    def __init__(self, audio_dir):
+        self.audio_dir = audio_dir
+        self.generated = []
+
+    def find_audio_file(self, word, filename=None):
+        path = os.path.join(self.audio_dir, filename)
+        return path if os.path.exists(path) else None
+
+    def prefetch_audio_files(self, items, on_item=None, max_workers=None):
+        paths = []
+        for word, filename in items:
+            if word.startswith('fail'):
+                paths.append(None)
+                continue
+            path = os.path.join(self.audio_dir, filename)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, 'wb') as f:
+                f.write(f"tts:{word}".encode('utf-8'))
+            self.generated.append(word)
+            paths.append(path)
+        result = Future()
+        result.set_result(paths)
+        return result
+
+
+class TestAudioPackWriter:
+    """Test appending to and resuming a pack."""
+
+    def test_roundtrip(self, tmp_path):
+        pack_path = str(tmp_path / "audio.pack")
+        with AudioPackWriter(pack_path) as writer:
+            writer.add("dom.mp3", "dom", b'one')
+            writer.add("sub\\kot.mp3", "kot", b'three')
+
+        entries, _ = read_pack_index(pack_path)
+        assert entries == {"dom.mp3": (0, 3), "sub/kot.mp3": (3, 5)}
+        with open(pack_path, 'rb') as f:
+            assert f.read() == b'onethree'
+
+    def test_resume_drops_interrupted_tail(self, tmp_path):
+        """Test that data and index written after the last complete entry are discarded."""
+        pack_path = str(tmp_path / "audio.pack")
+        with AudioPackWriter(pack_path) as writer:
+            writer.add("a.mp3", "a", b'aaaa')
+        # An interrupted append: data without index line, then half an index line
+        with open(pack_path, 'ab') as f:
+            f.write(b'partial')
+        with open(pack_index_path(pack_path), 'a', encoding='utf-8') as f:
+            f.write('{"name": "b.mp3", "off')
+
+        with AudioPackWriter(pack_path) as writer:
+            assert "a.mp3" in writer
+            assert "b.mp3" not in writer
+            writer.add("b.mp3", "b", b'bb')
+
+        entries, _ = read_pack_index(pack_path)
+        assert entries == {"a.mp3": (0, 4), "b.mp3": (4, 2)}
+        with open(pack_index_path(pack_path), encoding='utf-8') as f:
+            assert all(json.loads(line) for line in f)
+
+    def test_rejects_foreign_index(self, tmp_path):
+        pack_path = str(tmp_path / "audio.pack")
+        with open(pack_index_path(pack_path), 'w') as f:
+            f.write('{"format": "other"}\n')
+
+        with pytest.raises(ValueError):
+            read_pack_index(pack_path)
+
+
+class TestAudioPack:
+    """Test memory-mapped reads and lazy extraction."""
+
+    @pytest.fixture
+    def pack_path(self, tmp_path):
+        pack_path = str(tmp_path / "PL" / "audio.pack")
+        with AudioPackWriter(pack_path) as writer:
+            writer.add("dom.mp3", "dom", b'dom-audio')
+            writer.add("words/kot_1.mp3", "kot", b'kot-audio')
+        return pack_path
+
+    def test_read_and_extract(self, pack_path, tmp_path):
+        pack = AudioPack(pack_path, str(tmp_path / "extract"))
+        try:
+            assert len(pack) == 2
+            assert pack.read("words/kot_1.mp3") == b'kot-audio'
+            assert pack.read("missing.mp3") is None
+
+            path = pack.get_path("dom.mp3")
+            assert path.startswith(str(tmp_path / "extract"))
+            with open(path, 'rb') as f:
+                assert f.read() == b'dom-audio'
+            os.remove(path)
+            # Resolved from memory once extracted
+            assert pack.get_path("dom.mp3") == path
+            assert pack.get_path("missing.mp3") is None
+        finally:
+            pack.close()
+
+    def test_rebuilt_pack_extracts_elsewhere(self, pack_path, tmp_path):
+        """Test that a rebuild gets a new extract directory and the old one is removed."""
+        other_path = str(tmp_path / "BE" / "audio.pack")
+        with AudioPackWriter(other_path) as writer:
+            writer.add("dom.mp3", "dom", b'be-audio')
+        other = AudioPack(other_path, str(tmp_path / "extract"))
+        other_extracted = other.get_path("dom.mp3")
+        other.close()
+        first = AudioPack(pack_path, str(tmp_path / "extract"))
+        path = first.get_path("dom.mp3")
+        first.close()
+        with AudioPackWriter(pack_path) as writer:
+            writer.add("new.mp3", "new", b'new-audio')
+
+        second = AudioPack(pack_path, str(tmp_path / "extract"))
+        try:
+            assert second.get_path("dom.mp3") != path
+            assert second.get_path("new.mp3") is not None
+            assert not os.path.exists(os.path.dirname(path))
+            # Extracted files of other packs are kept
+            assert os.path.exists(other_extracted)
+        finally:
+            second.close()
+
+    def test_media_service_prefers_pack_over_loose_files(self, pack_path, tmp_path):
+        """Test that packed clips resolve first and loose files remain a fallback."""
+        audio_dir = tmp_path / "PL" / "audio"
+        audio_dir.mkdir()
+        (audio_dir / "dom.mp3").write_bytes(b'loose-dom')
+        (audio_dir / "las.mp3").write_bytes(b'loose-las')
+        pack = AudioPack(pack_path, str(tmp_path / "extract"))
+        try:
+            service = MediaService('pl', str(audio_dir), Mock(), audio_pack=pack)
+
+            with open(service.get_audio_file("dom"), 'rb') as f:
+                assert f.read() == b'dom-audio'
+            assert service.find_audio_file("kot", "words/kot_1.mp3") == pack.get_path("words/kot_1.mp3")
+            assert service.find_audio_file("las") == str(audio_dir / "las.mp3")
+            assert service.find_audio_file("brak") is None
+            paths = service.prefetch_audio_files([("dom", None), ("las", None)]).result(timeout=1)
+            assert paths == [pack.get_path("dom.mp3"), str(audio_dir / "las.mp3")]
+        finally:
+            pack.close()
+
+
+class TestAudioPackBuilder:
+    """Test collecting, generating and resuming a pack build."""
+
+    @pytest.fixture
+    def items(self):
+        return [
+            VocabularyItem("dom", "house", sound="dom_1.mp3"),
+            VocabularyItem("kot", "cat"),
+            VocabularyItem("kot", "tomcat"),
+            VocabularyItem("fail", "error")
+        ]
+
+    def test_entries_use_audio_file_names(self, items):
+        assert pack_entries(items) == [("dom_1.mp3", "dom"), ("kot.mp3", "kot"), ("fail.mp3", "fail")]
+
+    def test_build_and_resume(self, tmp_path, items):
+        audio_dir = tmp_path / "audio"
+        audio_dir.mkdir()
+        (audio_dir / "dom_1.mp3").write_bytes(b'local')
+        media_service = FakeMediaService(str(audio_dir))
+        pack_path = str(tmp_path / "audio.pack")
+        chunks = []
+
+        with AudioPackWriter(pack_path) as writer:
+            stats = AudioPackBuilder(media_service, writer, workers=1).build(
+                pack_entries(items), on_chunk=lambda current: chunks.append(current.processed)
+            )
+
+        assert (stats.collected, stats.generated, stats.failed) == (1, 1, 1)
+        assert stats.bytes == len(b'local') + len(b'tts:kot')
+        assert chunks == [3]
+        assert media_service.generated == ["kot"]
+        assert set(read_pack_index(pack_path)[0]) == {"dom_1.mp3", "kot.mp3"}
+
+        # A second run only retries what is missing
+        with AudioPackWriter(pack_path) as writer:
+            stats = AudioPackBuilder(media_service, writer, remove_generated=True).build(pack_entries(items), PackStats())
+        assert (stats.skipped, stats.failed, stats.processed) == (2, 1, 1)
+        assert media_service.generated == ["kot"]
+
+    def test_generated_files_can_be_removed(self, tmp_path):
+        media_service = FakeMediaService(str(tmp_path / "staging"))
+
+        with AudioPackWriter(str(tmp_path / "audio.pack")) as writer:
+            stats = AudioPackBuilder(media_service, writer, remove_generated=True).build([("kot.mp3", "kot")])
+
+        assert stats.generated == 1
+        assert os.listdir(tmp_path / "staging") == []
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,165 @@
+# Copyright 2026 The terCAD team. All rights reserved.
+# Use of this source code is governed by a CC BY-NC-ND 4.0 license that can be found in the LICENSE file.
+
+"""Tests for batch scoring."""
+
+import json
+
+import numpy as np
+import pytest
+
+from infrastructure.audio.batch_scorer import BatchScorer, BatchStats, ScoringTask, read_completed_ids, read_manifest
+from infrastructure.audio.comparison_executor import ComparisonExecutor
+from infrastructure.audio.librosa_audio_comparator import LibrosaAudioComparator
+
+soundfile = pytest.importorskip("soundfile")
+
+
+def write_words(path, durations, seed=0):
+    """Write a WAV with a tone per word separated by short pauses."""
+    rng = np.random.default_rng(seed)
+    parts = []
+    for index, duration in enumerate(durations):
+        t = np.arange(int(duration * 16000)) / 16000
+        parts.append(0.4 * np.sin(2 * np.pi * (220 + 110 * index) * t))
+        parts.append(0.001 * rng.standard_normal(3200))
+    soundfile.write(str(path), np.concatenate(parts).astype(np.float32), 16000)
+    return str(path)
+
+
+@pytest.fixture(scope="module")
+def executor(tmp_path_factory):
+    """Two warm workers shared by the tests of this module."""
+    if not LibrosaAudioComparator().is_available():
+        pytest.skip("numpy and librosa are required")
+    executor = ComparisonExecutor(str(tmp_path_factory.mktemp("features")), max_workers=2)
+    executor.warm_up()
+    yield executor
+    executor.shutdown()
+
+
+@pytest.fixture
+def tasks(tmp_path):
+    """Five recordings against two references, plus one missing recording."""
+    references = [write_words(tmp_path / f"reference{i}.wav", [0.4, 0.5, 0.3], seed=i) for i in range(2)]
+    tasks = [
+        ScoringTask(str(k), references[k % 2], write_words(tmp_path / f"rec{k}.wav", [0.45, 0.5, 0.35], seed=10 + k), "a b c")
+        for k in range(5)
+    ]
+    tasks.append(ScoringTask("missing", references[0], str(tmp_path / "missing.wav")))
+    return tasks
+
+
+class TestReadManifest:
+    """Test manifest parsing."""
+
+    def test_jsonl(self, tmp_path):
+        """Test that ids default to the entry number and paths resolve against the manifest."""
+        manifest = tmp_path / "manifest.jsonl"
+        manifest.write_text(
+            json.dumps({"reference": "ref.wav", "recording": "a.wav", "text": "hello"}) + "\n\n"
+            + json.dumps({"id": "b", "reference": "ref.wav", "recording": "/abs/b.wav"}) + "\n"
+        )
+
+        tasks = read_manifest(str(manifest))
+
+        assert [task.id for task in tasks] == ["1", "b"]
+        assert tasks[0].reference == str(tmp_path / "ref.wav")
+        assert tasks[0].text == "hello"
+        assert tasks[1].recording == "/abs/b.wav"
+        assert tasks[1].text == ""
+
+    def test_csv(self, tmp_path):
+        """Test a CSV manifest with a header row."""
+        manifest = tmp_path / "manifest.csv"
+        manifest.write_text("id,reference,recording,text\nx,ref.wav,a.wav,one two\n")
+
+        tasks = read_manifest(str(manifest))
+
+        assert tasks == [ScoringTask("x", str(tmp_path / "ref.wav"), str(tmp_path / "a.wav"), "one two")]
+
+    def test_duplicate_id(self, tmp_path):
+        """Test that repeated ids are rejected."""
+        manifest = tmp_path / "manifest.csv"
+        manifest.write_text("id,reference,recording\nx,ref.wav,a.wav\nx,ref.wav,b.wav\n")
+
+        with pytest.raises(ValueError):
+            read_manifest(str(manifest))
+
+
+class TestReadCompletedIds:
+    """Test resuming from an earlier results file."""
+
+    def test_missing_file(self, tmp_path):
+        assert read_completed_ids(str(tmp_path / "out.jsonl")) == set()
+
+    def test_partial_line_is_truncated(self, tmp_path):
+        """Test that a line cut off by an interruption is dropped from the file."""
+        output = tmp_path / "out.jsonl"
+        complete = json.dumps({"id": "1", "error": None}) + "\n" + json.dumps({"id": "2", "error": "Failed"}) + "\n"
+        output.write_text(complete + '{"id": "3", "sco')
+
+        assert read_completed_ids(str(output)) == {"1", "2"}
+        assert output.read_text() == complete
+
+    def test_failed_can_be_retried(self, tmp_path):
+        """Test that failed records are not completed when retrying them."""
+        output = tmp_path / "out.jsonl"
+        output.write_text(json.dumps({"id": "1", "error": None}) + "\n" + json.dumps({"id": "2", "error": "Failed"}) + "\n")
+
+        assert read_completed_ids(str(output), include_failed=False) == {"1"}
+        assert output.read_text() == json.dumps({"id": "1", "error": None}) + "\n"
+
+    def test_last_record_of_an_id_wins(self, tmp_path):
+        """Test that a retried id counts by its latest result and keeps one record."""
+        output = tmp_path / "out.jsonl"
+        lines = [
+            json.dumps({"id": "1", "error": "Failed"}),
+            json.dumps({"id": "2", "error": "Failed"}),
+            json.dumps({"id": "3", "error": None}),
+            json.dumps({"id": "1", "error": None})
+        ]
+        output.write_text("\n".join(lines) + "\n" + '{"id": "4"')
+
+        assert read_completed_ids(str(output)) == {"1", "2", "3"}
+        assert read_completed_ids(str(output), include_failed=False) == {"1", "3"}
+        assert output.read_text() == lines[2] + "\n" + lines[3] + "\n"
+
+
+class TestBatchScorer:
+    """Test scoring across worker processes."""
+
+    def test_scores_in_manifest_order(self, executor, tasks):
+        """Test that every task gets a record in order and a missing file becomes an error record."""
+        stats = BatchStats()
+        seen = []
+
+        records = list(BatchScorer(executor, max_pending=3).score(tasks, stats=stats, on_result=lambda r, s: seen.append(r["id"])))
+
+        assert [record["id"] for record in records] == [task.id for task in tasks]
+        assert seen == [task.id for task in tasks]
+        assert all(record["error"] is None and 0 <= record["score"] <= 100 for record in records[:5])
+        assert [segment["word"] for segment in records[0]["segments"]] == ["a", "b", "c"]
+        assert records[-1]["score"] is None
+        assert records[-1]["error"].startswith("FileNotFoundError")
+        assert (stats.total, stats.scored, stats.failed, stats.skipped) == (6, 5, 1, 0)
+
+    def test_scores_match_in_process(self, executor, tasks):
+        """Test that a batch score equals the mean of a direct comparison."""
+        record = next(BatchScorer(executor).score(tasks[:1]))
+
+        expected = LibrosaAudioComparator().compare_audio(tasks[0].reference, tasks[0].recording, "a b c")
+        assert record["score"] == pytest.approx(np.mean([row["score"] for row in expected]), abs=1e-3)
+
+    def test_skips_completed(self, executor, tasks):
+        """Test that completed ids are skipped and counted."""
+        stats = BatchStats()
+
+        records = list(BatchScorer(executor).score(tasks, completed_ids={"0", "1", "missing"}, stats=stats))
+
+        assert [record["id"] for record in records] == ["2", "3", "4"]
+        assert (stats.total, stats.skipped, stats.scored) == (6, 3, 3)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,119 @@
+# Copyright 2026 The terCAD team. All rights reserved.
+# Use of this source code is governed by a CC BY-NC-ND 4.0 license that can be found in the LICENSE file.
+
+"""Tests for ComparisonExecutor."""
+
+import threading
+
+import numpy as np
+import pytest
+
+from domain.services.audio_comparator import ComparisonCancelled
+from infrastructure.audio.comparison_executor import ComparisonExecutor
+from infrastructure.audio.librosa_audio_comparator import LibrosaAudioComparator
+
+soundfile = pytest.importorskip("soundfile")
+
+
+def write_words(path, durations, seed=0):
+    """Write a WAV with a tone per word separated by short pauses."""
+    rng = np.random.default_rng(seed)
+    parts = []
+    for index, duration in enumerate(durations):
+        t = np.arange(int(duration * 16000)) / 16000
+        parts.append(0.4 * np.sin(2 * np.pi * (220 + 110 * index) * t))
+        parts.append(0.001 * rng.standard_normal(3200))
+    soundfile.write(str(path), np.concatenate(parts).astype(np.float32), 16000)
+    return str(path)
+
+
+@pytest.fixture(scope="module")
+def executor(tmp_path_factory):
+    """One warm worker shared by the tests of this module."""
+    if not LibrosaAudioComparator().is_available():
+        pytest.skip("numpy and librosa are required")
+    executor = ComparisonExecutor(str(tmp_path_factory.mktemp("features")))
+    executor.warm_up()
+    yield executor
+    executor.shutdown()
+
+
+@pytest.fixture
+def files(tmp_path):
+    """Reference and recording with three 'words'."""
+    return (
+        write_words(tmp_path / "reference.wav", [0.4, 0.5, 0.3]),
+        write_words(tmp_path / "recording.wav", [0.45, 0.5, 0.35], seed=1)
+    )
+
+
+class TestComparisonExecutor:
+    """Test comparisons in worker processes."""
+
+    def test_result_matches_in_process(self, executor, files):
+        """Test that a worker returns the in-process results and reports every stage."""
+        events = []
+        done = threading.Event()
+
+        def progress(stage, fraction):
+            events.append((stage, fraction))
+            if stage == 'done':
+                done.set()
+
+        result = executor.submit(*files, "one two three", progress=progress).result(timeout=60)
+
+        expected = LibrosaAudioComparator().compare_audio(*files, "one two three")
+        assert [row["word"] for row in result] == ["one", "two", "three"]
+        assert [row["score"] for row in result] == pytest.approx([row["score"] for row in expected])
+        assert done.wait(5)
+        assert [stage for stage, _ in events] == ['reference', 'recording', 'alignment', 'done']
+        assert [fraction for _, fraction in events] == sorted(fraction for _, fraction in events)
+
+    def test_new_job_supersedes_older(self, executor, files):
+        """Test that submitting a job cancels the ones before it."""
+        first = executor.submit(*files, "one two three")
+        second = executor.submit(*files, "one two three")
+
+        with pytest.raises(ComparisonCancelled):
+            first.result(timeout=60)
+        assert first.cancelled()
+        assert len(second.result(timeout=60)) == 3
+
+    def test_cancel_job(self, executor, files):
+        """Test that a cancelled job raises instead of returning results."""
+        job = executor.submit(*files, "one two three")
+        job.cancel()
+
+        with pytest.raises(ComparisonCancelled):
+            job.result(timeout=60)
+        assert len(executor.submit(*files, "one two three").result(timeout=60)) == 3
+
+
+def test_no_jobs_after_shutdown():
+    """Test that a shut down executor does not start new workers."""
+    executor = ComparisonExecutor()
+    executor.shutdown()
+
+    with pytest.raises(RuntimeError):
+        executor.prepare_references([])
+
+
+class TestComparisonProgress:
+    """Test stage reporting of the comparator."""
+
+    def test_progress_can_cancel(self, files):
+        """Test that cancellation raised by the progress callback is not turned into an error result."""
+        comparator = LibrosaAudioComparator()
+        if not comparator.is_available():
+            pytest.skip("numpy and librosa are required")
+
+        def cancel_on_alignment(stage, fraction):
+            if stage == 'alignment':
+                raise ComparisonCancelled("superseded")
+
+        with pytest.raises(ComparisonCancelled):
+            comparator.compare_audio(*files, "one two three", progress=cancel_on_alignment)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
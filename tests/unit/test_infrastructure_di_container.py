@@ -3,7 +3,11 @@
 
 """Tests for DependencyContainer."""
 
+import threading
+import time
+
 import pytest
+from unittest.mock import patch
 
 from infrastructure.di.container import DependencyContainer
 
@@ -40,6 +44,24 @@ class TestDependencyInjection:
 
         # Different instances with different configs
         assert service1 is not service2
+        # Generated speech is shared through one cache
+        assert service1._audio_cache is service2._audio_cache
+        assert service1.get_cache_stats()['max_bytes'] == 100 * 1024 * 1024
+
+    def test_media_service_reads_audio_pack(self, container, tmp_path):
+        """Test that a pack next to the audio directory is opened once per locale."""
+        from infrastructure.audio.audio_pack import AudioPackWriter
+        pack_path = tmp_path / ".terCAD" / "app-language" / "assets" / "data" / "PL" / "audio.pack"
+        with AudioPackWriter(str(pack_path)) as writer:
+            writer.add("dom.mp3", "dom", b'audio')
+
+        service1 = container.media_service('PL', container.resource_repository().get_audio_dir('PL'))
+        service2 = container.media_service('PL', '/path2')
+
+        assert service1._audio_pack is service2._audio_pack
+        assert service1.find_audio_file("dom") is not None
+        assert container.media_service('BE', '/path3')._audio_pack is None
+        container.shutdown()
 
     def test_audio_comparator_available(self, container):
         """Test that audio comparator can be created."""
@@ -60,6 +82,70 @@ class TestDependencyInjection:
         # The service should exist regardless of PortAudio availability
         # Actual recording will gracefully fail if PortAudio is not available
 
+    def test_comparison_executor_singleton(self, container):
+        """Test that the comparison executor is shared and released on shutdown."""
+        from infrastructure.audio.comparison_executor import ComparisonExecutor
+        with patch.object(ComparisonExecutor, 'warm_up'), patch.object(ComparisonExecutor, 'shutdown') as shutdown:
+            executor = container.comparison_executor()
+            if executor is None:
+                pytest.skip("librosa comparator is not available")
+
+            assert isinstance(executor, ComparisonExecutor)
+            assert container.comparison_executor() is executor
+            container.shutdown()
+            shutdown.assert_called_once()
+
+    def test_load_audio_services_in_background(self, container):
+        """Test that audio services are resolved once on a background thread before callbacks run."""
+        from infrastructure.audio.comparison_executor import ComparisonExecutor
+        from infrastructure.audio.librosa_audio_comparator import LibrosaAudioComparator
+        callers = []
+        ready = threading.Event()
+
+        def on_ready():
+            callers.append(threading.current_thread())
+            ready.set()
+
+        with patch.object(ComparisonExecutor, 'warm_up'), patch.object(ComparisonExecutor, 'shutdown'), \
+                patch.object(LibrosaAudioComparator, 'preload') as preload:
+            with patch.object(container, 'audio_comparator', wraps=container.audio_comparator) as comparator:
+                container.load_audio_services(on_ready)
+                container.load_audio_services()
+                assert ready.wait(30)
+                container._audio_loader.join(30)
+
+            assert callers[0] is not threading.current_thread()
+            assert 'recorder_service' in container._instances
+            assert 'audio_comparator' in container._instances
+            assert comparator.call_count >= 1
+            assert preload.call_count == (container.audio_comparator() is not None)
+
+            # Later callers are notified right away
+            late = []
+            container.load_audio_services(lambda: late.append(threading.current_thread()))
+            assert late == [threading.current_thread()]
+            container.shutdown()
+
+    def test_singleton_created_once_across_threads(self, container):
+        """Test that concurrent lookups share one instance."""
+        created = []
+
+        def factory():
+            created.append(1)
+            time.sleep(0.05)
+            return object()
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(container._get_or_create('slow', factory)))
+                   for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(created) == 1
+        assert all(result is results[0] for result in results)
+
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -0,0 +1,91 @@
+# Copyright 2026 The terCAD team. All rights reserved.
+# Use of this source code is governed by a CC BY-NC-ND 4.0 license that can be found in the LICENSE file.
+
+"""Tests for constrained DTW alignment."""
+
+import numpy as np
+import pytest
+
+from infrastructure.audio import dtw_alignment
+from infrastructure.audio.librosa_audio_comparator import LibrosaAudioComparator
+
+librosa = pytest.importorskip("librosa")
+
+
+def warped_pair(n, m, seed=0):
+    """Reference features and a noisy, non-uniformly stretched copy."""
+    rng = np.random.default_rng(seed)
+    X = np.cumsum(rng.standard_normal((13, n)), axis=1)
+    idx = np.sort(rng.integers(0, n, m))
+    idx[0], idx[-1] = 0, n - 1
+    return X, X[:, idx] + 0.1 * rng.standard_normal((13, m))
+
+
+def assert_valid_path(path, n, m):
+    """Check that a path is a connected monotone walk from corner to corner."""
+    assert tuple(path[0]) == (0, 0)
+    assert tuple(path[-1]) == (n - 1, m - 1)
+    steps = np.diff(path, axis=0)
+    assert set(map(tuple, steps)) <= {(1, 1), (0, 1), (1, 0)}
+
+
+class TestDtwAlignment:
+    """Test windowed, banded and multiscale DTW."""
+
+    @pytest.mark.parametrize("n,m", [(1, 1), (1, 6), (6, 1), (30, 47), (120, 90)])
+    def test_full_window_matches_librosa(self, n, m):
+        """Test that a window covering every cell reproduces librosa's alignment."""
+        X, Y = warped_pair(n, m, seed=n + m)
+        D, wp = librosa.sequence.dtw(X=X, Y=Y, metric='euclidean')
+
+        cost, path = dtw_alignment.windowed_dtw(X, Y, np.zeros(n, dtype=int), np.full(n, m))
+
+        assert cost == pytest.approx(D[-1, -1])
+        assert np.array_equal(path, wp[::-1])
+
+    @pytest.mark.parametrize("align", [dtw_alignment.band_dtw, dtw_alignment.multiscale_dtw])
+    @pytest.mark.parametrize("n,m", [(300, 360), (360, 300), (50, 20)])
+    def test_constrained_cost_is_close_to_full(self, align, n, m):
+        """Test that constrained modes find a valid path of nearly optimal cost."""
+        X, Y = warped_pair(n, m)
+        D, _ = librosa.sequence.dtw(X=X, Y=Y, metric='euclidean')
+
+        cost, path = align(X, Y)
+
+        assert_valid_path(path, n, m)
+        assert cost == pytest.approx(D[-1, -1], rel=0.01)
+
+    def test_narrow_band_stays_connected(self):
+        """Test that a band narrower than the length ratio still reaches the last cell."""
+        X, Y = warped_pair(20, 200)
+
+        _, path = dtw_alignment.band_dtw(X, Y, ratio=0.0, min_radius=1)
+
+        assert_valid_path(path, 20, 200)
+
+
+class TestComparatorAlignment:
+    """Test alignment mode selection on the comparator."""
+
+    def test_rejects_unknown_mode(self):
+        """Test that an unknown alignment mode fails fast."""
+        with pytest.raises(ValueError, match="Unknown alignment"):
+            LibrosaAudioComparator(alignment='fast')
+
+    @pytest.mark.parametrize("mode", ['band', 'multiscale'])
+    def test_word_spans_match_full(self, mode):
+        """Test that constrained modes map word spans within a few frames of full DTW."""
+        X, Y = warped_pair(400, 460, seed=3)
+        full = LibrosaAudioComparator()
+        full_path = full._align(X, Y)
+
+        path = LibrosaAudioComparator(alignment=mode)._align(X, Y)
+
+        for ref_start in range(0, 400, 40):
+            expected = full._mapped_recorded_frame_range(full_path, ref_start, ref_start + 40)
+            actual = full._mapped_recorded_frame_range(path, ref_start, ref_start + 40)
+            assert np.abs(np.subtract(actual, expected)).max() <= 2
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,112 @@
+# Copyright 2026 The terCAD team. All rights reserved.
+# Use of this source code is governed by a CC BY-NC-ND 4.0 license that can be found in the LICENSE file.
+
+"""Tests for EmbeddingMatrix and vectorized MLVocabularyProfiler similarity."""
+
+import pickle
+
+import numpy as np
+import pytest
+
+from domain.entities.vocabulary_item import VocabularyItem
+from infrastructure.ml.embedding_matrix import EmbeddingMatrix
+from infrastructure.ml.ml_vocabulary_profiler import MLVocabularyProfiler
+
+
+def pairwise_max_similarity(embeddings, word):
+    """Reference implementation: the former per-pair Python loop."""
+    similarities = []
+    for other_word, other_emb in embeddings.items():
+        if other_word != word:
+            norm_product = np.linalg.norm(embeddings[word]) * np.linalg.norm(other_emb)
+            if norm_product > 0:
+                similarities.append(np.dot(embeddings[word], other_emb) / norm_product)
+    return max(similarities) if similarities else -np.inf
+
+
+class TestEmbeddingMatrix:
+    """Test contiguous normalized embedding storage."""
+
+    def test_max_similarity_matches_pairwise_loop(self):
+        """Test that the matrix product matches per-pair cosine similarity."""
+        rng = np.random.default_rng(7)
+        embeddings = {f"w{i}": rng.normal(size=8) for i in range(40)}
+        embeddings["zero"] = np.zeros(8)
+        matrix = EmbeddingMatrix(8, chunk_elements=50)
+        matrix.add_all(embeddings)
+
+        words = list(embeddings)
+        result = matrix.max_similarity(matrix.index_of(word) for word in words)
+
+        expected = [pairwise_max_similarity(embeddings, word) for word in words]
+        assert result[-1] == -np.inf
+        assert result[:-1] == pytest.approx(expected[:-1])
+
+    def test_rows_are_appended_incrementally(self):
+        """Test that growth keeps previously added rows."""
+        matrix = EmbeddingMatrix(2)
+        for i in range(100):
+            matrix.add(f"w{i}", np.array([1.0, float(i)]))
+
+        assert len(matrix) == 100
+        assert matrix.vectors.flags['C_CONTIGUOUS']
+        assert np.linalg.norm(matrix.vectors, axis=1) == pytest.approx(np.ones(100))
+        assert matrix.vectors[matrix.index_of("w0")] == pytest.approx([1.0, 0.0])
+
+    def test_single_row_has_nothing_to_compare(self):
+        """Test that a lone word gets no similarity."""
+        matrix = EmbeddingMatrix(2)
+        row = matrix.add("only", np.array([1.0, 0.0]))
+
+        assert matrix.max_similarity([row])[0] == -np.inf
+
+    def test_profiler_scores_similarity_from_matrix(self, tmp_path):
+        """Test that the profiler keeps the matrix in sync with word_embeddings."""
+        profiler = MLVocabularyProfiler(str(tmp_path / "profile.json"), str(tmp_path / "model.pkl"))
+        items = [VocabularyItem(word, word) for word in ("cat", "cats", "zebra", "pharmaceutical")]
+
+        result = profiler.get_prioritized_items(items, 4)
+
+        assert len(result) == 4
+        assert set(profiler.word_embeddings) == {item.origin for item in items}
+        for item in items:
+            row = profiler._embedding_matrix.index_of(item.origin)
+            similarity = profiler._embedding_matrix.max_similarity([row])[0]
+            expected = pairwise_max_similarity(profiler.word_embeddings, item.origin)
+            assert similarity == pytest.approx(expected, abs=1e-6)
+
+    def test_model_saved_as_memory_mapped_float32(self, tmp_path):
+        """Test that embeddings persist as a .npy matrix with a word index."""
+        profile_path = str(tmp_path / "profile.json")
+        model_path = str(tmp_path / "model.pkl")
+        profiler = MLVocabularyProfiler(profile_path, model_path)
+        for word in ("cat", "dog", "zebra"):
+            profiler._create_word_embedding(word)
+        expected = {word: np.array(embedding) for word, embedding in profiler.word_embeddings.items()}
+        profiler.close()
+
+        restored = MLVocabularyProfiler(profile_path, model_path)
+
+        assert list(restored.word_embeddings) == ["cat", "dog", "zebra"]
+        assert isinstance(restored.word_embeddings["cat"].base, np.memmap)
+        for word, embedding in expected.items():
+            assert restored.word_embeddings[word].dtype == np.float32
+            assert np.array_equal(restored.word_embeddings[word], embedding)
+        assert len(restored._embedding_matrix) == 3
+
+    def test_legacy_pickled_model_is_converted(self, tmp_path):
+        """Test that a pickled model is read and rewritten in the new format."""
+        profile_path = str(tmp_path / "profile.json")
+        model_path = str(tmp_path / "model.pkl")
+        with open(model_path, 'wb') as f:
+            pickle.dump({'embeddings': {"cat": np.ones(32)}, 'timestamp': 0}, f)
+
+        profiler = MLVocabularyProfiler(profile_path, model_path)
+        assert profiler.word_embeddings["cat"].dtype == np.float32
+        profiler.close()
+
+        assert np.load(profiler.embeddings_path).shape == (1, 32)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
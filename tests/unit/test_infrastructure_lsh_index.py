@@ -0,0 +1,95 @@
+# Copyright 2026 The terCAD team. All rights reserved.
+# Use of this source code is governed by a CC BY-NC-ND 4.0 license that can be found in the LICENSE file.
+
+"""Tests for LSHIndex and its use in MLVocabularyProfiler."""
+
+import numpy as np
+import pytest
+from unittest.mock import patch
+
+from domain.entities.vocabulary_item import VocabularyItem
+from infrastructure.ml.embedding_matrix import EmbeddingMatrix
+from infrastructure.ml.lsh_index import LSHIndex
+from infrastructure.ml.ml_vocabulary_profiler import MLVocabularyProfiler
+
+
+class TestLSHIndex:
+    """Test random-projection LSH similarity index."""
+
+    @pytest.fixture
+    def matrix(self):
+        """Matrix of clustered positive vectors, like character embeddings."""
+        rng = np.random.default_rng(3)
+        matrix = EmbeddingMatrix(16)
+        for i in range(2000):
+            matrix.add(f"w{i}", rng.random(16) ** 3)
+        return matrix
+
+    def test_approximates_exact_similarity(self, matrix):
+        """Test that ANN similarity never exceeds and closely tracks the exact value."""
+        index = LSHIndex(16)
+        index.build(matrix)
+        rows = range(0, len(matrix), 10)
+
+        exact = matrix.max_similarity(rows)
+        approximate = index.max_similarity(matrix, rows)
+
+        assert np.all(approximate <= exact + 1e-6)
+        assert np.mean(np.isclose(approximate, exact)) > 0.7
+        assert np.mean(exact - approximate) < 0.01
+
+    def test_candidates_are_a_fraction_of_rows(self, matrix):
+        """Test that a lookup only inspects some buckets."""
+        index = LSHIndex(16)
+        index.build(matrix)
+
+        codes = index.hash(matrix.vectors[:1])[:, 0]
+
+        assert 0 < len(index.candidates(codes)) < len(matrix) / 2
+
+    def test_incremental_rows_are_found(self, matrix):
+        """Test that rows added after build are searchable before and after merge."""
+        index = LSHIndex(16, merge_threshold=4)
+        index.build(matrix)
+
+        for i in range(5):
+            row = matrix.add(f"new{i}", matrix.vectors[i] * 2)
+            index.add(row, matrix.vectors[row])
+
+        assert len(index) == len(matrix)
+        result = index.max_similarity(matrix, [len(matrix) - 1])
+        assert result[0] == pytest.approx(1.0)
+
+    def test_save_and_load(self, matrix, tmp_path):
+        """Test that a persisted index answers like the original."""
+        index = LSHIndex(16)
+        index.build(matrix)
+        path = str(tmp_path / "index.npz")
+        index.save(path)
+
+        loaded = LSHIndex.load(path, expected_rows=len(matrix))
+
+        rows = range(0, len(matrix), 50)
+        assert np.array_equal(loaded.max_similarity(matrix, rows), index.max_similarity(matrix, rows))
+        assert LSHIndex.load(path, expected_rows=len(matrix) + 1) is None
+
+    def test_profiler_persists_index_with_model(self, tmp_path):
+        """Test that the profiler does not rebuild a saved index at startup."""
+        profile_path = str(tmp_path / "profile.json")
+        model_path = str(tmp_path / "model.pkl")
+        items = [VocabularyItem(f"word{chr(97 + i % 26)}{i}", "x") for i in range(40)]
+
+        profiler = MLVocabularyProfiler(profile_path, model_path, ann_min_size=20)
+        profiler.get_prioritized_items(items, 10)
+        assert profiler._ann_index is not None
+        profiler.close()
+
+        with patch.object(LSHIndex, 'build') as build:
+            restored = MLVocabularyProfiler(profile_path, model_path, ann_min_size=20)
+            build.assert_not_called()
+        assert len(restored._ann_index) == 40
+        assert len(restored.get_prioritized_items(items, 10)) == 10
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
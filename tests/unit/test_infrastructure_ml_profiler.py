@@ -3,11 +3,15 @@
 
 """Tests for SQLiteMLVocabularyProfiler."""
 
+import pickle
+
+import numpy as np
 import pytest
 
 from domain.entities.vocabulary_item import VocabularyItem
 from domain.services.vocabulary_profiler import IVocabularyProfiler
 from infrastructure.persistence.database_connection import DatabaseConnection
+from infrastructure.persistence.database_patches import DatabasePatches
 from infrastructure.persistence.sqlite_vocabulary_repository import SQLiteVocabularyRepository
 from infrastructure.ml.sqlite_ml_vocabulary_profiler import SQLiteMLVocabularyProfiler
 
@@ -37,7 +41,9 @@ class TestMLVocabularyProfiler:
         ]
         repository.save_vocabulary_items("EN", "ES", items)
 
-        return SQLiteMLVocabularyProfiler(db_connection, "EN", "ES")
+        profiler = SQLiteMLVocabularyProfiler(db_connection, "EN", "ES")
+        yield profiler
+        profiler.close()
 
     def test_implements_interface(self, profiler):
         """Test that profiler implements IVocabularyProfiler."""
@@ -103,6 +109,7 @@ class TestMLVocabularyProfiler:
         profiler.mark_positive(item)
         profiler.mark_positive(item)
         profiler.mark_positive(item)
+        profiler.flush()
 
         # Verify in database
         row = db_connection.fetchone(
@@ -122,6 +129,7 @@ class TestMLVocabularyProfiler:
         profiler.mark_positive(item)
         profiler.mark_negative(item)
         profiler.mark_positive(item)
+        profiler.flush()
 
         # Verify in database
         row = db_connection.fetchone(
@@ -149,6 +157,217 @@ class TestMLVocabularyProfiler:
         # Result should contain VocabularyItem objects
         assert all(isinstance(item, VocabularyItem) for item in result)
 
+    def test_batched_scores_match_per_item_path(self, profiler):
+        """Test that batched scoring matches the per-item difficulty."""
+        items = [
+            VocabularyItem("hello", "hola"),
+            VocabularyItem("world", "mundo"),
+            VocabularyItem("pharmaceutical", "farmacéutico"),
+            VocabularyItem("unknown", "desconocido")
+        ]
+        profiler.mark_positive(items[0])
+        profiler.mark_negative(items[1])
+
+        scores = profiler._calculate_difficulty_scores(items)
+
+        expected = [profiler._calculate_word_difficulty(item) for item in items]
+        assert scores.tolist() == pytest.approx(expected)
+
+    def test_prioritization_uses_single_query(self, profiler, repository, db_connection):
+        """Test that prioritization does not query per item."""
+        items = [
+            VocabularyItem(f"word{i}", f"palabra{i}")
+            for i in range(50)
+        ]
+        repository.save_vocabulary_items("EN", "ES", items, replace=False)
+
+        statements = []
+        conn = db_connection.get_connection()
+        conn.set_trace_callback(statements.append)
+        try:
+            profiler.get_prioritized_items(items, 10)
+        finally:
+            conn.set_trace_callback(None)
+
+        assert len(statements) == 1
+
+    def test_top_selection_keeps_order_of_ties(self, profiler):
+        """Test that equal scores keep the original item order."""
+        items = [
+            VocabularyItem(f"tie{i}", f"empate{i}")
+            for i in range(10)
+        ]
+
+        result = profiler.get_prioritized_items(items, 4)
+
+        assert result == items[:4]
+
+    def test_progress_is_buffered_until_flush(self, profiler, db_connection):
+        """Test that answers are visible to reads before they are persisted."""
+        item = VocabularyItem("world", "mundo")
+        query = """SELECT correct_count, incorrect_count
+                   FROM learning_progress lp
+                   JOIN vocabulary_items v ON lp.vocabulary_item_id = v.id
+                   WHERE v.origin = 'world'"""
+
+        profiler.mark_negative(item)
+        profiler.mark_negative(item)
+
+        assert db_connection.fetchone(query) is None
+        assert profiler._get_history_score("world") == 1.0
+        assert profiler._get_history_counts()["world"] == (0, 2)
+
+        profiler.flush()
+        profiler.mark_positive(item)
+
+        row = db_connection.fetchone(query)
+        assert row['incorrect_count'] == 2
+        assert row['correct_count'] == 0
+        assert profiler._get_history_counts()["world"] == (1, 2)
+
+    def test_flush_writes_in_one_transaction(self, profiler, db_connection):
+        """Test that buffered answers for several words are committed once."""
+        profiler.mark_positive(VocabularyItem("hello", "hola"))
+        profiler.mark_negative(VocabularyItem("world", "mundo"))
+        profiler.mark_positive(VocabularyItem("hello", "hola"))
+
+        statements = []
+        conn = db_connection.get_connection()
+        conn.set_trace_callback(statements.append)
+        try:
+            profiler.flush()
+        finally:
+            conn.set_trace_callback(None)
+
+        assert sum(1 for s in statements if s.startswith('COMMIT')) == 1
+        row = db_connection.fetchone(
+            """SELECT correct_count, study_count, difficulty_score
+               FROM learning_progress lp
+               JOIN vocabulary_items v ON lp.vocabulary_item_id = v.id
+               WHERE v.origin = 'hello'"""
+        )
+        assert row['correct_count'] == 2
+        assert row['study_count'] == 2
+        assert row['difficulty_score'] == 0.0
+
+    def test_progress_flushed_in_background(self, db_connection, repository):
+        """Test that the journal persists answers on its timer."""
+        repository.save_vocabulary_items("EN", "ES", [VocabularyItem("hello", "hola")])
+        profiler = SQLiteMLVocabularyProfiler(db_connection, "EN", "ES", flush_interval=0.05)
+
+        profiler.mark_positive(VocabularyItem("hello", "hola"))
+        profiler._journal._worker.join(timeout=5)
+
+        assert not profiler._journal.has_pending()
+        row = db_connection.fetchone("SELECT correct_count FROM learning_progress")
+        assert row['correct_count'] == 1
+
+    def test_embeddings_stored_as_raw_float32(self, profiler, db_connection):
+        """Test that character embeddings are stored without pickle."""
+        embedding = profiler._get_or_create_embedding("a")
+
+        row = db_connection.fetchone("SELECT embedding_vector FROM ml_embeddings WHERE character = 'a'")
+        assert len(row['embedding_vector']) == profiler.embedding_dim * 4
+        assert np.array_equal(np.frombuffer(row['embedding_vector'], dtype='<f4'), embedding)
+
+    def test_warm_up_loads_stored_embeddings_in_one_query(self, profiler, db_connection):
+        """Test that warm-up reads every stored embedding with a single query."""
+        profiler.warm_up_embeddings()
+        created = {char: profiler._get_or_create_embedding(char) for char in set("hello" + "world" + "pharmaceutical")}
+        profiler.close()
+        reopened = SQLiteMLVocabularyProfiler(db_connection, "EN", "ES")
+
+        statements = []
+        conn = db_connection.get_connection()
+        conn.set_trace_callback(statements.append)
+        try:
+            reopened.warm_up_embeddings()
+        finally:
+            conn.set_trace_callback(None)
+
+        # One query for the pair's words, one for the embeddings
+        assert len(statements) == 2
+        assert reopened.embedding_cache_stats()['size'] == len(created)
+        for char, embedding in created.items():
+            loaded = reopened._get_or_create_embedding(char)
+            assert loaded.dtype == np.float32
+            assert np.array_equal(loaded, embedding)
+        assert reopened.embedding_cache_stats()['misses'] == 0
+        reopened.close()
+
+    def test_patch_converts_pickled_embeddings(self, db_connection):
+        """Test that the float32 patch converts legacy pickle BLOBs."""
+        conn = db_connection.get_connection()
+        vector = np.arange(32, dtype=np.float64) / 10
+        conn.execute(
+            "INSERT INTO ml_embeddings (character, embedding_vector) VALUES (?, ?)",
+            ('z', pickle.dumps(vector))
+        )
+        conn.execute(
+            "INSERT INTO ml_embeddings (character, embedding_vector) VALUES (?, ?)",
+            ('y', b'not a pickle')
+        )
+        conn.commit()
+
+        DatabasePatches.get_registry()['ml_embeddings_raw_float32'].func(conn)
+
+        rows = db_connection.fetchall("SELECT character, embedding_vector FROM ml_embeddings")
+        assert [row['character'] for row in rows] == ['z']
+        assert np.allclose(np.frombuffer(rows[0]['embedding_vector'], dtype='<f4'), vector)
+
+    def test_warm_up_loads_language_pair_in_batch(self, profiler, db_connection):
+        """Test that warm-up embeds the pair's characters with one insert batch."""
+        statements = []
+        conn = db_connection.get_connection()
+        conn.set_trace_callback(statements.append)
+        try:
+            profiler.warm_up_embeddings()
+        finally:
+            conn.set_trace_callback(None)
+
+        characters = set("hello" + "world" + "pharmaceutical")
+        stored = db_connection.fetchall("SELECT character FROM ml_embeddings")
+        assert {row['character'] for row in stored} == characters
+        assert sum(1 for s in statements if s.startswith('COMMIT')) == 1
+
+        statements.clear()
+        conn.set_trace_callback(statements.append)
+        try:
+            profiler._get_or_create_embedding("h")
+        finally:
+            conn.set_trace_callback(None)
+        assert statements == []
+        assert profiler.embedding_cache_stats()['hits'] == 1
+
+    def test_embedding_cache_is_bounded(self, db_connection, repository):
+        """Test that the embedding cache evicts least recently used characters."""
+        repository.save_vocabulary_items("EN", "ES", [VocabularyItem("ab", "x")])
+        profiler = SQLiteMLVocabularyProfiler(db_connection, "EN", "ES", embedding_cache_size=4)
+
+        first = profiler._get_or_create_embedding("a")
+        for char in "vwxyz":
+            profiler._get_or_create_embedding(char)
+
+        stats = profiler.embedding_cache_stats()
+        assert stats['size'] == 4
+        assert stats['evictions'] > 0
+        # Evicted characters are read back unchanged from the database
+        assert np.array_equal(profiler._get_or_create_embedding("a"), first)
+        profiler.close()
+
+    def test_embedding_cache_holds_the_character_set(self, db_connection, repository):
+        """Test that a character set larger than the cache size is warmed up without evictions."""
+        repository.save_vocabulary_items("EN", "ES", [VocabularyItem("abcdef", "x")])
+        profiler = SQLiteMLVocabularyProfiler(db_connection, "EN", "ES", embedding_cache_size=4)
+
+        profiler.warm_up_embeddings()
+
+        stats = profiler.embedding_cache_stats()
+        assert (stats['size'], stats['capacity'], stats['evictions']) == (6, 6, 0)
+        profiler._get_or_create_embedding("z")
+        assert profiler.embedding_cache_stats()['size'] == 6
+        profiler.close()
+
     def test_difficulty_calculation_with_history(self, profiler):
         """Test that difficulty changes based on user history."""
         easy_item = VocabularyItem("hello", "hola")
@@ -0,0 +1,126 @@
+# Copyright 2026 The terCAD team. All rights reserved.
+# Use of this source code is governed by a CC BY-NC-ND 4.0 license that can be found in the LICENSE file.
+
+"""Tests for ProfileEventLog and file-based MLVocabularyProfiler storage."""
+
+import json
+import os
+
+import pytest
+
+from domain.entities.vocabulary_item import VocabularyItem
+from infrastructure.ml.ml_vocabulary_profiler import MLVocabularyProfiler
+from infrastructure.ml.profile_event_log import ProfileEventLog
+
+
+class TestProfileEventLog:
+    """Test append-only profile storage."""
+
+    @pytest.fixture
+    def profile_path(self, tmp_path):
+        """Path of the profile snapshot."""
+        return str(tmp_path / "user_profile.json")
+
+    @pytest.fixture
+    def model_path(self, tmp_path):
+        """Path of the profiler model."""
+        return str(tmp_path / "model.pkl")
+
+    def test_answers_are_appended_not_rewritten(self, profile_path, model_path):
+        """Test that an answer appends one log line instead of writing the snapshot."""
+        profiler = MLVocabularyProfiler(profile_path, model_path)
+
+        profiler.mark_positive(VocabularyItem("hello", "hola"))
+        profiler.mark_negative(VocabularyItem("world", "mundo"))
+
+        with open(f"{profile_path}.log", encoding='utf-8') as f:
+            assert len(f.readlines()) == 2
+        assert not os.path.exists(profile_path)
+        profiler.close()
+
+    def test_startup_replays_snapshot_and_log_tail(self, profile_path, model_path):
+        """Test that history is restored from snapshot plus uncompacted events."""
+        profiler = MLVocabularyProfiler(profile_path, model_path)
+        profiler.mark_positive(VocabularyItem("hello", "hola"))
+        profiler.flush()
+        profiler.mark_negative(VocabularyItem("hello", "hola"))
+        profiler._profile_log.close()
+
+        restored = MLVocabularyProfiler(profile_path, model_path)
+
+        assert restored.user_history["hello"]["correct"] == 1
+        assert restored.user_history["hello"]["incorrect"] == 1
+        restored.close()
+
+    def test_compaction_is_triggered_by_log_size(self, profile_path):
+        """Test that the log is folded into the snapshot periodically."""
+        log = ProfileEventLog(profile_path, compact_every=3)
+        history = {}
+        for _ in range(3):
+            log.append("hello", True, 1.0)
+        assert log.should_compact()
+
+        history["hello"] = {'correct': 3, 'incorrect': 0, 'last_seen': 1.0}
+        log.compact(history)
+
+        assert log.pending_events == 0
+        with open(f"{profile_path}.log", encoding='utf-8') as f:
+            assert f.read() == ""
+        with open(profile_path, encoding='utf-8') as f:
+            assert json.load(f)["history"]["hello"]["correct"] == 3
+
+    def test_events_in_snapshot_are_not_replayed(self, profile_path):
+        """Test that a crash before truncating the log does not double count."""
+        log = ProfileEventLog(profile_path)
+        log.append("hello", True, 1.0)
+        with open(f"{profile_path}.log", encoding='utf-8') as f:
+            stale_log = f.read()
+        log.compact({"hello": {'correct': 1, 'incorrect': 0, 'last_seen': 1.0}})
+        with open(f"{profile_path}.log", 'w', encoding='utf-8') as f:
+            f.write(stale_log + '{"s": 2, "w": "hel')
+
+        history = ProfileEventLog(profile_path).load()
+
+        assert history["hello"]["correct"] == 1
+
+    def test_migrates_legacy_json_profile(self, profile_path, model_path):
+        """Test that the previous flat JSON profile is read and converted."""
+        with open(profile_path, 'w', encoding='utf-8') as f:
+            json.dump({"hello": {"correct": 2, "incorrect": 1, "last_seen": 5.0}, "world": {}}, f, indent=2)
+
+        profiler = MLVocabularyProfiler(profile_path, model_path)
+
+        assert profiler.user_history["hello"] == {'correct': 2, 'incorrect': 1, 'last_seen': 5.0}
+        assert profiler.user_history["world"]["correct"] == 0
+        with open(profile_path, encoding='utf-8') as f:
+            assert json.load(f)["format"] == ProfileEventLog.FORMAT_VERSION
+        profiler.close()
+
+    def test_failed_migration_keeps_legacy_history(self, profile_path, model_path, monkeypatch):
+        """Test that a failed migration write neither drops the history nor the legacy snapshot."""
+        with open(profile_path, 'w', encoding='utf-8') as f:
+            json.dump({"hello": {"correct": 2, "incorrect": 1, "last_seen": 5.0}}, f)
+
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+
+        with monkeypatch.context() as patch:
+            patch.setattr("infrastructure.ml.profile_event_log.os.replace", fail_replace)
+            profiler = MLVocabularyProfiler(profile_path, model_path)
+
+        assert profiler.user_history["hello"]["correct"] == 2
+        with open(profile_path, encoding='utf-8') as f:
+            assert "format" not in json.load(f)
+
+        # The next compaction migrates the snapshot
+        profiler.mark_positive(VocabularyItem("hello", "hola"))
+        profiler.flush()
+        profiler.close()
+        history = ProfileEventLog(profile_path).load()
+        assert history["hello"]["correct"] == 3
+        with open(profile_path, encoding='utf-8') as f:
+            assert json.load(f)["format"] == ProfileEventLog.FORMAT_VERSION
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,77 @@
+# Copyright 2026 The terCAD team. All rights reserved.
+# Use of this source code is governed by a CC BY-NC-ND 4.0 license that can be found in the LICENSE file.
+
+"""Tests for ProgressJournal."""
+
+import threading
+
+import pytest
+
+from infrastructure.ml.progress_journal import ProgressJournal
+
+
+class TestProgressJournal:
+    """Test write-behind progress journal."""
+
+    def test_coalesces_events_per_word(self):
+        """Test that repeated answers for a word are merged into one delta."""
+        batches = []
+        journal = ProgressJournal(batches.append, flush_interval=60)
+
+        journal.record("hello", True)
+        journal.record("hello", False)
+        journal.record("hello", True)
+        journal.close()
+
+        assert len(batches) == 1
+        delta = batches[0]["hello"]
+        assert (delta.correct, delta.incorrect, delta.study_count) == (2, 1, 3)
+
+    def test_flushes_on_size_threshold(self):
+        """Test that reaching max_pending wakes the writer before the timer."""
+        flushed = threading.Event()
+
+        def writer(batch):
+            flushed.set()
+
+        journal = ProgressJournal(writer, flush_interval=60, max_pending=2)
+        journal.record("one", True)
+        journal.record("two", False)
+
+        assert flushed.wait(timeout=5)
+        journal.close()
+
+    def test_failed_flush_keeps_events(self):
+        """Test that events survive a failing writer and are retried."""
+        batches = []
+
+        def writer(batch):
+            if not batches:
+                batches.append(None)
+                raise RuntimeError("database is locked")
+            batches.append(batch)
+
+        journal = ProgressJournal(writer, flush_interval=60)
+        journal.record("hello", False)
+
+        journal.flush()
+        assert journal.get_pending("hello") == (0, 1)
+
+        journal.flush()
+        assert not journal.has_pending()
+        assert batches[1]["hello"].incorrect == 1
+        journal.close()
+
+    def test_worker_exit_callback_runs_when_idle(self):
+        """Test that the background thread ends once nothing is pending."""
+        exited = threading.Event()
+        journal = ProgressJournal(lambda batch: None, flush_interval=0.01, on_worker_exit=exited.set)
+
+        journal.record("hello", True)
+
+        assert exited.wait(timeout=5)
+        assert not journal.has_pending()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
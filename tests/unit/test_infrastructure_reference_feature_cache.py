@@ -0,0 +1,169 @@
+# Copyright 2026 The terCAD team. All rights reserved.
+# Use of this source code is governed by a CC BY-NC-ND 4.0 license that can be found in the LICENSE file.
+
+"""Tests for ReferenceFeatureCache and its use in LibrosaAudioComparator."""
+
+import multiprocessing
+import os
+
+import numpy as np
+import pytest
+from unittest.mock import patch
+
+from infrastructure.audio.audio_features import AudioFeatures
+from infrastructure.audio.librosa_audio_comparator import LibrosaAudioComparator
+from infrastructure.audio.reference_feature_cache import ReferenceFeatureCache
+
+
+def make_features(frames=50, seed=0):
+    """Create features of a given number of MFCC frames."""
+    rng = np.random.default_rng(seed)
+    return AudioFeatures(
+        mfcc=rng.standard_normal((13, frames)).astype(np.float32),
+        sr=16000,
+        hop_length=512,
+        n_samples=frames * 512,
+        speech_segments=[(0, 400), (700, 1200)]
+    )
+
+
+def put_repeatedly(cache_dir, count=50):
+    """Store the same entry again and again, as workers analyzing one reference do."""
+    cache = ReferenceFeatureCache(cache_dir)
+    for _ in range(count):
+        cache.put("shared", make_features(frames=400))
+
+
+def write_tone(path, frequency=440.0, seconds=1.0, sr=16000):
+    """Write a sine tone WAV file."""
+    soundfile = pytest.importorskip("soundfile")
+    t = np.arange(int(seconds * sr)) / sr
+    soundfile.write(str(path), (0.5 * np.sin(2 * np.pi * frequency * t)).astype(np.float32), sr)
+    return str(path)
+
+
+class TestReferenceFeatureCache:
+    """Test the on-disk reference feature cache."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Create a cache in a temporary directory."""
+        return ReferenceFeatureCache(str(tmp_path / "features"))
+
+    def test_round_trip_is_memory_mapped(self, cache, tmp_path):
+        """Test that a stored entry is read back as a memory map with its metadata."""
+        features = make_features()
+        audio = tmp_path / "clip.wav"
+        audio.write_bytes(b"audio")
+        key = cache.key(str(audio), "params")
+
+        assert cache.get(key) is None
+        cache.put(key, features)
+        restored = cache.get(key)
+
+        assert isinstance(restored.mfcc, np.memmap)
+        assert np.array_equal(restored.mfcc, features.mfcc)
+        assert (restored.sr, restored.hop_length, restored.n_samples) == (16000, 512, 50 * 512)
+        assert restored.speech_segments == [(0, 400), (700, 1200)]
+        assert cache.stats()['hits'] == 1
+        assert cache.stats()['misses'] == 1
+
+    def test_key_follows_content_and_params(self, cache, tmp_path):
+        """Test that keys depend on file content and settings, not on the path."""
+        first = tmp_path / "a.wav"
+        copy = tmp_path / "b.wav"
+        first.write_bytes(b"same content")
+        copy.write_bytes(b"same content")
+
+        key = cache.key(str(first), "params")
+
+        assert cache.key(str(copy), "params") == key
+        assert cache.key(str(first), "other") != key
+        first.write_bytes(b"changed content")
+        assert cache.key(str(first), "params") != key
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Test that the cache stays within its byte budget, dropping stale entries first."""
+        entry_bytes = 13 * 50 * 4 + 400
+        cache = ReferenceFeatureCache(str(tmp_path / "features"), max_bytes=int(entry_bytes * 2.5))
+        cache.put("a", make_features())
+        cache.put("b", make_features())
+        os.utime(cache._paths("a")[1], (0, 0))
+        os.utime(cache._paths("b")[1], (1, 1))
+        assert cache.get("a") is not None
+
+        cache.put("c", make_features())
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        stats = cache.stats()
+        assert stats['entries'] == 2
+        assert stats['bytes'] <= cache.max_bytes
+        assert stats['evictions'] == 1
+
+    def test_concurrent_writers_of_one_entry(self, cache, capfd):
+        """Test that processes writing the same entry never share temporary files."""
+        if 'fork' not in multiprocessing.get_all_start_methods():
+            pytest.skip("fork start method is required")
+        context = multiprocessing.get_context('fork')
+        workers = [context.Process(target=put_repeatedly, args=(cache.cache_dir,)) for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(60)
+
+        assert all(worker.exitcode == 0 for worker in workers)
+        assert "Could not cache" not in capfd.readouterr().out
+        restored = cache.get("shared")
+        assert np.array_equal(restored.mfcc, make_features(frames=400).mfcc)
+        assert not [name for name in os.listdir(cache.cache_dir) if name.endswith('.tmp')]
+
+    def test_incomplete_entry_is_a_miss(self, cache):
+        """Test that an entry without its sidecar or with a broken matrix is ignored."""
+        cache.put("a", make_features())
+        with open(cache._paths("a")[0], 'wb') as f:
+            f.write(b"broken")
+
+        assert cache.get("a") is None
+        assert cache.get("missing") is None
+
+
+class TestComparatorFeatureCache:
+    """Test reference feature caching in the comparator."""
+
+    @pytest.fixture
+    def comparator(self, tmp_path):
+        """Create a comparator with a feature cache."""
+        comparator = LibrosaAudioComparator(ReferenceFeatureCache(str(tmp_path / "features")))
+        if not comparator.is_available():
+            pytest.skip("numpy and librosa are required")
+        return comparator
+
+    def test_only_recording_is_decoded_on_hit(self, comparator, tmp_path):
+        """Test that a cached reference is not decoded or analyzed again."""
+        reference = write_tone(tmp_path / "reference.wav")
+        recording = write_tone(tmp_path / "recording.wav", frequency=450.0)
+        first = comparator.compare_audio(reference, recording, "hello")
+
+        with patch.object(comparator, '_decode_audio', wraps=comparator._decode_audio) as decode:
+            second = comparator.compare_audio(reference, recording, "hello")
+
+        assert [call.args[0] for call in decode.call_args_list] == [recording]
+        assert second[0]["deviation"] == pytest.approx(first[0]["deviation"], rel=1e-5)
+
+    def test_warm_up_category(self, comparator, tmp_path):
+        """Test that warming analyzes each new clip once and skips missing files."""
+        clips = [write_tone(tmp_path / f"word{i}.wav", frequency=300.0 + 50 * i) for i in range(3)]
+        progress = []
+
+        computed = comparator.warm_up(clips + [None, str(tmp_path / "missing.mp3")], progress=lambda *args: progress.append(args))
+
+        assert computed == 3
+        assert progress == [(1, 3), (2, 3), (3, 3)]
+        assert comparator.warm_up(clips) == 0
+        assert comparator._feature_cache.stats()['entries'] == 3
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
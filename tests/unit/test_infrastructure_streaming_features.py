@@ -0,0 +1,155 @@
+# Copyright 2026 The terCAD team. All rights reserved.
+# Use of this source code is governed by a CC BY-NC-ND 4.0 license that can be found in the LICENSE file.
+
+"""Tests for streaming feature extraction and streaming comparison."""
+
+import numpy as np
+import pytest
+
+from domain.services.audio_comparator import IAudioComparator
+from infrastructure.audio.audio_features import DecodedAudio
+from infrastructure.audio.librosa_audio_comparator import LibrosaAudioComparator
+
+librosa = pytest.importorskip("librosa")
+soxr = pytest.importorskip("soxr")
+
+from infrastructure.audio.streaming_features import StreamingFeatureExtractor  # noqa: E402
+
+
+def speech_like(pattern, sr=16000, seed=0):
+    """Tones per word separated by quiet pauses; pattern is (lead_s, [(tone_s, pause_s), ...])."""
+    rng = np.random.default_rng(seed)
+    lead, words = pattern
+    parts = [0.001 * rng.standard_normal(int(lead * sr))]
+    for index, (tone, pause) in enumerate(words):
+        t = np.arange(int(tone * sr)) / sr
+        parts.append(0.4 * np.sin(2 * np.pi * (220 + 110 * index) * t) * np.hanning(len(t)))
+        parts.append(0.001 * rng.standard_normal(int(pause * sr)))
+    return np.concatenate(parts).astype(np.float32)
+
+
+def feed_blocks(target, samples, sr, seed=0):
+    """Feed samples in irregular blocks."""
+    rng = np.random.default_rng(seed)
+    start = 0
+    while start < len(samples):
+        size = int(rng.integers(64, 4096))
+        target.feed(samples[start:start + size], sr)
+        start += size
+
+
+class TestStreamingFeatureExtractor:
+    """Test online MFCC and voice activity analysis."""
+
+    def test_matches_offline_mfcc(self):
+        """Test that streamed blocks give the offline MFCCs of the whole signal."""
+        samples = speech_like((0.3, [(0.4, 0.2), (0.5, 0.3)]))
+        extractor = StreamingFeatureExtractor()
+
+        feed_blocks(extractor, samples, 16000)
+        features = extractor.finish()
+
+        expected = librosa.feature.mfcc(y=samples, sr=16000, n_mfcc=13, hop_length=512)
+        assert features.mfcc.shape == expected.shape
+        assert np.allclose(features.mfcc, expected, atol=1e-3)
+        assert features.n_samples == len(samples)
+
+    def test_resamples_int16_capture(self):
+        """Test that 44.1 kHz int16 blocks are analyzed like the offline resampled signal."""
+        samples = speech_like((0.2, [(0.5, 0.3)]))
+        captured = (soxr.resample(samples, 16000, 44100) * 32767).astype(np.int16).reshape(-1, 1)
+        extractor = StreamingFeatureExtractor()
+
+        for start in range(0, len(captured), 1024):
+            extractor.feed(captured[start:start + 1024], 44100)
+        features = extractor.finish()
+
+        resampled = librosa.resample(captured[:, 0] / 32768.0, orig_sr=44100, target_sr=16000)
+        expected = librosa.feature.mfcc(y=resampled.astype(np.float32), sr=16000, n_mfcc=13, hop_length=512)
+        assert features.n_samples == len(resampled)
+        assert np.allclose(features.mfcc, expected, atol=1e-3)
+
+    def test_voice_activity(self):
+        """Test that voiced ranges follow the tones."""
+        samples = speech_like((0.5, [(0.6, 0.6), (0.6, 0.4)]))
+        extractor = StreamingFeatureExtractor()
+
+        feed_blocks(extractor, samples, 16000)
+        segments = extractor.finish().speech_segments
+
+        assert len(segments) == 2
+        assert segments[0][0] == pytest.approx(500, abs=100)
+        assert segments[1][0] == pytest.approx(1700, abs=100)
+        assert segments[1][1] == pytest.approx(2300, abs=100)
+
+
+class TestComparisonStream:
+    """Test comparing a recording while it is fed."""
+
+    PATTERN = (0.1, [(0.4, 0.3), (0.5, 0.3), (0.3, 0.2)])
+
+    @pytest.fixture
+    def comparator(self):
+        """Create a comparator, skipping when audio dependencies are missing."""
+        comparator = LibrosaAudioComparator()
+        if not comparator.is_available():
+            pytest.skip("numpy and librosa are required")
+        return comparator
+
+    @pytest.fixture
+    def reference_path(self, tmp_path):
+        """Reference file with three 'words'."""
+        soundfile = pytest.importorskip("soundfile")
+        path = str(tmp_path / "reference.wav")
+        soundfile.write(path, speech_like(self.PATTERN), 16000)
+        return path
+
+    @pytest.mark.parametrize("lead", [0.0, 0.8])
+    def test_matches_offline_comparison(self, comparator, reference_path, lead):
+        """Test that streamed results equal comparing the finished recording, with or without leading silence."""
+        recording = speech_like((lead, [(0.45, 0.25), (0.5, 0.35), (0.3, 0.2)]), seed=1)
+        stream = comparator.start_stream(reference_path, "one two three")
+
+        feed_blocks(stream, recording, 16000)
+        result = stream.finish()
+
+        reference = comparator._reference_features(reference_path)
+        recorded = comparator._analyze(DecodedAudio(recording, 16000))
+        expected = comparator._compare_by_words(reference, recorded, ["one", "two", "three"])
+        assert [row["word"] for row in result] == ["one", "two", "three"]
+        for actual, offline in zip(result, expected):
+            assert actual["deviation"] == pytest.approx(offline["deviation"], abs=1e-3)
+
+    def test_without_text_compares_by_seconds(self, comparator, reference_path):
+        """Test that a stream without reference text falls back to per-second scores."""
+        stream = comparator.start_stream(reference_path)
+        feed_blocks(stream, speech_like(self.PATTERN, seed=2), 16000)
+
+        result = stream.finish()
+
+        assert [row["second"] for row in result] == [1, 2, 3]
+
+    def test_finish_without_audio(self, comparator, reference_path):
+        """Test that an empty stream leaves the comparison to the recorded file."""
+        stream = comparator.start_stream(reference_path, "one two three")
+
+        assert stream.finish() is None
+
+    def test_missing_reference(self, comparator, tmp_path):
+        """Test that no stream is started without a readable reference."""
+        assert comparator.start_stream(str(tmp_path / "missing.mp3"), "word") is None
+
+    def test_default_interface_does_not_stream(self):
+        """Test that comparators without streaming support return no stream."""
+        class Comparator(IAudioComparator):
+            def compare_audio(self, original_path, recorded_path, reference_text=""):
+                return []
+
+            def is_available(self):
+                return True
+
+        assert Comparator().start_stream("reference.mp3") is None
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
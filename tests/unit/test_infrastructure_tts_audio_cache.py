@@ -0,0 +1,102 @@
+# Copyright 2026 The terCAD team. All rights reserved.
+# Use of this source code is governed by a CC BY-NC-ND 4.0 license that can be found in the LICENSE file.
+
+"""Tests for TtsAudioCache."""
+
+import os
+
+import pytest
+
+from infrastructure.audio.tts_audio_cache import TtsAudioCache
+
+
+class TestTtsAudioCache:
+    """Test the (text, lang) keyed speech cache."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        cache = TtsAudioCache(str(tmp_path / "tts"), max_bytes=250)
+        yield cache
+        cache.close()
+
+    def test_roundtrip_keyed_by_text_and_language(self, cache):
+        """Test that the same text in two languages gives two entries."""
+        assert cache.get("dom", "pl") is None
+
+        pl_path = cache.put("dom", "pl", b'p' * 10)
+        be_path = cache.put("dom", "BE", b'b' * 20)
+
+        assert pl_path != be_path
+        assert cache.get("dom", "pl") == pl_path
+        assert cache.get("dom", "be") == be_path
+        with open(be_path, 'rb') as f:
+            assert f.read() == b'b' * 20
+        stats = cache.stats()
+        assert stats['entries'] == 2
+        assert stats['bytes'] == 30
+        assert stats['hits'] == 2
+        assert stats['misses'] == 1
+        assert stats['languages'] == {'be': {'entries': 1, 'bytes': 20}, 'pl': {'entries': 1, 'bytes': 10}}
+
+    def test_evicts_least_recently_used(self, cache):
+        """Test that reads keep entries alive when the budget is exceeded."""
+        first = cache.put("one", "en", b'1' * 100)
+        second = cache.put("two", "en", b'2' * 100)
+        assert cache.get("one", "en") == first
+
+        third = cache.put("three", "en", b'3' * 100)
+
+        assert cache.get("two", "en") is None
+        assert not os.path.exists(second)
+        assert cache.get("one", "en") == first
+        assert cache.get("three", "en") == third
+        stats = cache.stats()
+        assert stats['bytes'] == 200
+        assert stats['evictions'] == 1
+
+    def test_reads_do_not_write_the_index(self, cache):
+        """Test that hits are only queried and their counts are written in one batch later."""
+        cache.put("one", "en", b'1' * 10)
+        cache.put("two", "en", b'2' * 10)
+        statements = []
+        cache._db.set_trace_callback(statements.append)
+
+        for _ in range(3):
+            cache.get("one", "en")
+        cache.get("two", "en")
+
+        assert all(statement.startswith('SELECT') for statement in statements)
+        stats = cache.stats()
+        assert stats['total_hit_count'] == 4
+        assert stats['unused_entries'] == 0
+        assert sum(1 for statement in statements if statement.startswith('UPDATE')) == 2
+        assert sum(1 for statement in statements if statement.startswith('COMMIT')) == 1
+
+    def test_keeps_new_entry_over_budget(self, cache):
+        """Test that a clip larger than the budget is still returned."""
+        path = cache.put("long", "en", b'x' * 300)
+
+        assert cache.get("long", "en") == path
+
+    def test_index_persists_and_detects_missing_files(self, cache, tmp_path):
+        """Test that hit counts survive a reopen and deleted clips become misses."""
+        kept = cache.put("kept", "en", b'k' * 10)
+        removed = cache.put("removed", "en", b'r' * 10)
+        cache.get("kept", "en")
+        cache.close()
+        os.remove(removed)
+
+        reopened = TtsAudioCache(str(tmp_path / "tts"), max_bytes=250)
+        try:
+            assert reopened.get("kept", "en") == kept
+            assert reopened.get("removed", "en") is None
+            stats = reopened.stats()
+            assert stats['entries'] == 1
+            assert stats['total_hit_count'] == 2
+            assert stats['unused_entries'] == 0
+        finally:
+            reopened.close()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,103 @@
+# Copyright 2026 The terCAD team. All rights reserved.
+# Use of this source code is governed by a CC BY-NC-ND 4.0 license that can be found in the LICENSE file.
+
+"""Tests for TtsFailureTracker."""
+
+import os
+
+import pytest
+
+from infrastructure.audio.tts_failure_tracker import TtsFailureTracker
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTtsFailureTracker:
+    """Test per-word backoff and the circuit breaker."""
+
+    @pytest.fixture
+    def clock(self):
+        return FakeClock()
+
+    @pytest.fixture
+    def state_path(self, tmp_path):
+        return str(tmp_path / "tts" / "failures.json")
+
+    @pytest.fixture
+    def tracker(self, state_path, clock):
+        return TtsFailureTracker(state_path, base_backoff=10, failure_threshold=3, cooldown=60, clock=clock)
+
+    def test_word_backoff_doubles(self, tracker, clock):
+        """Test that a word is retried after an exponentially growing delay."""
+        tracker.record_failure("dom", "pl", network=False)
+        assert not tracker.allow("dom", "pl")
+        assert tracker.allow("dom", "be")
+        clock.now += 10
+        assert tracker.allow("dom", "pl")
+
+        tracker.record_failure("dom", "pl", network=False)
+        clock.now += 10
+        assert not tracker.allow("dom", "pl")
+        clock.now += 10
+        assert tracker.allow("dom", "pl")
+
+        tracker.record_success("dom", "pl")
+        tracker.record_failure("dom", "pl", network=False)
+        clock.now += 10
+        assert tracker.allow("dom", "pl")
+
+    def test_circuit_opens_and_probes(self, tracker, clock):
+        """Test that consecutive network failures make every word fail fast until a probe succeeds."""
+        for word in ("a", "b", "c"):
+            tracker.record_failure(word, "en")
+        assert not tracker.allow("other", "en")
+        assert tracker.stats()['circuit_open']
+
+        clock.now += 60
+        assert tracker.allow("probe", "en")
+        # Only one probe at a time
+        assert not tracker.allow("other", "en")
+        tracker.record_failure("probe", "en")
+        clock.now += 60
+        # Re-opened for twice the cooldown
+        assert not tracker.allow("other", "en")
+        clock.now += 60
+        assert tracker.allow("other", "en")
+        tracker.record_success("other", "en")
+
+        assert tracker.allow("next", "en")
+        assert tracker.stats()['trips'] == 0
+
+    def test_missing_audio_does_not_open_circuit(self, tracker):
+        for word in ("a", "b", "c"):
+            tracker.record_failure(word, "en", network=False)
+
+        assert tracker.allow("d", "en")
+        assert tracker.stats()['backed_off'] == 3
+
+    def test_state_survives_restart(self, tracker, state_path, clock):
+        """Test that an app restarted while offline keeps failing fast."""
+        for word in ("a", "b", "c"):
+            tracker.record_failure(word, "en")
+
+        restarted = TtsFailureTracker(state_path, base_backoff=10, failure_threshold=3, cooldown=60, clock=clock)
+        assert not restarted.allow("d", "en")
+        clock.now += 60
+        assert restarted.allow("d", "en")
+
+    def test_corrupt_state_is_ignored(self, state_path, clock):
+        os.makedirs(os.path.dirname(state_path))
+        with open(state_path, 'w') as f:
+            f.write('{"version": 1, "keys": [')
+
+        assert TtsFailureTracker(state_path, clock=clock).allow("a", "en")
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -3,10 +3,13 @@
 
 """Tests for SQLiteVocabularyRepository."""
 
+import sqlite3
+
 import pytest
 
 from domain.entities.vocabulary_item import VocabularyItem
 from infrastructure.persistence.database_connection import DatabaseConnection
+from infrastructure.persistence.database_patches import DatabasePatches
 from infrastructure.persistence.sqlite_vocabulary_repository import SQLiteVocabularyRepository
 
 
@@ -121,5 +124,157 @@ class TestSQLiteVocabularyRepository:
             )
 
 
+    def test_append_reports_first_existing_word_in_payload_order(self, repository):
+        """Test that the set-based check reports the first clashing item and inserts nothing."""
+        repository.save_vocabulary_items(
+            "EN",
+            "ES",
+            [VocabularyItem("cat", "gato"), VocabularyItem("dog", "perro", category="animals")],
+        )
+
+        with pytest.raises(ValueError, match="in category 'Animals': DOG"):
+            repository.save_vocabulary_items(
+                "EN",
+                "ES",
+                [
+                    VocabularyItem("bird", "pájaro"),
+                    VocabularyItem("DOG", "perro", category="Animals"),
+                    VocabularyItem("cat", "gato"),
+                ],
+                replace=False,
+            )
+
+        assert [item.origin for item in repository.load_by_language_pair("EN", "ES")] == ["cat", "dog"]
+
+    def test_append_matches_category_null_separately(self, repository):
+        """Test that uncategorized words only clash with uncategorized words."""
+        repository.save_vocabulary_items("EN", "ES", [VocabularyItem("cat", "gato")])
+
+        repository.save_vocabulary_items(
+            "EN",
+            "ES",
+            [VocabularyItem("cat", "gato", category="animals"), VocabularyItem("cow", "vaca")],
+            replace=False,
+        )
+        with pytest.raises(ValueError, match="in category '':  Cat"):
+            repository.save_vocabulary_items("EN", "ES", [VocabularyItem(" Cat", "gato")], replace=False)
+
+        assert len(repository.load_by_language_pair("EN", "ES")) == 3
+
+    def test_append_ignores_other_language_pairs(self, repository):
+        """Test that existing words of another language pair do not clash."""
+        repository.save_vocabulary_items("EN", "PL", [VocabularyItem("cat", "kot")])
+
+        repository.save_vocabulary_items("EN", "ES", [VocabularyItem("cat", "gato")], replace=False)
+
+        assert len(repository.load_by_language_pair("EN", "ES")) == 1
+
+    def test_bulk_append_keeps_payload_order(self, repository):
+        """Test that a large append is stored completely and in order."""
+        items = [VocabularyItem(f"word{i}", f"slowo{i}", category="bulk") for i in range(2000)]
+
+        repository.save_vocabulary_items("EN", "PL", items[:1000], replace=False)
+        repository.save_vocabulary_items("EN", "PL", items[1000:], replace=False)
+
+        loaded = repository.load_by_language_pair("EN", "PL", category="bulk")
+        assert [item.origin for item in loaded] == [item.origin for item in items]
+
+
+
+class TestVocabularyNormalizedKeys:
+    """Test normalized key columns and their composite index."""
+
+    @pytest.fixture
+    def db_connection(self, tmp_path):
+        """Create a temporary database connection with all patches applied."""
+        return DatabaseConnection(str(tmp_path / "test_tlum.db"))
+
+    @pytest.fixture
+    def repository(self, db_connection):
+        """Create a repository holding enough words for the planner to prefer seeks."""
+        repository = SQLiteVocabularyRepository(db_connection)
+        items = [VocabularyItem(f"word{i}", f"slowo{i}", category="bulk") for i in range(200)]
+        repository.save_vocabulary_items("EN", "PL", items)
+        return repository
+
+    def query_plans(self, db_connection, action):
+        """Run an action and return the query plan of each SELECT/DELETE it executed."""
+        conn = db_connection.get_connection()
+        statements = []
+        conn.set_trace_callback(statements.append)
+        try:
+            action()
+        finally:
+            conn.set_trace_callback(None)
+
+        plans = []
+        for statement in statements:
+            if statement.lstrip().upper().startswith(('SELECT', 'DELETE')) and 'vocabulary_items' in statement:
+                rows = conn.execute(f"EXPLAIN QUERY PLAN {statement}").fetchall()
+                plans.append(' | '.join(row['detail'] for row in rows))
+        return plans
+
+    def test_patch_adds_generated_keys_to_existing_table(self, db_connection):
+        """Test that the patch upgrades a table created without key columns."""
+        conn = sqlite3.connect(":memory:")
+        conn.execute(
+            """CREATE TABLE vocabulary_items (
+                   id INTEGER PRIMARY KEY AUTOINCREMENT,
+                   language_pair_id INTEGER NOT NULL,
+                   origin TEXT NOT NULL,
+                   translation TEXT NOT NULL,
+                   category TEXT
+               )"""
+        )
+        conn.execute(
+            """INSERT INTO vocabulary_items (language_pair_id, origin, translation, category)
+               VALUES (1, ' Hello ', 'x', 'Verbs')"""
+        )
+
+        patch = DatabasePatches.get_registry()["vocabulary_normalized_keys"].func
+        patch(conn)
+        patch(conn)
+
+        row = conn.execute("SELECT category_key, origin_key FROM vocabulary_items").fetchone()
+        assert row == ("verbs", "hello")
+        indexes = [row[1] for row in conn.execute("PRAGMA index_list(vocabulary_items)")]
+        assert "idx_vocab_pair_keys" in indexes
+
+    def test_duplicate_check_seeks_composite_index(self, repository, db_connection):
+        """Test that the append duplicate check is an index seek per key."""
+        items = [VocabularyItem("new", "nowy", category="bulk")]
+        plans = self.query_plans(
+            db_connection,
+            lambda: repository.save_vocabulary_items("EN", "PL", items, replace=False)
+        )
+
+        assert any(
+            "USING INDEX idx_vocab_pair_keys (language_pair_id=? AND category_key=? AND origin_key=?)" in plan
+            for plan in plans
+        )
+
+    def test_delete_seeks_composite_index(self, repository, db_connection):
+        """Test that deleting a categorized word is an index seek."""
+        plans = self.query_plans(
+            db_connection,
+            lambda: repository.delete_vocabulary_item("EN", "PL", "word1", category="bulk")
+        )
+
+        assert "SEARCH vocabulary_items USING INDEX idx_vocab_pair_keys" in plans[0]
+        assert repository.get_vocabulary_item_id("EN", "PL", "word1") is None
+
+    def test_word_lookup_does_not_scan_language_pair(self, repository, db_connection):
+        """Test that looking up an item ID seeks the word instead of scanning the pair."""
+        result = []
+        plans = self.query_plans(
+            db_connection,
+            lambda: result.append(repository.get_vocabulary_item_id("EN", "PL", "word7"))
+        )
+
+        assert result[0] is not None
+        assert "SEARCH vocabulary_items USING INDEX idx_vocab_origin (origin=?)" in plans[0]
+        assert "idx_vocab_language_pair" not in plans[0]
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
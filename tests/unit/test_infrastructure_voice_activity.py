@@ -0,0 +1,94 @@
+# Copyright 2026 The terCAD team. All rights reserved.
+# Use of this source code is governed by a CC BY-NC-ND 4.0 license that can be found in the LICENSE file.
+
+"""Tests for VoiceActivityDetector."""
+
+import numpy as np
+import pytest
+
+from infrastructure.audio.voice_activity import VoiceActivityDetector
+
+SR = 16000
+BLOCK = 512
+
+
+def noise(seconds, level, rng):
+    return level * rng.standard_normal(int(seconds * SR))
+
+
+def tone(seconds, freq=220, level=0.3):
+    t = np.arange(int(seconds * SR)) / SR
+    return level * np.sin(2 * np.pi * freq * t)
+
+
+def hiss(seconds, level, rng):
+    """Unvoiced fricative: quiet high-frequency noise."""
+    x = rng.standard_normal(int(seconds * SR) + 1)
+    return level * np.diff(x)
+
+
+def run(detector, signal):
+    """Feed a signal block by block as int16, returning per-block flags."""
+    pcm = (np.clip(signal, -1, 1) * 32767).astype(np.int16)[:, None]
+    return [detector.process(pcm[i:i + BLOCK]) for i in range(0, len(pcm), BLOCK)]
+
+
+class TestVoiceActivityDetector:
+    """Test speech detection, bounds and trailing silence."""
+
+    @pytest.fixture
+    def rng(self):
+        return np.random.default_rng(0)
+
+    def test_speech_bounds(self, rng):
+        """Test that the speech range is found between leading and trailing room noise."""
+        background = 0.002
+        signal = np.concatenate([noise(0.8, background, rng), tone(0.6), noise(0.2, background, rng),
+                                 tone(0.5, 330), noise(1.0, background, rng)])
+        signal[int(0.8 * SR):int(2.1 * SR)] += noise(1.3, background, rng)
+        detector = VoiceActivityDetector(SR)
+
+        run(detector, signal)
+
+        start, end = detector.speech_bounds()
+        assert abs(start - 0.8 * SR) <= BLOCK
+        assert abs(end - 2.1 * SR) <= BLOCK
+        assert detector.trailing_silence == pytest.approx(1.0, abs=BLOCK / SR)
+        assert detector.speech_bounds(0.1) == (start - int(0.1 * SR), end + int(0.1 * SR))
+
+    def test_fricative_counts_as_speech(self, rng):
+        """Test that a quiet, noisy /s/ extends the speech though it is below the energy margin."""
+        background = 0.002
+        signal = np.concatenate([noise(0.5, background, rng), tone(0.4), hiss(0.3, 0.006, rng), noise(0.7, background, rng)])
+        detector = VoiceActivityDetector(SR)
+
+        run(detector, signal)
+
+        assert abs(detector.speech_bounds()[1] - 1.2 * SR) <= 2 * BLOCK
+
+    def test_click_is_not_speech(self, rng):
+        """Test that a single loud block does not start speech."""
+        signal = noise(1.0, 0.002, rng)
+        signal[16 * BLOCK:17 * BLOCK] = tone(BLOCK / SR)
+        detector = VoiceActivityDetector(SR)
+
+        run(detector, signal)
+
+        assert not detector.speech_detected
+        assert detector.trailing_silence == 0.0
+        assert detector.speech_bounds(0.2) == (0, len(signal))
+
+    def test_digital_silence_does_not_lower_floor(self, rng):
+        """Test that zero blocks at the stream start leave room noise classified as silence."""
+        signal = np.concatenate([np.zeros(SR // 4), noise(1.0, 0.005, rng), tone(0.5), noise(0.5, 0.005, rng)])
+        detector = VoiceActivityDetector(SR)
+
+        run(detector, signal)
+
+        start, end = detector.speech_bounds()
+        assert abs(start - 1.25 * SR) <= BLOCK
+        assert abs(end - 1.75 * SR) <= BLOCK
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
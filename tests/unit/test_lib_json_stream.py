@@ -0,0 +1,68 @@
+# Copyright 2026 The terCAD team. All rights reserved.
+# Use of this source code is governed by a CC BY-NC-ND 4.0 license that can be found in the LICENSE file.
+
+"""Tests for JsonStreamReader."""
+
+import io
+import json
+
+import pytest
+
+from lib.json_stream import JsonStreamReader
+
+
+class TestJsonStreamReader:
+    """Test incremental decoding of a top-level JSON object."""
+
+    @pytest.fixture
+    def document(self):
+        return {
+            'version': "1.0",
+            'count': 12345,
+            'ratio': -1.5e3,
+            'flag': True,
+            'empty': [],
+            'items': [{'origin': f"wörd {i}", 'n': i} for i in range(50)],
+            'tail': None,
+        }
+
+    @pytest.mark.parametrize('chunk_size', [1, 3, 7, 1 << 16])
+    def test_decodes_members_across_chunk_boundaries(self, document, chunk_size):
+        """Test that values split between chunks are decoded whole."""
+        fh = io.StringIO(json.dumps(document, ensure_ascii=False, indent=2))
+
+        members = dict(JsonStreamReader(fh, chunk_size=chunk_size).members())
+
+        assert members == document
+
+    def test_streams_selected_array(self, document):
+        """Test that stream keys yield array items lazily."""
+        reader = JsonStreamReader(io.StringIO(json.dumps(document)), chunk_size=16)
+
+        members = {}
+        for key, value in reader.members(stream_keys={'items', 'empty'}):
+            members[key] = list(value) if key in ('items', 'empty') else value
+
+        assert members == document
+
+    def test_unconsumed_array_is_skipped(self, document):
+        """Test that the next member is reached without reading the streamed array."""
+        reader = JsonStreamReader(io.StringIO(json.dumps(document)), chunk_size=16)
+
+        keys = [key for key, _ in reader.members(stream_keys={'items'})]
+
+        assert keys == list(document)
+
+    @pytest.mark.parametrize('text', ['', '[1, 2]', '{"a": 1', '{"a" 1}', '{"a": [1, 2}', '{1: 2}'])
+    def test_rejects_malformed_documents(self, text):
+        """Test that malformed or truncated input raises ValueError."""
+        with pytest.raises(ValueError):
+            list(JsonStreamReader(io.StringIO(text)).members(stream_keys={'a'}))
+
+    def test_empty_object(self):
+        """Test an object without members."""
+        assert list(JsonStreamReader(io.StringIO(' { } ')).members()) == []
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
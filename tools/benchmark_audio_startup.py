@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+
+# Copyright 2026 The terCAD team. All rights reserved.
+# Use of this source code is governed by a CC BY-NC-ND 4.0 license that can be found in the LICENSE file.
+
+"""
+Startup cost of the audio recording and comparison stacks.
+Each measurement runs in a fresh interpreter, so module caches of one step do
+not hide the import cost of the next. Reports the import time of each heavy
+module (python -X importtime) and the time the recorder widget spends
+resolving audio services before and after they are loaded in the background.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).parent.parent / 'src'
+
+MODULES = [
+    'numpy',
+    'scipy.fft',
+    'soundfile',
+    'sounddevice',
+    'pydub',
+    'librosa',
+    'controller.recorder_controller_desktop',
+    'infrastructure.audio.librosa_audio_comparator',
+    'infrastructure.di.container',
+]
+
+# Each snippet prints the milliseconds it measured as its last output line
+STAGES = {
+    'widget init, eager services': '''
+import tempfile, time
+import kivy.app  # loaded by the app before any widget is built
+from infrastructure.di.container import DependencyContainer
+container = DependencyContainer(tempfile.mkdtemp())
+start = time.perf_counter()
+container.recorder_service().get_initial_status()
+container.audio_comparator()
+container.comparison_executor()
+elapsed = (time.perf_counter() - start) * 1000
+container.shutdown()
+print(elapsed)
+''',
+    'widget init, background loading': '''
+import tempfile, time
+import kivy.app  # loaded by the app before any widget is built
+from infrastructure.di.container import DependencyContainer
+container = DependencyContainer(tempfile.mkdtemp())
+start = time.perf_counter()
+container.recorder_service()
+container.load_audio_services()
+elapsed = (time.perf_counter() - start) * 1000
+container._audio_loaded.wait()
+container.shutdown()
+print(elapsed)
+''',
+    'background: services resolved': '''
+import tempfile, threading, time
+import kivy.app  # loaded by the app before any widget is built
+from infrastructure.di.container import DependencyContainer
+container = DependencyContainer(tempfile.mkdtemp())
+ready = threading.Event()
+start = time.perf_counter()
+container.load_audio_services(ready.set)
+ready.wait()
+elapsed = (time.perf_counter() - start) * 1000
+container.shutdown()
+print(elapsed)
+''',
+    'background: comparator preload': '''
+import time
+from infrastructure.audio.librosa_audio_comparator import LibrosaAudioComparator
+comparator = LibrosaAudioComparator()
+start = time.perf_counter()
+comparator.preload()
+print((time.perf_counter() - start) * 1000)
+''',
+}
+
+
+def run(args, env):
+    """Run a child interpreter in the source directory and return its stdout and stderr"""
+    result = subprocess.run([sys.executable] + args, cwd=SRC_DIR, env=env, capture_output=True, text=True)
+    return result.stdout, result.stderr
+
+
+def import_time_ms(module, env):
+    """Cumulative import time of a module in a fresh interpreter, or None if it fails to import"""
+    _, stderr = run(['-X', 'importtime', '-c', f'import {module}'], env)
+    for line in stderr.splitlines():
+        parts = line.split('|')
+        if line.startswith('import time:') and len(parts) == 3 and parts[2].strip() == module:
+            return int(parts[1]) / 1000
+    return None
+
+
+def stage_ms(code, env):
+    """Milliseconds printed by the last line of a snippet, or None if it failed"""
+    stdout, _ = run(['-c', code], env)
+    try:
+        return float(stdout.strip().splitlines()[-1])
+    except (IndexError, ValueError):
+        return None
+
+
+def median(values):
+    values = [value for value in values if value is not None]
+    return f"{statistics.median(values):8.0f} ms" if values else "  failed"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure the startup cost of the audio stacks')
+    parser.add_argument('--repeat', type=int, default=3, help='Fresh interpreters per measurement (median is reported)')
+    args = parser.parse_args()
+
+    env = dict(os.environ, PYTHONPATH=str(SRC_DIR), KIVY_NO_CONSOLELOG='1', KIVY_NO_ARGS='1')
+
+    print("Import time (cumulative, fresh interpreter)")
+    for module in MODULES:
+        print(f"  {module:<48} {median([import_time_ms(module, env) for _ in range(args.repeat)])}")
+
+    print("\nAudio service loading")
+    for name, code in STAGES.items():
+        print(f"  {name:<48} {median([stage_ms(code, env) for _ in range(args.repeat)])}")
+
+
+if __name__ == "__main__":
+    main()
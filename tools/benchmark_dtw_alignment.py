@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+
+# Copyright 2026 The terCAD team. All rights reserved.
+# Use of this source code is governed by a CC BY-NC-ND 4.0 license that can be found in the LICENSE file.
+
+"""
+Benchmark for DTW alignment modes of LibrosaAudioComparator.
+Synthesizes a reference "sentence" and a recording of it spoken at a varying
+tempo, then reports alignment time, peak memory and the largest word score
+difference against the full DTW for each recording length.
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from infrastructure.audio.audio_features import DecodedAudio  # noqa: E402
+from infrastructure.audio.librosa_audio_comparator import LibrosaAudioComparator  # noqa: E402
+
+
+def synthesize(word_pitches, durations, sr, rng):
+    """Harmonic tone per word with short pauses and background noise"""
+    parts = []
+    for pitch, duration in zip(word_pitches, durations):
+        t = np.arange(int(duration * sr)) / sr
+        glide = pitch * (1 + 0.1 * t / max(duration, 1e-3))
+        tone = sum(np.sin(2 * np.pi * k * glide * t) / k for k in (1, 2, 3))
+        parts.append(0.3 * tone * np.hanning(len(t)))
+        parts.append(np.zeros(int(0.12 * sr)))
+    audio = np.concatenate(parts)
+    return (audio + 0.005 * rng.standard_normal(len(audio))).astype(np.float32)
+
+
+def make_pair(comparator, seconds, seed):
+    """Reference and tempo-warped recording features with about two words per second"""
+    rng = np.random.default_rng(seed)
+    count = max(int(seconds * 2), 1)
+    pitches = rng.uniform(120, 320, count)
+    durations = np.full(count, seconds / count - 0.12)
+    warp = rng.uniform(0.8, 1.25, count)
+    sr = comparator.SAMPLE_RATE
+    original = comparator._analyze(DecodedAudio(synthesize(pitches, durations, sr, rng), sr), with_segments=True)
+    recorded = comparator._analyze(DecodedAudio(synthesize(pitches * 1.03, durations * warp, sr, rng), sr))
+    return original, recorded, [f"w{i}" for i in range(count)]
+
+
+def measure(comparator, original, recorded, repeats):
+    """Best alignment time in ms and peak traced memory in MB"""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        comparator._align(original.mfcc, recorded.mfcc)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    comparator._align(original.mfcc, recorded.mfcc)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best * 1000, peak / (1 << 20)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark constrained DTW speed, memory and accuracy')
+    parser.add_argument('--seconds', type=float, nargs='+', default=[2, 5, 15, 30, 60])
+    parser.add_argument('--modes', nargs='+', default=list(LibrosaAudioComparator.ALIGNMENTS))
+    parser.add_argument('--repeats', type=int, default=3)
+    args = parser.parse_args()
+
+    comparators = {mode: LibrosaAudioComparator(alignment=mode) for mode in args.modes}
+    reference = LibrosaAudioComparator(alignment='full')
+
+    print(f"{'seconds':>7} {'frames':>11} {'mode':>10} {'ms':>9} {'peak MB':>8} {'max score diff':>15}")
+    for seconds in args.seconds:
+        original, recorded, words = make_pair(reference, seconds, seed=int(seconds * 10))
+        expected = [row['score'] for row in reference._compare_by_words(original, recorded, words)]
+        frames = f"{original.mfcc.shape[1]}x{recorded.mfcc.shape[1]}"
+
+        for mode, comparator in comparators.items():
+            elapsed, peak = measure(comparator, original, recorded, args.repeats)
+            scores = [row['score'] for row in comparator._compare_by_words(original, recorded, words)]
+            diff = max(abs(a - b) for a, b in zip(scores, expected))
+            print(f"{seconds:>7g} {frames:>11} {mode:>10} {elapsed:>9.1f} {peak:>8.2f} {diff:>15.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+
+# Copyright 2026 The terCAD team. All rights reserved.
+# Use of this source code is governed by a CC BY-NC-ND 4.0 license that can be found in the LICENSE file.
+
+"""
+Benchmark for SQLiteMLVocabularyProfiler prioritization.
+Compares the per-item scoring path with the batched one on a temporary database
+and reports SQLite query count and latency for each.
+"""
+
+import argparse
+import random
+import string
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from domain.entities.vocabulary_item import VocabularyItem  # noqa: E402
+from infrastructure.persistence.database_connection import DatabaseConnection  # noqa: E402
+from infrastructure.persistence.sqlite_vocabulary_repository import SQLiteVocabularyRepository  # noqa: E402
+from infrastructure.ml.sqlite_ml_vocabulary_profiler import SQLiteMLVocabularyProfiler  # noqa: E402
+
+
+def make_items(count):
+    """Generate unique random vocabulary items"""
+    rnd = random.Random(42)
+    items = []
+    for i in range(count):
+        word = ''.join(rnd.choices(string.ascii_lowercase, k=rnd.randint(2, 14)))
+        items.append(VocabularyItem(f"{word}{i}", f"t{i}"))
+    return items
+
+
+def per_item_path(profiler, items, limit):
+    """Previous implementation: one difficulty calculation (and two queries) per item"""
+    scored = [(item, profiler._calculate_word_difficulty(item)) for item in items]
+    scored.sort(key=lambda x: x[1], reverse=True)
+    return [item for item, _ in scored[:limit]]
+
+
+def measure(db, func):
+    """Run func and return (result, seconds, query count)"""
+    statements = []
+    conn = db.get_connection()
+    conn.set_trace_callback(statements.append)
+    try:
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+    finally:
+        conn.set_trace_callback(None)
+    return result, elapsed, len(statements)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark vocabulary prioritization')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[500, 5000])
+    parser.add_argument('--limit', type=int, default=25)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db = DatabaseConnection(str(Path(tmp_dir) / 'benchmark.db'))
+        repository = SQLiteVocabularyRepository(db)
+
+        print(f"{'items':>8} {'path':>9} {'queries':>9} {'seconds':>10}")
+        for size in args.sizes:
+            items = make_items(size)
+            repository.save_vocabulary_items('EN', 'ES', items)
+            profiler = SQLiteMLVocabularyProfiler(db, 'EN', 'ES')
+            for item in items[::3]:
+                profiler.mark_positive(item)
+            for item in items[::7]:
+                profiler.mark_negative(item)
+            profiler.flush()
+
+            expected, slow, slow_queries = measure(
+                db, lambda p=profiler, i=items: per_item_path(p, i, args.limit)
+            )
+            actual, fast, fast_queries = measure(
+                db, lambda p=profiler, i=items: p.get_prioritized_items(i, args.limit)
+            )
+
+            print(f"{size:>8} {'per-item':>9} {slow_queries:>9} {slow:>10.4f}")
+            print(f"{size:>8} {'batched':>9} {fast_queries:>9} {fast:>10.4f}")
+            if actual != expected:
+                print("Warning: batched result differs from per-item result")
+            profiler.close()
+
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
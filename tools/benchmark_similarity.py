@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+
+# Copyright 2026 The terCAD team. All rights reserved.
+# Use of this source code is governed by a CC BY-NC-ND 4.0 license that can be found in the LICENSE file.
+
+"""
+Benchmark for word-embedding similarity in MLVocabularyProfiler.
+Compares exact max similarity (dense matrix product) with the LSH index
+and reports recall, score error and latency per vocabulary size.
+"""
+
+import argparse
+import random
+import string
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from infrastructure.ml.lsh_index import LSHIndex  # noqa: E402
+from infrastructure.ml.ml_vocabulary_profiler import MLVocabularyProfiler  # noqa: E402
+
+
+def build_profiler(tmp_dir, size):
+    """Create a profiler holding `size` random word embeddings"""
+    profiler = MLVocabularyProfiler(
+        str(Path(tmp_dir) / f'profile_{size}.json'),
+        str(Path(tmp_dir) / f'model_{size}.pkl'),
+        ann_min_size=None
+    )
+    rnd = random.Random(size)
+    while len(profiler.word_embeddings) < size:
+        profiler._create_word_embedding(''.join(rnd.choices(string.ascii_lowercase, k=rnd.randint(3, 14))))
+    return profiler
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark ANN similarity recall and latency')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 50000, 100000])
+    parser.add_argument('--queries', type=int, default=500)
+    parser.add_argument('--tables', type=int, default=16)
+    parser.add_argument('--bits', type=int, default=12)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        print(f"{'words':>8} {'exact ms/q':>11} {'ann ms/q':>9} {'build s':>8} {'recall':>7} {'score err':>10}")
+        for size in args.sizes:
+            profiler = build_profiler(tmp_dir, size)
+            matrix = profiler._embedding_matrix
+            rows = np.random.default_rng(0).choice(len(matrix), size=min(args.queries, len(matrix)), replace=False)
+
+            start = time.perf_counter()
+            index = LSHIndex(profiler.embedding_dim, n_tables=args.tables, n_bits=args.bits)
+            index.build(matrix)
+            build = time.perf_counter() - start
+
+            # Single-word lookups, as when a new word is scored
+            start = time.perf_counter()
+            exact = np.concatenate([matrix.max_similarity([row]) for row in rows])
+            exact_ms = (time.perf_counter() - start) * 1000 / len(rows)
+
+            start = time.perf_counter()
+            approximate = np.concatenate([index.max_similarity(matrix, [row]) for row in rows])
+            ann_ms = (time.perf_counter() - start) * 1000 / len(rows)
+
+            recall = np.mean(np.isclose(approximate, exact))
+            found = np.isfinite(approximate)
+            error = np.mean(np.where(found, exact - approximate, exact))
+            weighted_error = profiler.difficulty_weights['similarity'] * error
+
+            print(f"{size:>8} {exact_ms:>11.3f} {ann_ms:>9.3f} {build:>8.2f} {recall:>7.3f} {weighted_error:>10.5f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+
+# Copyright 2026 The terCAD team. All rights reserved.
+# Use of this source code is governed by a CC BY-NC-ND 4.0 license that can be found in the LICENSE file.
+
+"""
+Benchmark for SQLiteVocabularyRepository.save_vocabulary_items.
+Compares the former per-row insert path (one SELECT per item for duplicate
+checks and one INSERT per item) with the bulk path, and reports rows/sec for
+replacing and appending to a language pair that already holds words.
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from domain.entities.vocabulary_item import VocabularyItem  # noqa: E402
+from infrastructure.persistence.database_connection import DatabaseConnection  # noqa: E402
+from infrastructure.persistence.sqlite_vocabulary_repository import SQLiteVocabularyRepository  # noqa: E402
+
+
+def legacy_save(repo, locale_from, locale_to, items, replace=True):
+    """Per-row implementation used before the bulk path"""
+    with repo._db.transaction() as conn:
+        language_pair_id = repo._get_or_create_language_pair(locale_from, locale_to)
+        if replace:
+            conn.execute("DELETE FROM vocabulary_items WHERE language_pair_id = ?", (language_pair_id,))
+        else:
+            for item in items:
+                existing = conn.execute(
+                    """SELECT id FROM vocabulary_items
+                       WHERE language_pair_id = ?
+                         AND lower(trim(category)) = lower(?)
+                         AND lower(trim(origin)) = lower(?)""",
+                    (language_pair_id, item.category.strip(), item.origin.strip())
+                ).fetchone()
+                if existing is not None:
+                    raise ValueError(f"Word already exists: {item.origin}")
+        for item in items:
+            conn.execute(
+                """INSERT INTO vocabulary_items
+                   (language_pair_id, origin, translation, sound_path, image_path, category)
+                   VALUES (?, ?, ?, ?, ?, ?)""",
+                (language_pair_id, item.origin, item.translation, item.sound, item.image, item.category)
+            )
+
+
+def make_items(prefix, count):
+    """Create unique vocabulary items"""
+    return [VocabularyItem(f"{prefix}{i}", f"translation{i}", category="bulk") for i in range(count)]
+
+
+def measure(db_path, save, size, existing, replace):
+    """Rows per second for one save call on a fresh database"""
+    DatabaseConnection._instance = None
+    repo = SQLiteVocabularyRepository(DatabaseConnection(db_path))
+    repo.save_vocabulary_items("EN", "PL", make_items("existing", existing))
+    items = make_items("word", size)
+
+    start = time.perf_counter()
+    save(repo, "EN", "PL", items, replace=replace)
+    elapsed = time.perf_counter() - start
+
+    repo._db.close()
+    return size / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark vocabulary import throughput')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--existing', type=int, default=1000, help='Words already stored before appending')
+    parser.add_argument('--legacy-max', type=int, default=100000, help='Largest size measured on the legacy path')
+    args = parser.parse_args()
+
+    bulk_save = SQLiteVocabularyRepository.save_vocabulary_items
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        print(f"{'mode':>8} {'items':>8} {'legacy rows/s':>14} {'bulk rows/s':>12} {'speedup':>8}")
+        for mode, replace in (('replace', True), ('append', False)):
+            for size in args.sizes:
+                bulk = measure(str(Path(tmp_dir) / f'bulk_{mode}_{size}.db'), bulk_save, size, args.existing, replace)
+                if size <= args.legacy_max:
+                    legacy = measure(
+                        str(Path(tmp_dir) / f'legacy_{mode}_{size}.db'), legacy_save, size, args.existing, replace
+                    )
+                    print(f"{mode:>8} {size:>8} {legacy:>14.0f} {bulk:>12.0f} {bulk / legacy:>7.1f}x")
+                else:
+                    print(f"{mode:>8} {size:>8} {'-':>14} {bulk:>12.0f} {'-':>8}")
+
+
+if __name__ == "__main__":
+    main()
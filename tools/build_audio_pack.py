@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+
+# Copyright 2026 The terCAD team. All rights reserved.
+# Use of this source code is governed by a CC BY-NC-ND 4.0 license that can be found in the LICENSE file.
+
+"""
+Offline audio pack builder.
+Walks every vocabulary item of a language pair, collects its audio from a
+loose audio directory or generates it through the MediaService TTS path,
+several requests at a time, and appends it to one audio pack (data file plus
+`.idx` index) for provisioning devices. Words already in the pack are skipped,
+so an interrupted build continues where it stopped when started again with
+the same arguments.
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from application.services.media_service import MediaService  # noqa: E402
+from infrastructure.audio.audio_pack import AudioPackWriter, pack_index_path  # noqa: E402
+from infrastructure.audio.audio_pack_builder import AudioPackBuilder, PackStats, pack_entries  # noqa: E402
+from infrastructure.persistence.database_connection import DatabaseConnection  # noqa: E402
+from infrastructure.persistence.sqlite_vocabulary_repository import SQLiteVocabularyRepository  # noqa: E402
+
+
+class SilentPlaybackBackend:
+    """Headless builds never play audio"""
+
+    def play_audio(self, path):
+        return False
+
+    def stop_audio(self):
+        pass
+
+
+def report(stats, final=False):
+    """Print progress and throughput to stderr"""
+    remaining = stats.total - stats.skipped - stats.processed
+    eta = remaining / stats.items_per_second if stats.items_per_second else 0.0
+    line = (
+        f"{stats.skipped + stats.processed}/{stats.total} "
+        f"(collected {stats.collected}, generated {stats.generated}, failed {stats.failed}, "
+        f"skipped {stats.skipped}) "
+        f"{stats.items_per_second:.1f} items/s, {stats.bytes_per_second / 1024:.0f} KiB/s"
+    )
+    if not final:
+        line += f", eta {eta:.0f}s"
+    print(line, file=sys.stderr, flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build an offline audio pack of a language pair')
+    parser.add_argument('db', help='Application database (tlum.db)')
+    parser.add_argument('locale_from', help='Source locale of the language pair, e.g. EN')
+    parser.add_argument('locale_to', help='Studied locale of the language pair, e.g. PL')
+    parser.add_argument('-o', '--output', help='Pack data file (default: assets/data/<LOCALE_TO>/audio.pack)')
+    parser.add_argument('--audio-dir', help='Loose audio directory to collect existing files from')
+    parser.add_argument('--lang', help='TTS language (default: locale_to in lower case)')
+    parser.add_argument('--category', help='Only pack items of one category')
+    parser.add_argument('-j', '--workers', type=int, default=MediaService.PREFETCH_WORKERS,
+                        help='Concurrent TTS requests')
+    parser.add_argument('--restart', action='store_true', help='Discard an existing pack instead of resuming')
+    parser.add_argument('--report-every', type=float, default=5.0, help='Seconds between progress lines')
+    args = parser.parse_args()
+
+    output = args.output or os.path.join('assets', 'data', args.locale_to, 'audio.pack')
+    if args.restart:
+        for path in (output, pack_index_path(output)):
+            if os.path.exists(path):
+                os.remove(path)
+
+    repository = SQLiteVocabularyRepository(DatabaseConnection(args.db))
+    entries = pack_entries(repository.iter_by_language_pair(args.locale_from, args.locale_to, args.category))
+    if not entries:
+        print(f"No vocabulary items for {args.locale_from} -> {args.locale_to}", file=sys.stderr)
+        sys.exit(1)
+
+    # Generated files go to the audio directory when given, otherwise to a scratch one
+    staging_dir = None if args.audio_dir else f"{output}.staging"
+    media_service = MediaService(
+        (args.lang or args.locale_to).lower(),
+        args.audio_dir or staging_dir,
+        SilentPlaybackBackend()
+    )
+    stats = PackStats()
+    last_report = [time.perf_counter()]
+
+    def on_chunk(current):
+        if time.perf_counter() - last_report[0] >= args.report_every:
+            last_report[0] = time.perf_counter()
+            report(current)
+
+    try:
+        with AudioPackWriter(output) as writer:
+            builder = AudioPackBuilder(media_service, writer, args.workers, remove_generated=staging_dir is not None)
+            builder.build(entries, stats, on_chunk)
+    except KeyboardInterrupt:
+        print("Interrupted; run again with the same arguments to resume", file=sys.stderr)
+        sys.exit(130)
+
+    if staging_dir and os.path.isdir(staging_dir):
+        shutil.rmtree(staging_dir, ignore_errors=True)
+    report(stats, final=True)
+    print(json.dumps(stats.to_dict()), file=sys.stderr)
+    sys.exit(1 if stats.failed else 0)
+
+
+if __name__ == "__main__":
+    main()
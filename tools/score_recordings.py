@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+
+# Copyright 2026 The terCAD team. All rights reserved.
+# Use of this source code is governed by a CC BY-NC-ND 4.0 license that can be found in the LICENSE file.
+
+"""
+Batch pronunciation scoring.
+Scores every (reference, recording, text) entry of a manifest across worker
+processes and appends one JSON line per entry to the output file. Entries
+already present in the output are skipped, so an interrupted run continues
+where it stopped when started again with the same arguments. With
+--retry-failed, failed records are removed from the output before their
+entries are scored again, so each id keeps one result.
+
+Manifest: JSONL with {"id", "reference", "recording", "text"} objects, or CSV
+with the same header; id defaults to the entry number.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from infrastructure.audio.batch_scorer import BatchScorer, BatchStats, read_completed_ids, read_manifest  # noqa: E402
+from infrastructure.audio.comparison_executor import ComparisonExecutor  # noqa: E402
+from infrastructure.audio.librosa_audio_comparator import LibrosaAudioComparator  # noqa: E402
+
+
+def report(stats, final=False):
+    """Print progress and throughput to stderr"""
+    remaining = stats.total - stats.skipped - stats.processed
+    eta = remaining / stats.items_per_second if stats.items_per_second else 0.0
+    line = (
+        f"{stats.skipped + stats.processed}/{stats.total} "
+        f"(scored {stats.scored}, failed {stats.failed}, skipped {stats.skipped}) "
+        f"{stats.items_per_second:.1f} items/s"
+    )
+    if not final:
+        line += f", eta {eta:.0f}s"
+    print(line, file=sys.stderr, flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Score learner recordings against references')
+    parser.add_argument('manifest', help='JSONL or CSV manifest of reference/recording/text entries')
+    parser.add_argument('-o', '--output', required=True, help='JSONL results file (appended to)')
+    parser.add_argument('-j', '--workers', type=int, default=os.cpu_count() or 1)
+    parser.add_argument('--alignment', choices=LibrosaAudioComparator.ALIGNMENTS, default='full')
+    parser.add_argument('--cache-dir', default=str(Path.home() / '.cache' / 'tlum' / 'audio_features'),
+                        help='Reference feature cache shared between runs')
+    parser.add_argument('--restart', action='store_true', help='Discard existing results instead of resuming')
+    parser.add_argument('--retry-failed', action='store_true', help='Score entries that failed in an earlier run again')
+    parser.add_argument('--report-every', type=float, default=5.0, help='Seconds between progress lines')
+    args = parser.parse_args()
+
+    if args.restart and os.path.exists(args.output):
+        os.remove(args.output)
+    tasks = read_manifest(args.manifest)
+    completed = read_completed_ids(args.output, include_failed=not args.retry_failed)
+
+    executor = ComparisonExecutor(args.cache_dir, alignment=args.alignment, max_workers=args.workers)
+    scorer = BatchScorer(executor, max_pending=args.workers * 4)
+    stats = BatchStats()
+    last_report = [time.perf_counter()]
+
+    def on_result(record, current):
+        if time.perf_counter() - last_report[0] >= args.report_every:
+            last_report[0] = time.perf_counter()
+            report(current)
+
+    try:
+        with open(args.output, 'a', encoding='utf-8') as out:
+            for record in scorer.score(tasks, completed, stats, on_result):
+                out.write(json.dumps(record, ensure_ascii=False) + '\n')
+                out.flush()
+    except KeyboardInterrupt:
+        print("Interrupted; run again with the same arguments to resume", file=sys.stderr)
+        sys.exit(130)
+    finally:
+        executor.shutdown()
+
+    report(stats, final=True)
+    print(json.dumps(stats.to_dict()), file=sys.stderr)
+    sys.exit(1 if stats.failed else 0)
+
+
+if __name__ == "__main__":
+    main()